@@ -4,8 +4,8 @@ cascade.py
 Orchestrates the non-thermal cascade using the already-defined modules:
 
 - state.py      : NetworkState / CascadeState / ProjectileSpectrum
-- stopping.py   : stopping_power_bin_average
-- survival.py   : build_survival_and_yield
+- stopping.py   : stopping_power_bin_average / StoppingPowerCache
+- survival.py   : build_survival_matrices / compute_contracted_yield
 - reactions.py  : ReactionLibrary / ReactionChannel helpers
 
 This file does NOT reimplement stopping power, survival fractions, or
@@ -31,22 +31,32 @@ Current design notes
 4. Heavy / thermalized products are added directly to the cloud abundance RHS.
    Non-thermal descendants are injected into cascade spectra.
 
-5. This module computes one cascade bookkeeping pass and stores the results in
+5. Because every output of a pass is linear in the injected spectra,
+   `CascadeResponse` can precompute per-projectile linear maps at a reference
+   composition and reuse them until the cloud drifts.
+
+6. This module computes one cascade bookkeeping pass and stores the results in
    `state.cascade.rhs_cache`. A helper is provided to apply one explicit Euler
    abundance update if desired, but timestep selection remains in timestep.py.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Any
 
 import numpy as np
 
-from state import NetworkState, ProjectileSpectrum
-from stopping import stopping_power_bin_average
-from survival import build_survival_and_yield
-from reactions import ReactionLibrary, canonical_species_name
+from state import CascadeState, NetworkState, ProjectileSpectrum
+from stopping import StoppingPowerCache, stopping_power_bin_average
+from survival import (
+    build_survival_matrices,
+    build_survival_matrices_batch,
+    compute_contracted_yield,
+    compute_contracted_yield_batch,
+)
+from reactions import ProductRouting, ReactionLibrary
 
 
 Array = np.ndarray
@@ -90,19 +100,17 @@ def _cloud_mass_fraction_arrays(state: NetworkState) -> Tuple[np.ndarray, np.nda
     return A_cl, Z_cl, X_cl
 
 
-def _cloud_target_number_densities(state: NetworkState) -> Dict[str, float]:
+def _cloud_target_number_densities(state: NetworkState) -> np.ndarray:
     """
-    Construct target number densities from the current cloud state.
+    Construct target number densities from the current cloud state, aligned
+    with state.cloud.species.
 
     Current convention:
         n_target_i = density_cm3 * Y_i
 
     This is the only place that assumption lives.
     """
-    return {
-        sp: float(state.cloud.density_cm3 * y)
-        for sp, y in zip(state.cloud.species, state.cloud.Y)
-    }
+    return float(state.cloud.density_cm3) * np.asarray(state.cloud.Y, dtype=float)
 
 
 def _electron_number_density(state: NetworkState) -> float:
@@ -123,225 +131,257 @@ def _electron_number_density(state: NetworkState) -> float:
     return float(state.cloud.density_cm3 * state.cloud.ionization_fraction * total)
 
 
-def _ensure_cloud_species_index(state: NetworkState, species: str) -> Optional[int]:
-    """
-    Return the cloud-species index if the species is tracked in CloudState.
-    Otherwise return None.
-    """
-    try:
-        return state.cloud.species_index(species)
-    except KeyError:
-        return None
-
-
-def _all_product_species_for_reactions(reactions_for_projectile) -> List[str]:
+def _reaction_target_density_vector(
+    target_idx: np.ndarray,
+    cloud_target_number_densities: np.ndarray,
+) -> np.ndarray:
     """
-    Stable union of all product species appearing in the provided reactions.
+    Return target densities aligned with the reaction ordering; target_idx
+    holds each reaction's cloud index (-1 for untracked targets).
     """
-    seen = set()
-    ordered: List[str] = []
-
-    for rxn in reactions_for_projectile:
-        for prod in rxn.products_as_objects():
-            s = canonical_species_name(prod.species)
-            if s not in seen:
-                seen.add(s)
-                ordered.append(s)
-
-    return ordered
+    return np.where(target_idx >= 0, cloud_target_number_densities[target_idx], 0.0)
 
 
-def _build_tau_tensor(
-    reactions_for_projectile,
+def _accumulate_products(
+    routing: ProductRouting,
     product_species_order: Sequence[str],
-    energy_edges_mev: np.ndarray,
-) -> np.ndarray:
+    rxn_events: np.ndarray,
+    product_spectra: np.ndarray,
+    injected_spectra: Dict[str, np.ndarray],
+    dYdt_cloud: np.ndarray,
+    dt_s: float,
+) -> None:
     """
-    Build the tau tensor expected by survival.build_survival_and_yield():
+    Accumulate product source terms from a contracted yield.
 
-        tau.shape = (n_rxn, n_proj_bins, n_products, n_prod_bins)
+    Parameters
+    ----------
+    routing
+        ReactionLibrary.product_routing() table for this projectile and cloud.
+    rxn_events : array, shape (n_rxn,)
+        Expected reaction events per channel, already weighted by the
+        injected projectile amounts.
+    product_spectra : array, shape (n_rxn, n_products, n_prod_bins)
+        Product-energy spectra per channel (multiplicities included), with
+        the same weighting.
 
-    Each reaction channel provides a product_distribution_model. The returned
-    distribution is multiplied by the product multiplicity, so tau carries the
-    expected number of particles of each product species per reaction event.
+    Non-thermal descendants are injected into spectra.
+    Thermal / heavy descendants are added directly to the cloud abundance RHS.
     """
-    n_rxn = len(reactions_for_projectile)
-    n_proj_bins = len(energy_edges_mev) - 1
-    n_products = len(product_species_order)
-    n_prod_bins = n_proj_bins
+    if dt_s <= 0.0:
+        return
+    n_prod_bins = product_spectra.shape[-1]
+    produced = product_spectra.sum(axis=-1)           # (n_rxn, n_products)
 
-    tau = np.zeros((n_rxn, n_proj_bins, n_products, n_prod_bins), dtype=float)
-    proj_bin_centers = 0.5 * (energy_edges_mev[:-1] + energy_edges_mev[1:])
+    # Target destruction: one target nucleus is consumed per reaction event.
+    has_target = routing.target_idx >= 0
+    np.add.at(dYdt_cloud, routing.target_idx[has_target], -rxn_events[has_target] / dt_s)
 
-    prod_index = {s: i for i, s in enumerate(product_species_order)}
+    # Thermalized products go straight into the cloud abundances.
+    thermal = (routing.thermal_idx >= 0) & (produced > 0.0)
+    np.add.at(dYdt_cloud, routing.thermal_idx[thermal], produced[thermal] / dt_s)
 
-    for i_rxn, rxn in enumerate(reactions_for_projectile):
-        if rxn.product_distribution_model is None:
-            raise NotImplementedError(
-                f"Reaction '{rxn.name()}' does not have a product_distribution_model."
-            )
+    # Non-thermal products are injected into the cascade spectra.
+    injected = routing.nonthermal & (produced > 0.0)
+    for p_idx in np.flatnonzero(injected.any(axis=0)):
+        p_species = product_species_order[p_idx]
+        injected_spectra.setdefault(p_species, np.zeros(n_prod_bins, dtype=float))
+        injected_spectra[p_species] += product_spectra[injected[:, p_idx], p_idx, :].sum(axis=0)
 
-        for k, eproj in enumerate(proj_bin_centers):
-            for prod in rxn.products_as_objects():
-                p_species = canonical_species_name(prod.species)
-                p_idx = prod_index[p_species]
 
-                try:
-                    dist = rxn.product_distribution_model.distribution(
-                        projectile_energy_mev=float(eproj),
-                        product_species=p_species,
-                        product_energy_edges_mev=energy_edges_mev,
-                    )
-                except NotImplementedError as exc:
-                    raise NotImplementedError(
-                        f"Reaction '{rxn.name()}' still uses an unimplemented "
-                        f"product-energy distribution for product '{p_species}'."
-                    ) from exc
+def _projectile_survival_reinjection(
+    spectrum_values: np.ndarray,
+    survival_matrix: np.ndarray,
+    destination: np.ndarray,
+) -> None:
+    """
+    Reinject surviving projectiles into lower bins.
 
-                dist = np.asarray(dist, dtype=float)
-                if dist.shape != (n_prod_bins,):
-                    raise ValueError(
-                        f"Distribution for reaction '{rxn.name()}', product '{p_species}' "
-                        f"has shape {dist.shape}; expected {(n_prod_bins,)}."
-                    )
+    For an amount N_n injected into bin n, cumulative survival S[n, k] gives
+    the fraction surviving down to bin k. We distribute surviving particles
+    across bins 1 through n, for all injection bins in one matrix product.
 
-                tau[i_rxn, k, p_idx, :] += float(prod.multiplicity) * dist
+    Bin 0 is NOT populated: particles that thermalize (reach below-grid energies)
+    are handled separately via s_thermalized in the calling cascade loop.
+    """
+    N = np.asarray(spectrum_values, dtype=float)
+    if not np.any(N > 0.0):
+        return
 
-    return tau
+    # Bins 1..n-1: fraction stopped in each bin
+    into_bin = np.zeros_like(survival_matrix)
+    into_bin[:, 1:] = np.maximum(survival_matrix[:, 1:] - survival_matrix[:, :-1], 0.0)
+    # Bin 0 is left at 0: thermalizing particles are added to cloud by the
+    # caller using s_thermalized (from build_survival_matrices).
 
+    destination += np.maximum(N, 0.0) @ into_bin
 
-def _reaction_target_density_vector(
-    reactions_for_projectile,
-    cloud_target_number_densities: Mapping[str, float],
-) -> np.ndarray:
+
+def _projectile_operators(
+    state: NetworkState,
+    reaction_library: ReactionLibrary,
+    projectile: str,
+    energy_edges_mev: np.ndarray,
+    A_cl: np.ndarray,
+    X_cl: np.ndarray,
+    n_e: float,
+    target_number_densities: np.ndarray,
+    stopping_cache: Optional[StoppingPowerCache] = None,
+) -> Dict[str, Any]:
     """
-    Return target densities aligned with the reaction ordering.
+    Gather the per-projectile inputs of one cascade pass.
+
+    Returns a dict with sigma_bin, target_densities, epsilon_bin,
+    product_species_order, tau (a BandedTau), routing
+    (ReactionLibrary.product_routing())
+    and the survival matrices (surv) from build_survival_matrices().
+    Everything is aligned with reaction_library.by_projectile(projectile).
     """
-    return np.asarray(
-        [float(cloud_target_number_densities.get(rxn.target, 0.0)) for rxn in reactions_for_projectile],
-        dtype=float,
+    A_proj, Z_proj = _require_species_data(state, projectile)
+    routing = reaction_library.product_routing(projectile, state.cloud.species)
+
+    # Cloud-independent; the cm² conversion lives in ReactionLibrary so that
+    # Lambda = N * sigma has units of cm^{-1} in survival.py.
+    sigma_bin = reaction_library.sigma_matrix_cm2(
+        projectile=projectile,
+        energy_edges_mev=energy_edges_mev,
     )
+    target_dens_vec = _reaction_target_density_vector(routing.target_idx, target_number_densities)
 
+    epsilon_fn = (
+        stopping_cache.bin_average if stopping_cache is not None
+        else stopping_power_bin_average
+    )
+    epsilon_bin = epsilon_fn(
+        A_cl=A_cl,
+        X_cl=X_cl,
+        X_ion=float(state.cloud.ionization_fraction),
+        Z_proj=Z_proj,
+        E_edges=energy_edges_mev,
+        A_proj=A_proj,
+        n_e=n_e,
+        T_e=float(state.cloud.temperature_K),
+    )
 
-_MB_TO_CM2 = 1.0e-27  # 1 millibarns = 1e-27 cm^2
+    # Cloud-independent; built once per (projectile, grid) and reused.
+    product_species_order, tau = reaction_library.product_tau(
+        projectile=projectile,
+        energy_edges_mev=energy_edges_mev,
+    )
 
+    # Survival and destruction fractions for every injection bin at once.
+    surv = build_survival_matrices(
+        epsilon_bin=epsilon_bin,
+        sigma_bin=sigma_bin,
+        target_densities=target_dens_vec,
+        E_edges=energy_edges_mev,
+    )
 
-def _reaction_sigma_matrix(
-    reactions_for_projectile,
-    energy_edges_mev: np.ndarray,
-) -> np.ndarray:
-    """
-    Return sigma_bin with shape (n_rxn, n_bins) in cm², aligned with reaction ordering.
+    return {
+        "sigma_bin": sigma_bin,
+        "target_densities": target_dens_vec,
+        "epsilon_bin": epsilon_bin,
+        "product_species_order": product_species_order,
+        "tau": tau,
+        "routing": routing,
+        "surv": surv,
+    }
 
-    Cross sections are fetched in mb from each ReactionChannel and converted to cm²
-    here because survival.py expects sigma in cm² so that Lambda = N * sigma has
-    units of cm^{-1} and the exponent Lambda * dE / epsilon is dimensionless.
-    """
-    if not reactions_for_projectile:
-        return np.zeros((0, len(energy_edges_mev) - 1), dtype=float)
 
-    rows = [np.asarray(rxn.sigma_bin_average_mb(energy_edges_mev), dtype=float) * _MB_TO_CM2
-            for rxn in reactions_for_projectile]
-    return np.vstack(rows)
+def _projectile_diagnostics(reactions_for_projectile, ops: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "n_reactions": len(reactions_for_projectile),
+        "reaction_names": [rxn.name() for rxn in reactions_for_projectile],
+        "product_species": list(ops["product_species_order"]),
+        "epsilon_bin": np.array(ops["epsilon_bin"], dtype=float),
+        "sigma_bin": np.array(ops["sigma_bin"], dtype=float),
+        "target_densities": np.array(ops["target_densities"], dtype=float),
+    }
 
 
-def _accumulate_products(
+def _projectile_contribution(
     state: NetworkState,
-    reactions_for_projectile,
-    product_species_order: Sequence[str],
-    yield_tensor: np.ndarray,
-    injected_amount: float,
-    injected_spectra: Dict[str, np.ndarray],
-    dYdt_cloud: np.ndarray,
+    reaction_library: ReactionLibrary,
+    projectile: str,
+    energy_edges_mev: np.ndarray,
+    medium: Tuple[np.ndarray, np.ndarray, float, np.ndarray],
     dt_s: float,
-) -> None:
+    stopping_cache: Optional[StoppingPowerCache] = None,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, Any]]:
     """
-    Accumulate product source terms from one injected projectile bin.
+    Cascade pass for a single projectile.
 
-    Non-thermal descendants are injected into spectra.
-    Thermal / heavy descendants are added directly to the cloud abundance RHS.
+    medium is (A_cl, X_cl, n_e, target_number_densities) for the current
+    cloud. Returns this projectile's (dYdt_cloud, injected_spectra,
+    diagnostics); compute_cascade_step() sums them over projectiles.
+    Nothing in `state` is modified.
     """
-    n_rxn, _, n_products, n_prod_bins = yield_tensor.shape
-
-    for i_rxn, rxn in enumerate(reactions_for_projectile):
-        # Target destruction contribution to cloud abundances.
-        # Total number of reaction events from this injected projectile is the
-        # integrated yield over all products/bins divided in practice by the
-        # channel multiplicity structure. The robust quantity available here is
-        # the per-reaction destruction probability:
-        #   sum_k beta_i(k) DeltaS(k)
-        #
-        # We reconstruct it from the yield tensor by summing and dividing by the
-        # total multiplicity carried by tau for species that appear in this rxn.
-        rxn_events = 0.0
-        for p_idx in range(n_products):
-            total_for_product = float(np.sum(yield_tensor[i_rxn, :, p_idx, :]))
-            if total_for_product > 0.0:
-                rxn_events = max(rxn_events, total_for_product)
-
-        rxn_events *= injected_amount
-
-        t_idx = _ensure_cloud_species_index(state, rxn.target)
-        if t_idx is not None and dt_s > 0.0:
-            dYdt_cloud[t_idx] -= rxn_events / dt_s
-
-        # Product creation contribution.
-        for p_idx, p_species in enumerate(product_species_order):
-            produced = injected_amount * np.sum(yield_tensor[i_rxn, :, p_idx, :])
-            if produced <= 0.0:
-                continue
-
-            prod_obj = None
-            for obj in rxn.products_as_objects():
-                if canonical_species_name(obj.species) == p_species:
-                    prod_obj = obj
-                    break
+    A_cl, X_cl, n_e, target_number_densities = medium
+    n_bins = len(energy_edges_mev) - 1
+    spectrum = state.cascade.get_spectrum(projectile)
 
-            if prod_obj is None:
-                continue
+    if spectrum.n_bins != n_bins:
+        raise ValueError(
+            f"Spectrum for projectile '{projectile}' has {spectrum.n_bins} bins, "
+            f"but energy_edges_mev defines {n_bins} bins."
+        )
 
-            if prod_obj.can_continue_nonthermal:
-                injected_spectra.setdefault(p_species, np.zeros(n_prod_bins, dtype=float))
-                injected_spectra[p_species] += injected_amount * np.sum(
-                    yield_tensor[i_rxn, :, p_idx, :],
-                    axis=0,
-                )
-            else:
-                c_idx = _ensure_cloud_species_index(state, p_species)
-                if c_idx is not None and dt_s > 0.0:
-                    dYdt_cloud[c_idx] += produced / dt_s
+    dYdt_cloud = np.zeros_like(state.cloud.Y, dtype=float)
+    injected_spectra: Dict[str, np.ndarray] = {}
 
+    reactions_for_projectile = reaction_library.by_projectile(projectile)
+    if not reactions_for_projectile:
+        # No reactions: just carry the spectrum forward unchanged.
+        injected_spectra[projectile] = np.array(spectrum.values, dtype=float)
+        return dYdt_cloud, injected_spectra, {"n_reactions": 0, "status": "no_reactions"}
 
-def _projectile_survival_reinjection(
-    spectrum_values: np.ndarray,
-    survival_table: np.ndarray,
-    initial_bin: int,
-    destination: np.ndarray,
-) -> None:
-    """
-    Reinject surviving projectiles into lower bins.
+    ops = _projectile_operators(
+        state=state,
+        reaction_library=reaction_library,
+        projectile=projectile,
+        energy_edges_mev=energy_edges_mev,
+        A_cl=A_cl,
+        X_cl=X_cl,
+        n_e=n_e,
+        target_number_densities=target_number_densities,
+        stopping_cache=stopping_cache,
+    )
+    surv = ops["surv"]
+
+    # Surviving projectile bookkeeping
+    projectile_out = np.zeros(n_bins, dtype=float)
+    _projectile_survival_reinjection(
+        spectrum_values=spectrum.values,
+        survival_matrix=surv["S"],
+        destination=projectile_out,
+    )
 
-    For an amount N injected into bin n, cumulative survival S[k] gives the
-    fraction surviving down to bin k. We distribute surviving particles across
-    bins 1 through initial_bin.
+    # Product bookkeeping. The yield is linear in DeltaS, so weighting
+    # the destruction fractions by the injected amounts first lets one
+    # contraction cover the whole spectrum.
+    amounts = np.maximum(np.asarray(spectrum.values, dtype=float), 0.0)
+    deltaS_weighted = amounts @ surv["deltaS"]
 
-    Bin 0 is NOT populated: particles that thermalize (reach below-grid energies)
-    are handled separately via s_thermalized in the calling cascade loop.
-    """
-    N0 = float(spectrum_values[initial_bin])
-    if N0 <= 0.0:
-        return
+    rxn_events, product_spectra = compute_contracted_yield(
+        tau=ops["tau"],
+        beta_rxn_bin=surv["beta"],
+        deltaS_bin=deltaS_weighted,
+    )
 
-    n_bins = len(survival_table)
-    into_bin = np.zeros(n_bins, dtype=float)
+    _accumulate_products(
+        routing=ops["routing"],
+        product_species_order=ops["product_species_order"],
+        rxn_events=rxn_events,
+        product_spectra=product_spectra,
+        injected_spectra=injected_spectra,
+        dYdt_cloud=dYdt_cloud,
+        dt_s=float(dt_s),
+    )
 
-    # Bins 1..n-1: fraction stopped in each bin
-    for k in range(1, n_bins):
-        into_bin[k] = max(survival_table[k] - survival_table[k - 1], 0.0)
-    # Bin 0 is left at 0: thermalizing particles are added to cloud by the
-    # caller using s_thermalized (from build_survival_and_yield).
+    injected_spectra.setdefault(projectile, np.zeros(n_bins, dtype=float))
+    injected_spectra[projectile] += projectile_out
 
-    destination += N0 * into_bin
+    return dYdt_cloud, injected_spectra, _projectile_diagnostics(reactions_for_projectile, ops)
 
 
 def compute_cascade_step(
@@ -349,6 +389,8 @@ def compute_cascade_step(
     reaction_library: ReactionLibrary,
     energy_edges_mev: np.ndarray,
     dt_s: Optional[float] = None,
+    stopping_cache: Optional[StoppingPowerCache] = None,
+    executor: Optional["CascadeExecutor"] = None,
 ) -> CascadeStepResult:
     """
     Compute one cascade bookkeeping pass.
@@ -364,6 +406,13 @@ def compute_cascade_step(
     dt_s
         Timestep used only to convert event counts into cloud-abundance rates.
         If omitted, state.solver.dt_s is used.
+    stopping_cache
+        Optional StoppingPowerCache reused across steps. If omitted, the
+        bin-averaged stopping power is recomputed for every projectile.
+    executor
+        Optional CascadeExecutor evaluating the projectiles concurrently.
+        Contributions are always summed in projectile order, so the result
+        does not depend on the executor or on completion order.
 
     Returns
     -------
@@ -392,110 +441,615 @@ def compute_cascade_step(
 
     # Cloud composition / medium inputs
     A_cl, Z_cl, X_cl = _cloud_mass_fraction_arrays(state)
-    n_e = _electron_number_density(state)
-    target_number_densities = _cloud_target_number_densities(state)
+    medium = (
+        A_cl,
+        X_cl,
+        _electron_number_density(state),
+        _cloud_target_number_densities(state),
+    )
 
+    projectiles = state.cascade.projectile_species()
+    if executor is not None:
+        contributions = executor.map_projectiles(
+            state, reaction_library, projectiles, energy_edges_mev, medium, float(dt_s),
+            stopping_cache,
+        )
+    else:
+        contributions = [
+            _projectile_contribution(
+                state, reaction_library, projectile, energy_edges_mev, medium, float(dt_s),
+                stopping_cache,
+            )
+            for projectile in projectiles
+        ]
+
+    # Deterministic reduction in projectile order
     dYdt_cloud = np.zeros_like(state.cloud.Y, dtype=float)
     injected_spectra: Dict[str, np.ndarray] = {}
     diag: Dict[str, Any] = {
         "projectiles": {},
     }
+    for projectile, (dYdt_p, injected_p, diag_p) in zip(projectiles, contributions):
+        dYdt_cloud += dYdt_p
+        for species, values in injected_p.items():
+            injected_spectra.setdefault(species, np.zeros(n_bins, dtype=float))
+            injected_spectra[species] += values
+        diag["projectiles"][projectile] = diag_p
+
+    return CascadeStepResult(
+        dYdt_cloud=dYdt_cloud,
+        injected_spectra=injected_spectra,
+        diagnostics=diag,
+    )
 
-    for projectile in state.cascade.projectile_species():
-        spectrum = state.cascade.get_spectrum(projectile)
 
-        if spectrum.n_bins != n_bins:
+# ---------------------------------------------------------------------
+# Concurrent projectile evaluation
+# ---------------------------------------------------------------------
+
+# Per-process state installed by CascadeExecutor's process-pool initializer.
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_process_worker(
+    reaction_library: ReactionLibrary,
+    stopping_settings: Optional[Tuple[float, int, str]],
+) -> None:
+    _WORKER["reaction_library"] = reaction_library
+    _WORKER["stopping_cache"] = (
+        StoppingPowerCache(*stopping_settings) if stopping_settings is not None else None
+    )
+
+
+def _process_projectile_task(
+    state: NetworkState,
+    projectile: str,
+    energy_edges_mev: np.ndarray,
+    medium,
+    dt_s: float,
+):
+    return _projectile_contribution(
+        state, _WORKER["reaction_library"], projectile, energy_edges_mev, medium, dt_s,
+        _WORKER["stopping_cache"],
+    )
+
+
+class CascadeExecutor:
+    """
+    Evaluate the per-projectile cascade passes concurrently.
+
+    Each projectile has its own sigma matrix, stopping power, tau tensor and
+    survival matrices; only the final sums are shared. compute_cascade_step()
+    hands the projectiles to this executor and reduces the returned
+    contributions in projectile order, so results are identical to the
+    serial loop whatever the completion order.
+
+    Parameters
+    ----------
+    kind
+        "serial", "thread" or "process".
+        - "thread" shares the reaction library's grid caches and the
+          caller's StoppingPowerCache; the numpy kernels release the GIL.
+        - "process" ships the reaction library to each worker once (pool
+          initializer); workers keep their own grid caches and, if a
+          stopping cache is passed, their own StoppingPowerCache with the
+          same settings. Only a slim copy of the state travels per task.
+    max_workers
+        Pool size (default: the executor's own default).
+    reaction_library
+        Required for kind="process".
+    stopping_cache
+        Template for the per-worker stopping caches of kind="process".
+
+    Use as a context manager or call close() to shut the pool down.
+    """
+
+    KINDS = ("serial", "thread", "process")
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: Optional[int] = None,
+        reaction_library: Optional[ReactionLibrary] = None,
+        stopping_cache: Optional[StoppingPowerCache] = None,
+    ) -> None:
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown executor kind '{kind}'; expected one of {self.KINDS}.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self._reaction_library = reaction_library
+        self._pool: Optional[Executor] = None
+
+        if kind == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        elif kind == "process":
+            if reaction_library is None:
+                raise ValueError("kind='process' requires the reaction_library.")
+            stopping_settings = (
+                (stopping_cache.rtol, stopping_cache.n_sub, stopping_cache.mode)
+                if stopping_cache is not None else None
+            )
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_process_worker,
+                initargs=(reaction_library, stopping_settings),
+            )
+
+    def __enter__(self) -> "CascadeExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def map_projectiles(
+        self,
+        state: NetworkState,
+        reaction_library: ReactionLibrary,
+        projectiles: Sequence[str],
+        energy_edges_mev: np.ndarray,
+        medium,
+        dt_s: float,
+        stopping_cache: Optional[StoppingPowerCache] = None,
+    ) -> List[Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, Any]]]:
+        """
+        Per-projectile contributions, returned in the order of `projectiles`.
+        """
+        if self.kind == "serial":
+            return [
+                _projectile_contribution(
+                    state, reaction_library, projectile, energy_edges_mev, medium, dt_s,
+                    stopping_cache,
+                )
+                for projectile in projectiles
+            ]
+
+        if self._pool is None:
+            raise RuntimeError("CascadeExecutor has been closed.")
+
+        if self.kind == "thread":
+            futures = [
+                self._pool.submit(
+                    _projectile_contribution,
+                    state, reaction_library, projectile, energy_edges_mev, medium, dt_s,
+                    stopping_cache,
+                )
+                for projectile in projectiles
+            ]
+        else:
+            if reaction_library is not self._reaction_library:
+                raise ValueError(
+                    "kind='process' workers hold the reaction library given at construction."
+                )
+            futures = [
+                self._pool.submit(
+                    _process_projectile_task,
+                    _slim_state(state, projectile), projectile, energy_edges_mev, medium, dt_s,
+                )
+                for projectile in projectiles
+            ]
+        return [f.result() for f in futures]
+
+
+def _slim_state(state: NetworkState, projectile: str) -> NetworkState:
+    """
+    The parts of `state` a single projectile pass reads (no rhs_cache).
+    """
+    return NetworkState(
+        cloud=state.cloud,
+        cascade=CascadeState(spectra={projectile: state.cascade.get_spectrum(projectile)}),
+        solver=state.solver,
+        species_data=state.species_data,
+    )
+
+
+class CascadeResponse:
+    """
+    Linear response of one cascade pass to the injected projectile spectra.
+
+    For a fixed cloud composition every quantity produced by
+    compute_cascade_step() is linear in the (non-negative) projectile
+    amounts N_P:
+
+        dYdt_cloud        = sum_P (N_P @ G_P) / dt
+        injected_spectra  = sum_P  N_P @ H_P[s]      (per injected species s)
+
+    with G_P = DeltaS_P @ A_P (n_bins x n_cloud) collecting target destruction
+    and thermalized products, and H_P[s] = DeltaS_P @ B_P[s] (n_bins x n_bins)
+    collecting non-thermal products plus the surviving projectiles. The maps
+    are built from the same operators as compute_cascade_step() at a
+    reference composition and rebuilt only when the cloud drifts:
+
+        |Y_i - Y_ref,i| > rtol |Y_ref,i| + atol   for any species, or
+        a relative change > rtol in density, temperature or ionization,
+        or a change in the cloud species list.
+
+    With a steady injection spectrum (as in run_famiano.py) most steps then
+    cost a few small matrix-vector products.
+
+    Attributes
+    ----------
+    n_refresh, n_reuse : int
+        Number of evaluations that rebuilt / reused the maps.
+    """
+
+    def __init__(
+        self,
+        reaction_library: ReactionLibrary,
+        energy_edges_mev: np.ndarray,
+        rtol: float = 1.0e-3,
+        atol: float = 1.0e-30,
+        stopping_cache: Optional[StoppingPowerCache] = None,
+    ) -> None:
+        if rtol < 0.0 or atol < 0.0:
+            raise ValueError("rtol and atol must be non-negative.")
+        self.reaction_library = reaction_library
+        self.energy_edges_mev = np.asarray(energy_edges_mev, dtype=float)
+        self.rtol = float(rtol)
+        self.atol = float(atol)
+        self.stopping_cache = stopping_cache
+        self.n_refresh = 0
+        self.n_reuse = 0
+        self._reference: Optional[Dict[str, Any]] = None
+        self._maps: Dict[str, Dict[str, Any]] = {}
+        self._diagnostics: Dict[str, Any] = {}
+
+    def invalidate(self) -> None:
+        """
+        Force a rebuild on the next evaluation.
+        """
+        self._reference = None
+
+    def _needs_refresh(self, state: NetworkState) -> bool:
+        ref = self._reference
+        if ref is None:
+            return True
+        if tuple(state.cloud.species) != ref["species"]:
+            return True
+        if set(state.cascade.projectile_species()) != ref["projectiles"]:
+            return True
+
+        Y = np.asarray(state.cloud.Y, dtype=float)
+        if np.any(np.abs(Y - ref["Y"]) > self.rtol * np.abs(ref["Y"]) + self.atol):
+            return True
+
+        for name in ("density_cm3", "temperature_K", "ionization_fraction"):
+            value = float(getattr(state.cloud, name))
+            if abs(value - ref[name]) > self.rtol * abs(ref[name]):
+                return True
+        return False
+
+    def _build(self, state: NetworkState) -> None:
+        edges = self.energy_edges_mev
+        n_bins = len(edges) - 1
+        n_cloud = len(state.cloud.species)
+
+        A_cl, Z_cl, X_cl = _cloud_mass_fraction_arrays(state)
+        n_e = _electron_number_density(state)
+        target_number_densities = _cloud_target_number_densities(state)
+
+        self._maps = {}
+        self._diagnostics = {}
+        for projectile in state.cascade.projectile_species():
+            reactions_for_projectile = self.reaction_library.by_projectile(projectile)
+            if not reactions_for_projectile:
+                self._maps[projectile] = {"G": None, "H": {}}
+                self._diagnostics[projectile] = {"n_reactions": 0, "status": "no_reactions"}
+                continue
+
+            ops = _projectile_operators(
+                state=state,
+                reaction_library=self.reaction_library,
+                projectile=projectile,
+                energy_edges_mev=edges,
+                A_cl=A_cl,
+                X_cl=X_cl,
+                n_e=n_e,
+                target_number_densities=target_number_densities,
+                stopping_cache=self.stopping_cache,
+            )
+            surv = ops["surv"]
+            beta = surv["beta"]                       # (n_rxn, n_bins)
+            tau = ops["tau"]                          # BandedTau (n_rxn, n_bins, n_products, n_bins)
+            order = ops["product_species_order"]
+            routing = ops["routing"]
+            target_idx, thermal_idx, nonthermal = routing.target_idx, routing.thermal_idx, routing.nonthermal
+
+            # A[k, c]: cloud change per reaction event at projectile bin k.
+            A = np.zeros((n_bins, n_cloud), dtype=float)
+            has_target = target_idx >= 0
+            np.add.at(A.T, target_idx[has_target], -beta[has_target])
+            i_th, p_th = np.nonzero(thermal_idx >= 0)
+            if i_th.size:
+                produced = beta[i_th] * tau.totals[i_th, :, p_th]
+                np.add.at(A.T, thermal_idx[i_th, p_th], produced)
+
+            H: Dict[str, np.ndarray] = {}
+            for p_idx, p_species in enumerate(order):
+                rows = np.flatnonzero(nonthermal[:, p_idx])
+                if rows.size == 0:
+                    continue
+                # B[k, q] = sum_i beta[i, k] tau[i, k, p, q] over the nonthermal rows
+                B = tau.project(p_idx, beta * nonthermal[:, p_idx, None])
+                H[p_species] = surv["deltaS"] @ B
+
+            into_bin = np.zeros_like(surv["S"])
+            into_bin[:, 1:] = np.maximum(surv["S"][:, 1:] - surv["S"][:, :-1], 0.0)
+            H[projectile] = H[projectile] + into_bin if projectile in H else into_bin
+
+            self._maps[projectile] = {"G": surv["deltaS"] @ A, "H": H}
+            self._diagnostics[projectile] = _projectile_diagnostics(reactions_for_projectile, ops)
+
+        self._reference = {
+            "species": tuple(state.cloud.species),
+            "projectiles": set(state.cascade.projectile_species()),
+            "Y": np.array(state.cloud.Y, dtype=float),
+            "density_cm3": float(state.cloud.density_cm3),
+            "temperature_K": float(state.cloud.temperature_K),
+            "ionization_fraction": float(state.cloud.ionization_fraction),
+        }
+
+    def evaluate(self, state: NetworkState, dt_s: Optional[float] = None) -> CascadeStepResult:
+        """
+        Cascade pass through the precomputed maps; same result layout as
+        compute_cascade_step().
+        """
+        state.validate()
+
+        if dt_s is None:
+            dt_s = state.solver.dt_s
+
+        if dt_s is None or dt_s <= 0.0:
+            raise ValueError("CascadeResponse.evaluate requires a positive dt_s.")
+
+        n_bins = len(self.energy_edges_mev) - 1
+        refreshed = self._needs_refresh(state)
+        if refreshed:
+            self._build(state)
+            self.n_refresh += 1
+        else:
+            self.n_reuse += 1
+
+        dYdt_cloud = np.zeros_like(state.cloud.Y, dtype=float)
+        injected_spectra: Dict[str, np.ndarray] = {}
+
+        for projectile in state.cascade.projectile_species():
+            spectrum = state.cascade.get_spectrum(projectile)
+            if spectrum.n_bins != n_bins:
+                raise ValueError(
+                    f"Spectrum for projectile '{projectile}' has {spectrum.n_bins} bins, "
+                    f"but energy_edges_mev defines {n_bins} bins."
+                )
+
+            maps = self._maps[projectile]
+            if maps["G"] is None:
+                injected_spectra.setdefault(projectile, np.zeros(n_bins, dtype=float))
+                injected_spectra[projectile] += spectrum.values
+                continue
+
+            amounts = np.maximum(np.asarray(spectrum.values, dtype=float), 0.0)
+            dYdt_cloud += (amounts @ maps["G"]) / float(dt_s)
+            for species, H in maps["H"].items():
+                injected_spectra.setdefault(species, np.zeros(n_bins, dtype=float))
+                injected_spectra[species] += amounts @ H
+
+        diag: Dict[str, Any] = {
+            "projectiles": self._diagnostics,
+            "response": {
+                "refreshed": refreshed,
+                "n_refresh": self.n_refresh,
+                "n_reuse": self.n_reuse,
+            },
+        }
+        return CascadeStepResult(
+            dYdt_cloud=dYdt_cloud,
+            injected_spectra=injected_spectra,
+            diagnostics=diag,
+        )
+
+
+# ---------------------------------------------------------------------
+# Batched evaluation over several clouds
+# ---------------------------------------------------------------------
+
+@dataclass
+class BatchCascadeStepResult:
+    """
+    Bookkeeping of one cascade pass over a batch of clouds; every array
+    carries a leading n_batch axis.
+    """
+    dYdt_cloud: np.ndarray                    # (n_batch, n_cloud)
+    injected_spectra: Dict[str, np.ndarray]   # species -> (n_batch, n_bins)
+    diagnostics: Dict[str, Any]
+
+    def member(self, index: int) -> CascadeStepResult:
+        """
+        The CascadeStepResult of one batch member (arrays are views).
+        """
+        return CascadeStepResult(
+            dYdt_cloud=self.dYdt_cloud[index],
+            injected_spectra={sp: v[index] for sp, v in self.injected_spectra.items()},
+            diagnostics={"batch_index": index, **self.diagnostics},
+        )
+
+
+def compute_cascade_step_batch(
+    states: Sequence[NetworkState],
+    reaction_library: ReactionLibrary,
+    energy_edges_mev: np.ndarray,
+    dt_s=None,
+    stopping_cache: Optional[StoppingPowerCache] = None,
+) -> BatchCascadeStepResult:
+    """
+    compute_cascade_step() for several clouds in one array computation.
+
+    The clouds may differ in density, temperature, ionization, composition
+    and injected spectra, but must track the same cloud species and
+    projectiles in the same order. Cross-section matrices, tau tensors and
+    product routing are built once and shared; stopping powers, survival
+    matrices and yields carry a leading batch axis.
+
+    Parameters
+    ----------
+    states
+        Batch members.
+    dt_s
+        Scalar or one value per member; defaults to each state's
+        solver.dt_s.
+    stopping_cache
+        Optional StoppingPowerCache; each member is cached under its batch
+        index so members do not evict each other.
+
+    Returns
+    -------
+    BatchCascadeStepResult
+        Member b equals compute_cascade_step(states[b], ...) up to rounding.
+    """
+    if not states:
+        raise ValueError("compute_cascade_step_batch requires at least one state.")
+    for st in states:
+        st.validate()
+
+    ref = states[0]
+    n_batch = len(states)
+    species = list(ref.cloud.species)
+    projectiles = ref.cascade.projectile_species()
+    for b, st in enumerate(states[1:], start=1):
+        if list(st.cloud.species) != species:
+            raise ValueError(f"Batch member {b} tracks different cloud species than member 0.")
+        if st.cascade.projectile_species() != projectiles:
+            raise ValueError(f"Batch member {b} carries different projectiles than member 0.")
+
+    if dt_s is None:
+        dt_s = [st.solver.dt_s for st in states]
+    dt_arr = np.broadcast_to(np.asarray(dt_s, dtype=float), (n_batch,))
+    if not np.all(dt_arr > 0.0):
+        raise ValueError("compute_cascade_step_batch requires positive dt_s for every member.")
+
+    energy_edges_mev = np.asarray(energy_edges_mev, dtype=float)
+    n_bins = len(energy_edges_mev) - 1
+    if n_bins <= 0:
+        raise ValueError("energy_edges_mev must define at least one bin.")
+
+    # Per-member medium inputs
+    fractions = [_cloud_mass_fraction_arrays(st) for st in states]
+    n_e = [_electron_number_density(st) for st in states]
+    target_number_densities = [_cloud_target_number_densities(st) for st in states]
+
+    dYdt_cloud = np.zeros((n_batch, len(species)), dtype=float)
+    injected_spectra: Dict[str, np.ndarray] = {}
+    diag: Dict[str, Any] = {"projectiles": {}, "n_batch": n_batch}
+
+    for projectile in projectiles:
+        values = np.stack([
+            np.asarray(st.cascade.get_spectrum(projectile).values, dtype=float) for st in states
+        ])
+        if values.shape[1] != n_bins:
             raise ValueError(
-                f"Spectrum for projectile '{projectile}' has {spectrum.n_bins} bins, "
+                f"Spectrum for projectile '{projectile}' has {values.shape[1]} bins, "
                 f"but energy_edges_mev defines {n_bins} bins."
             )
 
-        A_proj, Z_proj = _require_species_data(state, projectile)
-
         reactions_for_projectile = reaction_library.by_projectile(projectile)
         if not reactions_for_projectile:
-            # No reactions: just carry the spectrum forward unchanged.
-            injected_spectra.setdefault(projectile, np.zeros(n_bins, dtype=float))
-            injected_spectra[projectile] += spectrum.values
-            diag["projectiles"][projectile] = {
-                "n_reactions": 0,
-                "status": "no_reactions",
-            }
+            injected_spectra.setdefault(projectile, np.zeros((n_batch, n_bins), dtype=float))
+            injected_spectra[projectile] += values
+            diag["projectiles"][projectile] = {"n_reactions": 0, "status": "no_reactions"}
             continue
 
-        sigma_bin = _reaction_sigma_matrix(reactions_for_projectile, energy_edges_mev)
-        target_dens_vec = _reaction_target_density_vector(
-            reactions_for_projectile,
-            target_number_densities,
-        )
+        A_proj, Z_proj = _require_species_data(ref, projectile)
 
-        epsilon_bin = stopping_power_bin_average(
-            A_cl=A_cl,
-            X_cl=X_cl,
-            X_ion=float(state.cloud.ionization_fraction),
-            Z_proj=Z_proj,
-            E_edges=energy_edges_mev,
-            A_proj=A_proj,
-            n_e=n_e,
-            T_e=float(state.cloud.temperature_K),
+        # Shared across the batch
+        sigma_bin = reaction_library.sigma_matrix_cm2(
+            projectile=projectile,
+            energy_edges_mev=energy_edges_mev,
         )
-
-        product_species_order = _all_product_species_for_reactions(reactions_for_projectile)
-        tau = _build_tau_tensor(
-            reactions_for_projectile=reactions_for_projectile,
-            product_species_order=product_species_order,
+        product_species_order, tau = reaction_library.product_tau(
+            projectile=projectile,
             energy_edges_mev=energy_edges_mev,
         )
+        routing = reaction_library.product_routing(projectile, ref.cloud.species)
+
+        # Per member
+        target_dens = np.stack([
+            _reaction_target_density_vector(routing.target_idx, tnd)
+            for tnd in target_number_densities
+        ])
+        epsilon_bin = np.empty((n_batch, n_bins), dtype=float)
+        for b, st in enumerate(states):
+            A_cl, Z_cl, X_cl = fractions[b]
+            kwargs = dict(
+                A_cl=A_cl,
+                X_cl=X_cl,
+                X_ion=float(st.cloud.ionization_fraction),
+                Z_proj=Z_proj,
+                E_edges=energy_edges_mev,
+                A_proj=A_proj,
+                n_e=n_e[b],
+                T_e=float(st.cloud.temperature_K),
+            )
+            epsilon_bin[b] = (
+                stopping_cache.bin_average(medium=b, **kwargs) if stopping_cache is not None
+                else stopping_power_bin_average(**kwargs)
+            )
 
-        projectile_out = np.zeros(n_bins, dtype=float)
+        surv = build_survival_matrices_batch(
+            epsilon_bin=epsilon_bin,
+            sigma_bin=sigma_bin,
+            target_densities=target_dens,
+            E_edges=energy_edges_mev,
+        )
 
-        for initial_bin in range(n_bins - 1, -1, -1):
-            amount = float(spectrum.values[initial_bin])
-            if amount <= 0.0:
-                continue
+        amounts = np.maximum(values, 0.0)
 
-            sy = build_survival_and_yield(
-                epsilon_bin=epsilon_bin,
-                sigma_bin=sigma_bin,
-                target_densities=target_dens_vec,
-                tau=tau,
-                E_edges=energy_edges_mev,
-                initial_bin=initial_bin,
-            )
+        # Surviving projectiles, as in _projectile_survival_reinjection()
+        into_bin = np.zeros_like(surv["S"])
+        into_bin[:, :, 1:] = np.maximum(surv["S"][:, :, 1:] - surv["S"][:, :, :-1], 0.0)
+        projectile_out = np.einsum("bn,bnk->bk", amounts, into_bin)
 
-            # Surviving projectile bookkeeping
-            _projectile_survival_reinjection(
-                spectrum_values=spectrum.values,
-                survival_table=np.asarray(sy["S"], dtype=float),
-                initial_bin=initial_bin,
-                destination=projectile_out,
-            )
+        deltaS_weighted = np.einsum("bn,bnk->bk", amounts, surv["deltaS"])
+        rxn_events, product_spectra = compute_contracted_yield_batch(
+            tau=tau,
+            beta_rxn_bin=surv["beta"],
+            deltaS_bin=deltaS_weighted,
+        )
 
-            # Product bookkeeping
+        # Product routing per member, into member b's row of each spectrum
+        for b in range(n_batch):
+            member_spectra: Dict[str, np.ndarray] = {}
             _accumulate_products(
-                state=state,
-                reactions_for_projectile=reactions_for_projectile,
+                routing=routing,
                 product_species_order=product_species_order,
-                yield_tensor=np.asarray(sy["yield"], dtype=float),
-                injected_amount=amount,
-                injected_spectra=injected_spectra,
-                dYdt_cloud=dYdt_cloud,
-                dt_s=float(dt_s),
+                rxn_events=rxn_events[b],
+                product_spectra=product_spectra[b],
+                injected_spectra=member_spectra,
+                dYdt_cloud=dYdt_cloud[b],
+                dt_s=float(dt_arr[b]),
             )
+            for p_species, vals in member_spectra.items():
+                injected_spectra.setdefault(p_species, np.zeros((n_batch, n_bins), dtype=float))
+                injected_spectra[p_species][b] += vals
 
-        injected_spectra.setdefault(projectile, np.zeros(n_bins, dtype=float))
+        injected_spectra.setdefault(projectile, np.zeros((n_batch, n_bins), dtype=float))
         injected_spectra[projectile] += projectile_out
 
         diag["projectiles"][projectile] = {
             "n_reactions": len(reactions_for_projectile),
             "reaction_names": [rxn.name() for rxn in reactions_for_projectile],
             "product_species": list(product_species_order),
-            "epsilon_bin": epsilon_bin.copy(),
-            "sigma_bin": sigma_bin.copy(),
-            "target_densities": target_dens_vec.copy(),
+            "epsilon_bin": epsilon_bin,
+            "sigma_bin": np.array(sigma_bin, dtype=float),
+            "target_densities": target_dens,
         }
 
-    return CascadeStepResult(
+    return BatchCascadeStepResult(
         dYdt_cloud=dYdt_cloud,
         injected_spectra=injected_spectra,
         diagnostics=diag,
@@ -577,20 +1131,28 @@ def run_cascade_step(
     dt_s: Optional[float] = None,
     update_cloud: bool = True,
     update_spectra: bool = True,
+    stopping_cache: Optional[StoppingPowerCache] = None,
+    response: Optional[CascadeResponse] = None,
+    executor: Optional[CascadeExecutor] = None,
 ) -> CascadeStepResult:
     """
     High-level convenience wrapper:
-    1. compute cascade bookkeeping
+    1. compute cascade bookkeeping (through `response` if one is given)
     2. store in rhs_cache
     3. optionally update cloud abundances
     4. optionally replace cascade spectra
     """
-    result = compute_cascade_step(
-        state=state,
-        reaction_library=reaction_library,
-        energy_edges_mev=energy_edges_mev,
-        dt_s=dt_s,
-    )
+    if response is not None:
+        result = response.evaluate(state, dt_s=dt_s)
+    else:
+        result = compute_cascade_step(
+            state=state,
+            reaction_library=reaction_library,
+            energy_edges_mev=energy_edges_mev,
+            dt_s=dt_s,
+            stopping_cache=stopping_cache,
+            executor=executor,
+        )
 
     store_cascade_step_in_state(state, result)
 
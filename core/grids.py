@@ -15,6 +15,7 @@ consistent way to define:
 - bin widths
 - indexing helpers
 - validation checks
+- conservative rebinning of binned quantities between grids
 
 This module does NOT evolve the system and does NOT compute reaction rates.
 It only constructs and manages the numerical grid on which those calculations
@@ -29,7 +30,11 @@ energy discretization.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+import hashlib
+import threading
+from typing import Union
 import numpy as np
 
 
@@ -255,4 +260,130 @@ def make_energy_grid(config: dict) -> EnergyGrid:
 
     raise ValueError(
         f"Unsupported energy grid type '{grid_type}'. Use 'log' or 'linear'."
-    )
\ No newline at end of file
+    )
+
+
+# ---------------------------------------------------------------------
+# Conservative rebinning
+# ---------------------------------------------------------------------
+
+EdgesLike = Union[EnergyGrid, np.ndarray]
+
+# Overlap matrices shared by every caller with the same (source, target) pair.
+_OVERLAP_MATRICES: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_OVERLAP_MATRICES_MAX = 256
+_OVERLAP_MATRICES_LOCK = threading.Lock()
+
+
+def _as_edges(grid: EdgesLike) -> np.ndarray:
+    edges = grid.edges if isinstance(grid, EnergyGrid) else np.asarray(grid, dtype=float)
+    if edges.ndim != 1 or len(edges) < 2 or not np.all(np.diff(edges) > 0.0):
+        raise ValueError("Bin edges must be a strictly increasing 1D array with at least 2 entries.")
+    return edges
+
+
+def energy_edges_key(energy_edges_mev: np.ndarray) -> str:
+    """
+    Stable hash of an energy grid, used to key grid-dependent caches.
+
+    Two grids share a key only if their float64 edges are bitwise identical.
+    """
+    edges = np.ascontiguousarray(energy_edges_mev, dtype=np.float64)
+    return f"{edges.size}:{hashlib.sha1(edges.tobytes()).hexdigest()}"
+
+
+def _build_overlap_matrix(src: np.ndarray, dst: np.ndarray, spacing: str, outside: str) -> np.ndarray:
+    if spacing == "log":
+        if src[0] <= 0.0 or dst[0] <= 0.0:
+            raise ValueError("spacing='log' requires positive source and target edges.")
+        src, dst = np.log(src), np.log(dst)
+
+    width = src[1:] - src[:-1]
+    overlap = np.clip(
+        np.minimum(src[1:, None], dst[None, 1:]) - np.maximum(src[:-1, None], dst[None, :-1]),
+        0.0, None,
+    )
+    R = overlap / width[:, None]
+    if outside == "clip":
+        R[:, 0] += np.clip(np.minimum(src[1:], dst[0]) - src[:-1], 0.0, None) / width
+        R[:, -1] += np.clip(src[1:] - np.maximum(src[:-1], dst[-1]), 0.0, None) / width
+    return R
+
+
+def rebin_overlap_matrix(
+    source: EdgesLike,
+    target: EdgesLike,
+    *,
+    spacing: str = "linear",
+    outside: str = "clip",
+) -> np.ndarray:
+    """
+    Overlap matrix R of shape (n_source_bins, n_target_bins) such that
+
+        target_content = source_content @ R
+
+    for bin contents (counts, probabilities, cross sections times width --
+    not densities). R[j, b] is the fraction of source bin j that falls in
+    target bin b.
+
+    Parameters
+    ----------
+    source, target : EnergyGrid or array of edges
+        Source edges may start at 0 (e.g. FRESCO product bins); the target is
+        usually the run grid.
+    spacing : {"linear", "log"}
+        Assume the content is spread uniformly in E ("linear") or in ln E
+        ("log") inside each source bin.
+    outside : {"clip", "drop"}
+        Content below (above) the target grid goes to its first (last) bin
+        ("clip", every row sums to 1) or is discarded ("drop").
+
+    Returns
+    -------
+    np.ndarray
+        Read-only matrix, cached per (source, target, spacing, outside).
+    """
+    if spacing not in ("linear", "log"):
+        raise ValueError(f"Unsupported spacing '{spacing}'. Use 'linear' or 'log'.")
+    if outside not in ("clip", "drop"):
+        raise ValueError(f"Unsupported outside mode '{outside}'. Use 'clip' or 'drop'.")
+
+    src = _as_edges(source)
+    dst = _as_edges(target)
+    key = (energy_edges_key(src), energy_edges_key(dst), spacing, outside)
+    with _OVERLAP_MATRICES_LOCK:
+        R = _OVERLAP_MATRICES.get(key)
+        if R is not None:
+            _OVERLAP_MATRICES.move_to_end(key)
+            return R
+
+    R = _build_overlap_matrix(src, dst, spacing, outside)
+    R.setflags(write=False)
+    with _OVERLAP_MATRICES_LOCK:
+        R = _OVERLAP_MATRICES.setdefault(key, R)
+        while len(_OVERLAP_MATRICES) > _OVERLAP_MATRICES_MAX:
+            _OVERLAP_MATRICES.popitem(last=False)
+    return R
+
+
+def rebin(
+    values: np.ndarray,
+    source: EdgesLike,
+    target: EdgesLike,
+    *,
+    spacing: str = "linear",
+    outside: str = "clip",
+    axis: int = -1,
+) -> np.ndarray:
+    """
+    Move bin contents along `axis` from the source bins to the target bins
+    with rebin_overlap_matrix(). Totals are preserved when outside="clip".
+    """
+    values = np.asarray(values, dtype=float)
+    R = rebin_overlap_matrix(source, target, spacing=spacing, outside=outside)
+    if values.shape[axis] != R.shape[0]:
+        raise ValueError(
+            f"values have {values.shape[axis]} bins along axis {axis}; "
+            f"the source grid has {R.shape[0]}."
+        )
+    return np.moveaxis(np.moveaxis(values, axis, -1) @ R, -1, axis)
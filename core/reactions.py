@@ -15,38 +15,54 @@ This module is responsible for:
    and averaging them when sigma(E) is queried.
 5. Building canonical reaction objects with stoichiometric reactants/products.
 6. Assigning compact indices to species and reactions for the solver.
-7. Providing cross section access on arbitrary energies and edge-defined bins.
+7. Providing cross section access on arbitrary energies and exact averages
+   over edge-defined bins.
+8. Caching grid-dependent, cloud-independent operators (bin-averaged sigma
+   matrices and product-energy tau tensors) per projectile and energy grid so
+   they are built once per run.
+9. Optionally persisting the fully built library (npz tables + JSON index)
+   so later runs skip CSV parsing altogether.
 
 Internal unit conventions
 -------------------------
 Energy:
     MeV
 Cross section:
-    mb
+    mb (sigma_matrix_cm2 converts to cm² for the survival calculation)
 
 Notes
 -----
 - This file does NOT evolve the state in time.
 - This file does NOT calculate stopping powers or survival fractions.
 - Q-values are delegated to utils/qvalue.py if available.
-- DWBA product-energy distributions are intentionally left as a stub until
-  their file format is finalized.
+- DWBA product-energy distributions come from the FRESCO E_bins output
+  (fresco_code/scripts/energy_bins_reaction_dir.py) where a run exists for
+  the channel; other Group1 channels keep the stub.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import hashlib
 import importlib
+import json
 import re
 
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    from survival import BandedTau
 
 log = logging.getLogger(__name__)
 
+MB_TO_CM2 = 1.0e-27  # 1 millibarn = 1e-27 cm^2
+
 # Optional: relativistic CM→lab energy conversion from utils/utils.py.
 # Imported lazily so reactions.py can be used standalone if needed.
 try:
@@ -426,6 +442,7 @@ class CrossSectionTable:
 
         # Merge duplicate energies within a single file by averaging.
         self._collapse_duplicate_energies()
+        self._piecewise: Optional[PiecewiseCrossSection] = None
 
     def _collapse_duplicate_energies(self) -> None:
         unique_e = np.unique(self.energy_mev)
@@ -471,6 +488,9 @@ class CrossSectionTable:
         Files with 'arb_units' sigma columns or 'theta' energy columns are skipped
         (a ValueError is raised so the caller can catch and skip the file).
         """
+        # Imported here so that loading a cached library never imports pandas.
+        import pandas as pd
+
         path = Path(filepath)
         if not path.exists():
             raise FileNotFoundError(f"Cross section file not found: {path}")
@@ -698,21 +718,192 @@ class CrossSectionTable:
             return float(out[0])
         return out
 
-    def average_sigma_on_bins(self, energy_edges_mev: np.ndarray) -> np.ndarray:
+    def as_piecewise(self) -> "PiecewiseCrossSection":
+        """
+        Closed form of sigma_interpolate() (built once and cached).
+        """
+        if self._piecewise is None:
+            self._piecewise = PiecewiseCrossSection.from_table(self)
+        return self._piecewise
+
+    def average_sigma_on_bins(
+        self,
+        energy_edges_mev: np.ndarray,
+        threshold_mev: Optional[float] = None,
+    ) -> np.ndarray:
         """
         Return the average cross section for each edge-defined bin.
 
-        Current implementation: midpoint evaluation.
-        Easy to replace later with a more accurate quadrature if desired.
+        The average is the exact integral of sigma_interpolate() over the bin
+        divided by its width; sigma is taken as zero below threshold_mev.
         """
-        edges = np.asarray(energy_edges_mev, dtype=float)
-        if edges.ndim != 1 or len(edges) < 2:
-            raise ValueError("energy_edges_mev must be a 1D array with length >= 2.")
-        if np.any(np.diff(edges) <= 0.0):
-            raise ValueError("energy_edges_mev must be strictly increasing.")
+        return self.as_piecewise().bin_average(_validated_edges(energy_edges_mev), threshold_mev)
+
+
+def _validated_edges(energy_edges_mev: np.ndarray) -> np.ndarray:
+    edges = np.asarray(energy_edges_mev, dtype=float)
+    if edges.ndim != 1 or len(edges) < 2:
+        raise ValueError("energy_edges_mev must be a 1D array with length >= 2.")
+    if np.any(np.diff(edges) <= 0.0):
+        raise ValueError("energy_edges_mev must be strictly increasing.")
+    return edges
+
+
+def _inverse_e_term(c: np.ndarray, E: np.ndarray) -> np.ndarray:
+    return np.divide(c, E, out=np.zeros(np.broadcast(c, E).shape), where=c != 0.0)
+
+
+def _log_term(c: np.ndarray, E: np.ndarray, x0: np.ndarray) -> np.ndarray:
+    ratio = np.divide(E, x0, out=np.ones(np.broadcast(c, E, x0).shape), where=c != 0.0)
+    return c * np.log(ratio)
+
+
+def _rows_on_knots(knots: np.ndarray, rows: np.ndarray, new_knots: np.ndarray) -> np.ndarray:
+    """
+    Re-express piecewise rows on a refinement of their knots.
+    """
+    probe = np.concatenate((
+        [0.5 * new_knots[0]],
+        0.5 * (new_knots[:-1] + new_knots[1:]),
+        [2.0 * new_knots[-1]],
+    ))
+    src = rows[np.searchsorted(knots, probe, side="right")]
+    x0 = np.concatenate((new_knots[:1], new_knots))
+    out = src.copy()
+    out[:, 0] = x0
+    out[:, 1] = src[:, 1] + src[:, 2] * (x0 - src[:, 0])
+    return out
+
+
+@dataclass
+class PiecewiseCrossSection:
+    """
+    Closed form of one tabulated sigma(E), or of the average of several.
+
+    The energy axis is cut at `knots` (n,). Row k of `rows` (n+1, 4) covers
+    [knots[k-1], knots[k]), rows 0 and n being the open tails, and holds
+    (x0, y0, slope, c) with
+
+        sigma(E) = y0 + slope * (E - x0) + c / E,
+
+    x0 being the lower knot of the row (knots[0] for row 0). Linear
+    interpolation, constant or 1/E extrapolation and the floor of
+    CrossSectionTable all take this form once the knots include the points
+    where a curve meets its floor, and so does any average of such curves.
+
+    Because every row integrates in closed form, the cumulative integral up
+    to each knot is stored and an exact bin average for any edge array costs
+    one searchsorted plus differences.
+    """
+    knots: np.ndarray
+    rows: np.ndarray
+
+    def __post_init__(self) -> None:
+        self.knots = np.asarray(self.knots, dtype=float)
+        self.rows = np.asarray(self.rows, dtype=float)
+        if self.knots.ndim != 1 or len(self.knots) < 1:
+            raise ValueError("knots must be a non-empty 1D array.")
+        if self.rows.shape != (len(self.knots) + 1, 4):
+            raise ValueError("rows must have shape (len(knots) + 1, 4).")
+
+        # Integral from knots[0] up to the x0 of each row.
+        x0, y0, slope, c = self.rows[1:-1].T
+        width = self.knots[1:] - x0
+        seg = y0 * width + 0.5 * slope * width**2 + _log_term(c, self.knots[1:], x0)
+        self._cumulative = np.concatenate(([0.0, 0.0], np.cumsum(seg)))
+
+    @classmethod
+    def from_table(cls, table: CrossSectionTable) -> "PiecewiseCrossSection":
+        E, sigma = table.energy_mev, table.sigma_mb
+        knots = E.copy()
+        rows = np.zeros((len(E) + 1, 4), dtype=float)
+        rows[:, 0] = np.concatenate((E[:1], E))
+        rows[:, 1] = np.concatenate((sigma[:1], sigma))
+        rows[1:-1, 2] = np.diff(sigma) / np.diff(E)
+        if table.use_inverse_e_extrapolation:
+            rows[-1, 1], rows[-1, 3] = 0.0, sigma[-1] * E[-1]
+            if not table.inverse_e_high_only:
+                rows[0, 1], rows[0, 3] = 0.0, sigma[0] * E[0]
+
+        # Split rows where the curve meets the floor, then clamp the rows
+        # that lie below it.
+        floor = table.floor_sigma_mb
+        lo = np.concatenate(([0.0], knots))
+        hi = np.concatenate((knots, [np.inf]))
+        x0, y0, slope, c = rows.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = np.where(
+                slope != 0.0,
+                x0 + (floor - y0) / slope,
+                np.where(c != 0.0, c / (floor - y0), np.nan),
+            )
+        crossing = crossing[(crossing > lo) & (crossing < hi)]
+        if len(crossing):
+            new_knots = np.unique(np.concatenate((knots, crossing)))
+            rows = _rows_on_knots(knots, rows, new_knots)
+            knots = new_knots
+
+        probe = np.concatenate((
+            [0.5 * knots[0]],
+            0.5 * (knots[:-1] + knots[1:]),
+            [2.0 * knots[-1]],
+        ))
+        clipped = cls._evaluate_rows(rows, probe) < floor
+        rows[clipped, 1:] = (floor, 0.0, 0.0)
+        return cls(knots=knots, rows=rows)
+
+    @classmethod
+    def from_tables(cls, tables: Sequence[CrossSectionTable]) -> "PiecewiseCrossSection":
+        """
+        Pointwise average of several tables on the union of their knots.
+        """
+        parts = [tbl.as_piecewise() for tbl in tables]
+        if len(parts) == 1:
+            return parts[0]
+        knots = np.unique(np.concatenate([p.knots for p in parts]))
+        rows = _rows_on_knots(parts[0].knots, parts[0].rows, knots)
+        for p in parts[1:]:
+            rows[:, 1:] += _rows_on_knots(p.knots, p.rows, knots)[:, 1:]
+        rows[:, 1:] /= len(parts)
+        return cls(knots=knots, rows=rows)
+
+    @staticmethod
+    def _evaluate_rows(rows: np.ndarray, E: np.ndarray) -> np.ndarray:
+        x0, y0, slope, c = rows.T
+        return y0 + slope * (E - x0) + _inverse_e_term(c, E)
+
+    def _locate(self, E: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self.knots, E, side="right")
+
+    def __call__(self, energy_mev: np.ndarray) -> np.ndarray:
+        E = np.asarray(energy_mev, dtype=float)
+        return self._evaluate_rows(self.rows[self._locate(E)], E)
+
+    def integral(self, energy_mev: np.ndarray) -> np.ndarray:
+        """
+        Integral of sigma from knots[0] to energy_mev (mb MeV; negative below).
+        """
+        E = np.asarray(energy_mev, dtype=float)
+        k = self._locate(E)
+        x0, y0, slope, c = self.rows[k].T
+        d = E - x0
+        return self._cumulative[k] + y0 * d + 0.5 * slope * d**2 + _log_term(c, E, x0)
 
-        mids = 0.5 * (edges[:-1] + edges[1:])
-        return np.asarray(self.sigma_interpolate(mids), dtype=float)
+    def bin_average(
+        self,
+        energy_edges_mev: np.ndarray,
+        threshold_mev: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Exact average of sigma over each bin; zero below threshold_mev.
+        """
+        edges = np.asarray(energy_edges_mev, dtype=float)
+        F = self.integral(edges)
+        lower = F[:-1]
+        if threshold_mev is not None:
+            open_from = np.clip(threshold_mev, edges[:-1], edges[1:])
+            lower = self.integral(open_from)
+        return (F[1:] - lower) / np.diff(edges)
 
 
 @dataclass
@@ -722,31 +913,61 @@ class AggregatedCrossSection:
 
     At query time, all datasets are interpolated/extrapolated to the requested
     energy (or bins), then averaged.
+
+    With merge_tables=True the combined curve is built once on the union of
+    all tabulated energies (see PiecewiseCrossSection), so a query is a single
+    knot lookup instead of one interpolation per dataset.
     """
     tables: List[CrossSectionTable]
     combine_mode: str = "average"
+    merge_tables: bool = False
 
     def __post_init__(self) -> None:
         if not self.tables:
             raise ValueError("AggregatedCrossSection requires at least one table.")
         if self.combine_mode not in {"average", "first"}:
             raise ValueError("combine_mode must be 'average' or 'first'.")
+        self._merged: Optional[PiecewiseCrossSection] = None
+        if self.merge_tables:
+            self._merged = self.as_piecewise()
 
-    def sigma_interpolate(self, energy_mev: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
-        vals = [tbl.sigma_interpolate(energy_mev) for tbl in self.tables]
-        arr = np.asarray(vals, dtype=float)
+    def as_piecewise(self) -> PiecewiseCrossSection:
+        """
+        Closed form of the combined curve.
+        """
+        if self._merged is not None:
+            return self._merged
+        tables = self.tables[:1] if self.combine_mode == "first" else self.tables
+        return PiecewiseCrossSection.from_tables(tables)
 
-        if self.combine_mode == "first":
-            out = arr[0]
+    def sigma_interpolate(self, energy_mev: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Combined sigma at energy_mev, from the merged curve when there is one.
+        """
+        if self._merged is not None:
+            out = self._merged(np.atleast_1d(np.asarray(energy_mev, dtype=float)))
         else:
-            out = np.mean(arr, axis=0)
+            vals = [tbl.sigma_interpolate(energy_mev) for tbl in self.tables]
+            arr = np.asarray(vals, dtype=float)
+
+            if self.combine_mode == "first":
+                out = arr[0]
+            else:
+                out = np.mean(arr, axis=0)
 
         if np.isscalar(energy_mev):
             return float(np.atleast_1d(out)[0])
         return out
 
-    def average_sigma_on_bins(self, energy_edges_mev: np.ndarray) -> np.ndarray:
-        vals = [tbl.average_sigma_on_bins(energy_edges_mev) for tbl in self.tables]
+    def average_sigma_on_bins(
+        self,
+        energy_edges_mev: np.ndarray,
+        threshold_mev: Optional[float] = None,
+    ) -> np.ndarray:
+        if self._merged is not None:
+            return self._merged.bin_average(_validated_edges(energy_edges_mev), threshold_mev)
+
+        vals = [tbl.average_sigma_on_bins(energy_edges_mev, threshold_mev) for tbl in self.tables]
         arr = np.asarray(vals, dtype=float)
 
         if self.combine_mode == "first":
@@ -772,6 +993,47 @@ class ProductDistributionModel:
     ) -> np.ndarray:
         raise NotImplementedError
 
+    def distribution_band(
+        self,
+        *,
+        projectile_energies_mev: np.ndarray,
+        product_species: str,
+        product_energy_edges_mev: np.ndarray,
+    ) -> Tuple[int, np.ndarray]:
+        """
+        Distributions for all projectile energies as a band of product bins.
+
+        Returns (first_bin, weights) with weights of shape
+        (n_projectile_energies, width): the distribution at energy k is
+        weights[k] placed at product bins first_bin .. first_bin + width - 1
+        and zero elsewhere.
+
+        The default evaluates distribution() per energy and trims the result
+        to its non-zero bins; models with a known structure override this.
+        """
+        n_prod_bins = len(product_energy_edges_mev) - 1
+        dense = np.zeros((len(projectile_energies_mev), n_prod_bins), dtype=float)
+        for k, eproj in enumerate(projectile_energies_mev):
+            dist = np.asarray(
+                self.distribution(
+                    projectile_energy_mev=float(eproj),
+                    product_species=product_species,
+                    product_energy_edges_mev=product_energy_edges_mev,
+                ),
+                dtype=float,
+            )
+            if dist.shape != (n_prod_bins,):
+                raise ValueError(
+                    f"Distribution for product '{product_species}' has shape "
+                    f"{dist.shape}; expected {(n_prod_bins,)}."
+                )
+            dense[k] = dist
+
+        cols = np.flatnonzero(np.any(dense != 0.0, axis=0))
+        if cols.size == 0:
+            return 0, dense[:, :0]
+        return int(cols[0]), dense[:, cols[0]:cols[-1] + 1]
+
 
 @dataclass
 class DeltaAtThermalModel(ProductDistributionModel):
@@ -790,6 +1052,15 @@ class DeltaAtThermalModel(ProductDistributionModel):
         out[0] = 1.0
         return out
 
+    def distribution_band(
+        self,
+        *,
+        projectile_energies_mev: np.ndarray,
+        product_species: str,
+        product_energy_edges_mev: np.ndarray,
+    ) -> Tuple[int, np.ndarray]:
+        return 0, np.ones((len(projectile_energies_mev), 1), dtype=float)
+
 
 class DWBAStubModel(ProductDistributionModel):
     """
@@ -805,6 +1076,253 @@ class DWBAStubModel(ProductDistributionModel):
         raise NotImplementedError("DWBA output format has not been specified yet.")
 
 
+# FRESCO post-processing (fresco_code/scripts/energy_bins_reaction_dir.py)
+# writes one <run>_<E>MeV_<product>_Ebins.csv per projectile energy and
+# product, with product names in FRESCO spelling.
+_E_BINS_RE = re.compile(r"_(?P<energy>\d+(?:p\d+)?)MeV_(?P<product>[A-Za-z0-9]+)_Ebins\.csv$")
+_FRESCO_SPECIES = {"he3": "3He", "he4": "4He", "li7": "7Li", "be7": "7Be"}
+PRODUCT_BINS_CACHE_VERSION = 1
+
+
+def _read_e_bins_dir(e_bins_dir: Path) -> Tuple[np.ndarray, np.ndarray, List[str], np.ndarray]:
+    """
+    Parse every *_Ebins.csv in a FRESCO E_bins directory.
+
+    Returns (projectile_energies_mev, product_edges_mev, products, eta) with
+    eta of shape (n_products, n_projectile_energies, n_product_bins); energies
+    missing for a product are left as zero rows.
+    """
+    rows: Dict[Tuple[str, float], np.ndarray] = {}
+    edges = None
+    for path in sorted(e_bins_dir.glob("*_Ebins.csv")):
+        m = _E_BINS_RE.search(path.name)
+        if m is None:
+            log.warning("Skipping %s (filename parse error)", path.name)
+            continue
+        energy = float(m.group("energy").replace("p", "."))
+        product = canonical_species_name(_FRESCO_SPECIES.get(m.group("product"), m.group("product")))
+
+        data = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+        file_edges = np.append(data[:, 0], data[-1, 1])
+        if edges is None:
+            edges = file_edges
+        elif not np.array_equal(edges, file_edges):
+            raise ValueError(f"{path.name} uses different product bins from the rest of {e_bins_dir}.")
+        if (product, energy) in rows:
+            raise ValueError(f"{e_bins_dir} has two files for {product} at {energy} MeV.")
+        rows[(product, energy)] = data[:, 3]
+
+    if edges is None:
+        raise ValueError(f"No *_Ebins.csv files found in {e_bins_dir}.")
+
+    products = sorted({p for p, _ in rows})
+    energies = np.array(sorted({e for _, e in rows}), dtype=float)
+    eta = np.zeros((len(products), len(energies), len(edges) - 1), dtype=float)
+    for (product, energy), row in rows.items():
+        eta[products.index(product), np.searchsorted(energies, energy)] = row
+    return energies, edges, products, eta
+
+
+def _product_bins_index(
+    runs_dir: Path,
+) -> Dict[Tuple[str, str, Tuple[Tuple[str, int], ...]], Path]:
+    """
+    Map (target, projectile, product stoichiometry) to the E_bins directory of
+    every FRESCO run under runs_dir. Runs are named
+    {target}_{projectile}_{ejectiles}_{residual}, e.g. p_d_pn_p or
+    4He_4He_n_7Be; the residual may itself be compact ("2d").
+    """
+    index: Dict[Tuple[str, str, Tuple[Tuple[str, int], ...]], Path] = {}
+    if not runs_dir.is_dir():
+        return index
+
+    for run in sorted(runs_dir.iterdir()):
+        parts = run.name.split("_")
+        if len(parts) != 4 or not (run / "E_bins").is_dir():
+            continue
+        target, projectile, *outgoing = parts
+        products: Dict[str, int] = {}
+        try:
+            for token in outgoing:
+                if re.fullmatch(r"\d+[A-Z][a-z]?", token):
+                    stoich_dict_add(products, token)
+                else:
+                    for species, count in parse_compact_species_string(token).items():
+                        stoich_dict_add(products, species, count)
+        except ValueError as exc:
+            log.warning("Skipping FRESCO run %s: %s", run.name, exc)
+            continue
+        key = (
+            canonical_species_name(target),
+            canonical_species_name(projectile),
+            stoich_dict_to_sorted_tuple(products),
+        )
+        index[key] = run / "E_bins"
+    return index
+
+
+def _interpolate_rows(x: np.ndarray, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    Linear interpolation of rows, shape (n_x, m), tabulated at the increasing
+    abscissae x; returns shape (n_query, m), held constant beyond the ends
+    like np.interp.
+    """
+    x = np.asarray(x, dtype=float)
+    rows = np.asarray(rows, dtype=float)
+    E = np.clip(np.atleast_1d(np.asarray(query, dtype=float)), x[0], x[-1])
+    if len(x) == 1:
+        return np.repeat(rows, len(E), axis=0)
+    lo = np.clip(np.searchsorted(x, E, side="right") - 1, 0, len(x) - 2)
+    t = ((E - x[lo]) / (x[lo + 1] - x[lo]))[:, None]
+    return rows[lo] * (1.0 - t) + rows[lo + 1] * t
+
+
+@dataclass(eq=False)
+class TabulatedProductDistributionModel(ProductDistributionModel):
+    """
+    Product-energy distributions tabulated at a set of projectile energies,
+    e.g. the DWBA/FRESCO E_bins output.
+
+    eta[p] has shape (n_projectile_energies, n_product_bins) on
+    product_edges_mev; each row is the normalized distribution at one
+    projectile energy. A query interpolates linearly between the tabulated
+    projectile energies (constant beyond the ends), moves the result onto the
+    requested product grid with grids.rebin_overlap_matrix() (flat within each
+    tabulated bin, weight beyond the grid clipped into its end bins) and
+    renormalizes it, so the run grid need not match the FRESCO binning. Products
+    without a table, and energies where the table is all zero, are put in the
+    thermal bin like DeltaAtThermalModel.
+    """
+    projectile_energies_mev: np.ndarray
+    product_edges_mev: np.ndarray
+    eta: Dict[str, np.ndarray]
+    source_dir: Optional[Path] = None
+
+    def __post_init__(self) -> None:
+        self.projectile_energies_mev = np.asarray(self.projectile_energies_mev, dtype=float)
+        self.product_edges_mev = np.asarray(self.product_edges_mev, dtype=float)
+        if np.any(np.diff(self.projectile_energies_mev) <= 0.0):
+            raise ValueError("projectile_energies_mev must be strictly increasing.")
+        if np.any(np.diff(self.product_edges_mev) <= 0.0):
+            raise ValueError("product_edges_mev must be strictly increasing.")
+        shape = (len(self.projectile_energies_mev), len(self.product_edges_mev) - 1)
+        for product, table in self.eta.items():
+            if table.shape != shape:
+                raise ValueError(f"eta['{product}'] has shape {table.shape}; expected {shape}.")
+        self.eta = {canonical_species_name(p): table for p, table in self.eta.items()}
+
+    @classmethod
+    def from_e_bins_dir(
+        cls,
+        e_bins_dir: Union[str, Path],
+        *,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> "TabulatedProductDistributionModel":
+        """
+        Load a FRESCO E_bins directory.
+
+        With cache_dir, the tables are stored there once as one .npy array
+        (plus a JSON index) keyed on the path, mtime and size of every
+        *_Ebins.csv, and later loads memory-map that array instead of parsing
+        the CSVs.
+        """
+        e_bins_dir = Path(e_bins_dir)
+        if cache_dir is None:
+            energies, edges, products, eta = _read_e_bins_dir(e_bins_dir)
+            return cls(energies, edges, dict(zip(products, eta)), source_dir=e_bins_dir)
+
+        h = hashlib.sha1(repr(PRODUCT_BINS_CACHE_VERSION).encode())
+        h.update(str(e_bins_dir.resolve()).encode())
+        for path in sorted(e_bins_dir.glob("*_Ebins.csv")):
+            h.update(f"{path.name}:{_file_stamp(path)}".encode())
+        stem = Path(cache_dir) / f"product_bins_{h.hexdigest()[:20]}"
+        json_path, npy_path = stem.with_suffix(".json"), stem.with_suffix(".npy")
+
+        if json_path.exists() and npy_path.exists():
+            try:
+                with open(json_path) as f:
+                    index = json.load(f)
+                eta = np.load(npy_path, mmap_mode="r")
+                return cls(
+                    index["projectile_energies_mev"],
+                    index["product_edges_mev"],
+                    dict(zip(index["products"], eta)),
+                    source_dir=e_bins_dir,
+                )
+            except (OSError, KeyError, ValueError) as exc:
+                log.warning("Ignoring unreadable product-bin cache %s: %s", json_path, exc)
+
+        energies, edges, products, eta = _read_e_bins_dir(e_bins_dir)
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        # Array first, index last, each through a rename (as for the library cache).
+        tmp = npy_path.with_name(npy_path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, eta)
+        tmp.replace(npy_path)
+        tmp = json_path.with_name(json_path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({
+                "projectile_energies_mev": energies.tolist(),
+                "product_edges_mev": edges.tolist(),
+                "products": products,
+                "source_dir": str(e_bins_dir),
+            }, f)
+        tmp.replace(json_path)
+        return cls(
+            energies, edges, dict(zip(products, np.load(npy_path, mmap_mode="r"))),
+            source_dir=e_bins_dir,
+        )
+
+    def _distributions(
+        self,
+        projectile_energies_mev: np.ndarray,
+        product_species: str,
+        product_energy_edges_mev: np.ndarray,
+    ) -> np.ndarray:
+        energies = np.atleast_1d(np.asarray(projectile_energies_mev, dtype=float))
+        n_prod_bins = len(product_energy_edges_mev) - 1
+        out = np.zeros((len(energies), n_prod_bins), dtype=float)
+
+        table = self.eta.get(canonical_species_name(product_species))
+        if table is not None:
+            from grids import rebin_overlap_matrix
+
+            out = _interpolate_rows(self.projectile_energies_mev, table, energies) @ rebin_overlap_matrix(
+                self.product_edges_mev, product_energy_edges_mev
+            )
+
+        total = out.sum(axis=1)
+        ok = total > 0.0
+        out[ok] /= total[ok, None]
+        out[~ok] = 0.0
+        out[~ok, 0] = 1.0
+        return out
+
+    def distribution(
+        self,
+        *,
+        projectile_energy_mev: float,
+        product_species: str,
+        product_energy_edges_mev: np.ndarray,
+    ) -> np.ndarray:
+        return self._distributions(
+            projectile_energy_mev, product_species, product_energy_edges_mev
+        )[0]
+
+    def distribution_band(
+        self,
+        *,
+        projectile_energies_mev: np.ndarray,
+        product_species: str,
+        product_energy_edges_mev: np.ndarray,
+    ) -> Tuple[int, np.ndarray]:
+        dense = self._distributions(
+            projectile_energies_mev, product_species, product_energy_edges_mev
+        )
+        cols = np.flatnonzero(np.any(dense != 0.0, axis=0))
+        return int(cols[0]), dense[:, cols[0]:cols[-1] + 1]
+
+
 # =============================================================================
 # Species registry
 # =============================================================================
@@ -828,6 +1346,19 @@ class SpeciesRegistry:
     def index(self, species: str) -> int:
         return self.species_to_index[canonical_species_name(species)]
 
+    def ids(self, species_list: Iterable[str]) -> np.ndarray:
+        """
+        Integer IDs of several species, -1 for species not in the registry.
+        """
+        lookup = self.species_to_index
+        return np.asarray(
+            [lookup.get(s, lookup.get(canonical_species_name(s), -1)) for s in species_list],
+            dtype=int,
+        )
+
+    def name(self, species_id: int) -> str:
+        return self.index_to_species[species_id]
+
     def __contains__(self, species: str) -> bool:
         return canonical_species_name(species) in self.species_to_index
 
@@ -910,12 +1441,8 @@ class ReactionChannel:
         return sigma
 
     def sigma_bin_average_mb(self, energy_edges_mev: np.ndarray) -> np.ndarray:
-        avg = self.cross_section.average_sigma_on_bins(energy_edges_mev)
-        if self.threshold_mev is None:
-            return avg
-
-        mids = 0.5 * (energy_edges_mev[:-1] + energy_edges_mev[1:])
-        return np.where(mids >= self.threshold_mev, avg, 0.0)
+        # A bin straddling the threshold is averaged over its open part only.
+        return self.cross_section.average_sigma_on_bins(energy_edges_mev, self.threshold_mev)
 
     def products_as_objects(self) -> List[ReactionProduct]:
         out: List[ReactionProduct] = []
@@ -961,6 +1488,135 @@ def try_compute_q_value_mev(
     return None
 
 
+# =============================================================================
+# Grid-dependent operators
+# =============================================================================
+
+def product_species_union(reactions: Sequence[ReactionChannel]) -> List[str]:
+    """
+    Stable union of all product species appearing in the provided reactions.
+    """
+    seen = set()
+    ordered: List[str] = []
+
+    for rxn in reactions:
+        for prod in rxn.products_as_objects():
+            s = canonical_species_name(prod.species)
+            if s not in seen:
+                seen.add(s)
+                ordered.append(s)
+
+    return ordered
+
+
+def build_product_tau_banded(
+    reactions: Sequence[ReactionChannel],
+    product_species_order: Sequence[str],
+    energy_edges_mev: np.ndarray,
+) -> BandedTau:
+    """
+    Build tau for survival.compute_contracted_yield() in band form:
+
+        tau.shape = (n_rxn, n_proj_bins, n_products, n_prod_bins)
+
+    Each reaction channel provides a product_distribution_model. Its
+    distribution is multiplied by the product multiplicity, so tau carries the
+    expected number of particles of each product species per reaction event.
+    Only the product bins a distribution can reach are stored, so delta-at-
+    thermal products cost O(n_rxn * n_bins) instead of O(n_rxn * n_bins**2).
+    """
+    from survival import BandedTau
+
+    energy_edges_mev = np.asarray(energy_edges_mev, dtype=float)
+    n_rxn = len(reactions)
+    n_proj_bins = len(energy_edges_mev) - 1
+    n_products = len(product_species_order)
+    n_prod_bins = n_proj_bins
+
+    proj_bin_centers = 0.5 * (energy_edges_mev[:-1] + energy_edges_mev[1:])
+    prod_index = {s: i for i, s in enumerate(product_species_order)}
+    blocks: Dict[Tuple[int, int], Tuple[int, np.ndarray]] = {}
+
+    for i_rxn, rxn in enumerate(reactions):
+        if rxn.product_distribution_model is None:
+            raise NotImplementedError(
+                f"Reaction '{rxn.name()}' does not have a product_distribution_model."
+            )
+
+        for prod in rxn.products_as_objects():
+            p_species = canonical_species_name(prod.species)
+            p_idx = prod_index[p_species]
+
+            try:
+                first_bin, weights = rxn.product_distribution_model.distribution_band(
+                    projectile_energies_mev=proj_bin_centers,
+                    product_species=p_species,
+                    product_energy_edges_mev=energy_edges_mev,
+                )
+            except NotImplementedError as exc:
+                raise NotImplementedError(
+                    f"Reaction '{rxn.name()}' still uses an unimplemented "
+                    f"product-energy distribution for product '{p_species}'."
+                ) from exc
+
+            weights = np.asarray(weights, dtype=float)
+            if (
+                weights.ndim != 2
+                or weights.shape[0] != n_proj_bins
+                or not 0 <= first_bin <= first_bin + weights.shape[1] <= n_prod_bins
+            ):
+                raise ValueError(
+                    f"Distribution for reaction '{rxn.name()}', product '{p_species}' "
+                    f"has band shape {weights.shape} at bin {first_bin}; expected "
+                    f"({n_proj_bins}, width) within {n_prod_bins} bins."
+                )
+            if weights.shape[1] == 0:
+                continue
+
+            weights = float(prod.multiplicity) * weights
+            if (i_rxn, p_idx) in blocks:
+                # The same species listed twice: widen to the union of both bands.
+                prev_first, prev = blocks[(i_rxn, p_idx)]
+                lo = min(prev_first, first_bin)
+                hi = max(prev_first + prev.shape[1], first_bin + weights.shape[1])
+                merged = np.zeros((n_proj_bins, hi - lo), dtype=float)
+                merged[:, prev_first - lo:prev_first - lo + prev.shape[1]] += prev
+                merged[:, first_bin - lo:first_bin - lo + weights.shape[1]] += weights
+                first_bin, weights = lo, merged
+            blocks[(i_rxn, p_idx)] = (int(first_bin), weights)
+
+    return BandedTau((n_rxn, n_proj_bins, n_products, n_prod_bins), blocks)
+
+
+def build_product_tau_tensor(
+    reactions: Sequence[ReactionChannel],
+    product_species_order: Sequence[str],
+    energy_edges_mev: np.ndarray,
+) -> np.ndarray:
+    """
+    Dense form of build_product_tau_banded():
+
+        tau.shape = (n_rxn, n_proj_bins, n_products, n_prod_bins)
+    """
+    return build_product_tau_banded(reactions, product_species_order, energy_edges_mev).todense()
+
+
+@dataclass(frozen=True, eq=False)
+class ProductRouting:
+    """
+    Where one projectile's reaction targets and products go in a given cloud.
+
+    Rows follow ReactionLibrary.by_projectile(); product columns follow the
+    product order of ReactionLibrary.product_tau_tensor(). Cloud indices are
+    -1 for species the cloud does not track.
+    """
+    target_idx: np.ndarray     # (n_rxn,) cloud index of each target
+    product_idx: np.ndarray    # (n_products,) cloud index of each product species
+    multiplicity: np.ndarray   # (n_rxn, n_products), 0 where the product does not occur
+    nonthermal: np.ndarray     # (n_rxn, n_products), True: injected into the cascade spectra
+    thermal_idx: np.ndarray    # (n_rxn, n_products) cloud index for thermalized products, else -1
+
+
 # =============================================================================
 # Reaction library
 # =============================================================================
@@ -988,11 +1644,98 @@ class ReactionLibrary:
 
             self.reaction_to_index[rxn.name()] = rxn.reaction_index
 
+        # Intern every species once so the cascade can work on integer IDs.
+        for rxn in self.reactions:
+            self.species_registry.add_many([rxn.projectile, rxn.target, *rxn.products_stoich])
+        self._cloud_index_maps: Dict[Tuple[Tuple[str, ...], int], np.ndarray] = {}
+        self._routing_cache: Dict[Tuple[str, Tuple[str, ...], int], ProductRouting] = {}
+
+        # Grid-dependent operators, keyed on (kind, projectile, edges key).
+        # Each entry stores the signature of the reactions it was built from
+        # so that swapping channels or product models forces a rebuild.
+        self._grid_cache: Dict[Tuple[str, str, str], Tuple[Tuple[int, ...], object]] = {}
+
+        # Guards the three caches above: thread executors fill them from
+        # worker threads. Entries are built outside the lock; if two threads
+        # build the same one, the first stored copy wins.
+        self._cache_lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+    def cloud_index_map(self, cloud_species: Sequence[str]) -> np.ndarray:
+        """
+        Cloud index of every registry ID (-1 for species the cloud does not
+        track), for a given cloud species list. Cached per list.
+        """
+        key = (tuple(cloud_species), len(self.species_registry))
+        with self._cache_lock:
+            mapping = self._cloud_index_maps.get(key)
+        if mapping is None:
+            mapping = np.full(len(self.species_registry), -1, dtype=int)
+            cloud_ids = self.species_registry.ids(cloud_species)
+            tracked = cloud_ids >= 0
+            mapping[cloud_ids[tracked]] = np.flatnonzero(tracked)
+            mapping.setflags(write=False)
+            with self._cache_lock:
+                mapping = self._cloud_index_maps.setdefault(key, mapping)
+        return mapping
+
+    def product_routing(self, projectile: str, cloud_species: Sequence[str]) -> ProductRouting:
+        """
+        Routing table of one projectile's channels into a cloud with the
+        given species list; built once per (projectile, species list).
+        """
+        key = (projectile, tuple(cloud_species), len(self.species_registry))
+        with self._cache_lock:
+            routing = self._routing_cache.get(key)
+        if routing is None:
+            reactions = self.by_projectile(projectile)
+            if not reactions:
+                raise KeyError(f"No reaction channels for projectile '{projectile}'.")
+            products = product_species_union(reactions)
+            column = {sp: i for i, sp in enumerate(products)}
+
+            multiplicity = np.zeros((len(reactions), len(products)), dtype=int)
+            nonthermal = np.zeros((len(reactions), len(products)), dtype=bool)
+            for i_rxn, rxn in enumerate(reactions):
+                for prod in rxn.products_as_objects():
+                    p_idx = column[canonical_species_name(prod.species)]
+                    multiplicity[i_rxn, p_idx] = prod.multiplicity
+                    nonthermal[i_rxn, p_idx] = prod.can_continue_nonthermal
+
+            registry = self.species_registry
+            cloud_index = self.cloud_index_map(cloud_species)
+            product_idx = cloud_index[registry.ids(products)]
+            thermal = (multiplicity > 0) & ~nonthermal
+            routing = ProductRouting(
+                target_idx=cloud_index[registry.ids(rxn.target for rxn in reactions)],
+                product_idx=product_idx,
+                multiplicity=multiplicity,
+                nonthermal=nonthermal,
+                thermal_idx=np.where(thermal, product_idx[None, :], -1),
+            )
+            for arr in (routing.target_idx, routing.product_idx, routing.multiplicity,
+                        routing.nonthermal, routing.thermal_idx):
+                arr.setflags(write=False)
+            with self._cache_lock:
+                routing = self._routing_cache.setdefault(key, routing)
+        return routing
+
     def all(self) -> List[ReactionChannel]:
         return list(self.reactions)
 
     def by_projectile(self, projectile: str) -> List[ReactionChannel]:
-        return list(self._by_projectile.get(canonical_species_name(projectile), []))
+        reactions = self._by_projectile.get(projectile)
+        if reactions is None:
+            reactions = self._by_projectile.get(canonical_species_name(projectile), [])
+        return list(reactions)
 
     def by_target(self, target: str) -> List[ReactionChannel]:
         return list(self._by_target.get(canonical_species_name(target), []))
@@ -1046,6 +1789,118 @@ class ReactionLibrary:
             for rxn in self.by_projectile(projectile)
         }
 
+    def clear_grid_caches(self) -> None:
+        """
+        Drop every cached grid-dependent operator (e.g. after editing channels).
+        """
+        with self._cache_lock:
+            self._grid_cache.clear()
+
+    def _reaction_signature(self, reactions: Sequence[ReactionChannel]) -> Tuple[int, ...]:
+        sig: List[int] = []
+        for rxn in reactions:
+            sig.append(id(rxn))
+            sig.append(id(rxn.product_distribution_model))
+        return tuple(sig)
+
+    def _cached_grid_operator(self, kind: str, projectile: str, energy_edges_mev: np.ndarray, builder):
+        """
+        Return a cached operator for (kind, projectile, grid), building it on a miss.
+
+        Cached numpy arrays are marked read-only so callers cannot corrupt the
+        shared copy. Safe to call from several threads at once.
+        """
+        from grids import energy_edges_key
+
+        projectile = canonical_species_name(projectile)
+        reactions = self._by_projectile.get(projectile, [])
+        key = (kind, projectile, energy_edges_key(energy_edges_mev))
+        signature = self._reaction_signature(reactions)
+
+        with self._cache_lock:
+            hit = self._grid_cache.get(key)
+        if hit is not None and hit[0] == signature:
+            return hit[1]
+
+        value = builder(reactions)
+        for arr in value if isinstance(value, tuple) else (value,):
+            if isinstance(arr, np.ndarray):
+                arr.setflags(write=False)
+        with self._cache_lock:
+            hit = self._grid_cache.get(key)
+            if hit is not None and hit[0] == signature:
+                return hit[1]
+            self._grid_cache[key] = (signature, value)
+        return value
+
+    def sigma_matrix_cm2(
+        self,
+        *,
+        projectile: str,
+        energy_edges_mev: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Return sigma_bin with shape (n_rxn, n_bins) in cm², aligned with
+        by_projectile(projectile).
+
+        Cross sections do not depend on the cloud state, so the bin averages
+        are computed once per grid and reused across timesteps.
+        """
+        edges = np.asarray(energy_edges_mev, dtype=float)
+
+        def build(reactions):
+            if not reactions:
+                return np.zeros((0, len(edges) - 1), dtype=float)
+            return np.vstack([
+                np.asarray(rxn.sigma_bin_average_mb(edges), dtype=float) * MB_TO_CM2
+                for rxn in reactions
+            ])
+
+        return self._cached_grid_operator("sigma_cm2", projectile, edges, build)
+
+    def product_tau_tensor(
+        self,
+        *,
+        projectile: str,
+        energy_edges_mev: np.ndarray,
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Return (product_species_order, tau) for a projectile on an energy grid.
+
+        tau has shape (n_rxn, n_bins, n_products, n_bins) and is aligned with
+        by_projectile(projectile). It depends only on the reaction set and the
+        grid, so it is built once and reused across timesteps.
+        """
+        edges = np.asarray(energy_edges_mev, dtype=float)
+
+        def build(reactions):
+            order = product_species_union(reactions)
+            return tuple(order), build_product_tau_tensor(reactions, order, edges)
+
+        order, tau = self._cached_grid_operator("tau", projectile, edges, build)
+        return list(order), tau
+
+    def product_tau(
+        self,
+        *,
+        projectile: str,
+        energy_edges_mev: np.ndarray,
+    ) -> Tuple[List[str], BandedTau]:
+        """
+        Return (product_species_order, tau) with tau as a BandedTau.
+
+        Same operator and caching as product_tau_tensor(), without
+        materializing the (n_rxn, n_bins, n_products, n_bins) array.
+        """
+        edges = np.asarray(energy_edges_mev, dtype=float)
+
+        def build(reactions):
+            order = product_species_union(reactions)
+            return tuple(order), build_product_tau_banded(reactions, order, edges)
+
+        order, tau = self._cached_grid_operator("tau_banded", projectile, edges, build)
+        return list(order), tau
+
     @classmethod
     def from_directories(
         cls,
@@ -1056,9 +1911,16 @@ class ReactionLibrary:
         use_inverse_e_extrapolation: bool = True,
         inverse_e_high_only: bool = True,
         combine_mode: str = "average",
+        merge_tables: bool = False,
         group2_default_thermalize: bool = True,
         include_group1: bool = True,
         include_group2: bool = True,
+        group1_tabulated_only: bool = False,
+        product_bins_dir: Optional[Union[str, Path]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        rebuild_cache: bool = False,
+        load_executor: str = "serial",
+        load_workers: Optional[int] = None,
     ) -> "ReactionLibrary":
         """
         Build the reaction library by scanning cross section directories.
@@ -1071,8 +1933,89 @@ class ReactionLibrary:
         target_species
             Allowed target species. If provided, only reactions with these targets
             are kept. This should typically come from cloud.json.
+        merge_tables
+            Pre-merge the datasets of each channel onto their union energy
+            grid (see AggregatedCrossSection) so sigma queries cost one
+            lookup regardless of how many files a channel has.
+        product_bins_dir
+            Directory of FRESCO runs with E_bins/ product distributions
+            (default: base_dir/fresco_code/runs). Group1 channels with a
+            matching run get a TabulatedProductDistributionModel; the others
+            keep DWBAStubModel.
+        group1_tabulated_only
+            Keep only the Group1 channels that get a
+            TabulatedProductDistributionModel. Channels that would fall back
+            to DWBAStubModel, which cannot be evaluated, are skipped with a
+            warning.
+        cache_dir
+            If given, the built library is stored there as an npz + JSON pair
+            keyed on the loader options and on the path, mtime and size of
+            every scanned CSV (and of the loader sources). A later call with
+            the same key loads the tables from the cache without parsing any
+            CSV. The E_bins tables are cached there as memory-mapped arrays.
+        rebuild_cache
+            Ignore an existing cache entry and rebuild it.
+        load_executor, load_workers
+            How the CSV files are parsed when the library is (re)built:
+            "serial" (default), "thread" (overlaps file I/O, useful on slow
+            or network filesystems) or "process" (parses in parallel), with
+            an optional pool size. Channel order, skipped files and log
+            messages do not depend on the choice.
         """
+        options = {
+            "projectile_species": None if projectile_species is None else list(projectile_species),
+            "target_species": None if target_species is None else list(target_species),
+            "use_inverse_e_extrapolation": use_inverse_e_extrapolation,
+            "inverse_e_high_only": inverse_e_high_only,
+            "combine_mode": combine_mode,
+            "merge_tables": merge_tables,
+            "group2_default_thermalize": group2_default_thermalize,
+            "include_group1": include_group1,
+            "include_group2": include_group2,
+            "group1_tabulated_only": group1_tabulated_only,
+            "product_bins_dir": None if product_bins_dir is None else str(product_bins_dir),
+        }
+        scan = dict(
+            options, load_executor=load_executor, load_workers=load_workers, cache_dir=cache_dir
+        )
+        if cache_dir is None:
+            return cls._scan_directories(base_dir=Path(base_dir), **scan)
+
         base_dir = Path(base_dir)
+        cache_dir = Path(cache_dir)
+        key = _library_cache_key(base_dir, options)
+        if not rebuild_cache:
+            cached = _load_library_cache(cls, base_dir, cache_dir, key)
+            if cached is not None:
+                return cached
+
+        lib = cls._scan_directories(base_dir=base_dir, **scan)
+        _save_library_cache(lib, base_dir, cache_dir, key, options)
+        return lib
+
+    @classmethod
+    def _scan_directories(
+        cls,
+        *,
+        base_dir: Path,
+        projectile_species: Optional[Sequence[str]],
+        target_species: Optional[Sequence[str]],
+        use_inverse_e_extrapolation: bool,
+        inverse_e_high_only: bool,
+        combine_mode: str,
+        merge_tables: bool,
+        group2_default_thermalize: bool,
+        include_group1: bool,
+        include_group2: bool,
+        group1_tabulated_only: bool = False,
+        product_bins_dir: Optional[Union[str, Path]] = None,
+        load_executor: str = "serial",
+        load_workers: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> "ReactionLibrary":
+        """
+        Parse every matching CSV and build the library (no caching).
+        """
         species_registry = SpeciesRegistry()
 
         allowed_projectiles = None
@@ -1118,7 +2061,47 @@ class ReactionLibrary:
 
         reactions: List[ReactionChannel] = []
 
-        for ridx, (key, files) in enumerate(sorted(grouped.items(), key=lambda x: str(x[0]))):
+        channels = sorted(grouped.items(), key=lambda x: str(x[0]))
+
+        product_bins: Dict[Tuple[str, str, Tuple[Tuple[str, int], ...]], Path] = {}
+        if include_group1:
+            product_bins = _product_bins_index(_product_bins_root(base_dir, product_bins_dir))
+
+        if group1_tabulated_only:
+            # Drop stub channels before their CSVs are parsed.
+            kept = []
+            for key, files in channels:
+                group_name, target, projectile, ejectile_stoich, residual = key
+                if group_name == "group1":
+                    products = dict(ejectile_stoich)
+                    stoich_dict_add(products, residual, 1)
+                    if (target, projectile, stoich_dict_to_sorted_tuple(products)) not in product_bins:
+                        log.warning(
+                            "Skipping Group1 channel %s(%s,%s)%s — no FRESCO product bins.",
+                            target, projectile, _stoich_to_compact_label(dict(ejectile_stoich)), residual,
+                        )
+                        continue
+                kept.append((key, files))
+            channels = kept
+
+        # Parse every file up front on the requested pool; results come back
+        # in submission order, so channel order and warnings match a serial scan.
+        jobs = [
+            (fp, key[2], key[1])
+            for key, files in channels
+            for fp in sorted(files)
+        ]
+        loaded = iter(_load_cross_section_tables(
+            jobs,
+            dict(
+                use_inverse_e_extrapolation=use_inverse_e_extrapolation,
+                inverse_e_high_only=inverse_e_high_only,
+            ),
+            executor=load_executor,
+            max_workers=load_workers,
+        ))
+
+        for ridx, (key, files) in enumerate(channels):
             group_name, target, projectile, ejectile_stoich, residual = key
             group_name = group_name.lower()
 
@@ -1139,16 +2122,13 @@ class ReactionLibrary:
             # be parsed (bad column names, angular data, arbitrary units, etc.).
             tables = []
             for fp in sorted(files):
-                try:
-                    tables.append(CrossSectionTable.from_file(
-                        fp,
-                        use_inverse_e_extrapolation=use_inverse_e_extrapolation,
-                        inverse_e_high_only=inverse_e_high_only,
-                        projectile=projectile,
-                        target=target,
-                    ))
-                except (ValueError, FileNotFoundError) as exc:
+                table, exc, records = next(loaded)
+                for record in records:
+                    log.handle(record)
+                if exc is not None:
                     log.warning("Skipping %s: %s", fp.name, exc)
+                else:
+                    tables.append(table)
 
             if not tables:
                 log.warning(
@@ -1157,13 +2137,31 @@ class ReactionLibrary:
                 )
                 continue
 
-            aggregated = AggregatedCrossSection(tables=tables, combine_mode=combine_mode)
+            aggregated = AggregatedCrossSection(
+                tables=tables, combine_mode=combine_mode, merge_tables=merge_tables
+            )
 
             q_value = try_compute_q_value_mev(reactants_stoich, products_stoich)
 
             if group_name == "group1":
                 allow_desc = True
+                e_bins_dir = product_bins.get(
+                    (target, projectile, stoich_dict_to_sorted_tuple(products_stoich))
+                )
                 pdm: Optional[ProductDistributionModel] = DWBAStubModel()
+                if e_bins_dir is not None:
+                    try:
+                        pdm = TabulatedProductDistributionModel.from_e_bins_dir(
+                            e_bins_dir, cache_dir=cache_dir
+                        )
+                    except (OSError, ValueError) as exc:
+                        log.warning("Ignoring FRESCO product bins in %s: %s", e_bins_dir, exc)
+                if group1_tabulated_only and isinstance(pdm, DWBAStubModel):
+                    log.warning(
+                        "Skipping Group1 channel %s(%s,%s)%s — its product bins failed to load.",
+                        target, projectile, ejectile_label, residual,
+                    )
+                    continue
             else:
                 allow_desc = not group2_default_thermalize
                 pdm = DeltaAtThermalModel() if group2_default_thermalize else None
@@ -1197,6 +2195,311 @@ class ReactionLibrary:
         )
 
 
+class _DeferredLogRecords(logging.Filter):
+    """
+    Holds back records logged on this module's logger by threads that have
+    registered a buffer, so pooled loads can replay them in file order.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffers: Dict[int, List[logging.LogRecord]] = {}
+
+    def capture(self) -> List[logging.LogRecord]:
+        buf: List[logging.LogRecord] = []
+        self._buffers[threading.get_ident()] = buf
+        return buf
+
+    def release(self) -> None:
+        self._buffers.pop(threading.get_ident(), None)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        buf = self._buffers.get(record.thread)
+        if buf is None:
+            return True
+        # Format now so the record survives pickling back from a worker process.
+        record.msg, record.args, record.exc_info = record.getMessage(), None, None
+        buf.append(record)
+        return False
+
+
+_DEFERRED_LOG = _DeferredLogRecords()
+log.addFilter(_DEFERRED_LOG)
+
+
+def _load_cross_section_table(job, load_kwargs: Mapping[str, object]):
+    """
+    Parse one file; returns (table, exc, records) where exactly one of table
+    and exc is set and records are the log records emitted while parsing.
+    """
+    path, projectile, target = job
+    records = _DEFERRED_LOG.capture()
+    try:
+        return CrossSectionTable.from_file(
+            path, projectile=projectile, target=target, **load_kwargs
+        ), None, records
+    except (ValueError, FileNotFoundError) as exc:
+        return None, exc, records
+    finally:
+        _DEFERRED_LOG.release()
+
+
+def _load_cross_section_tables(
+    jobs: Sequence[Tuple[Path, str, str]],
+    load_kwargs: Mapping[str, object],
+    executor: str = "serial",
+    max_workers: Optional[int] = None,
+) -> List[Tuple[Optional[CrossSectionTable], Optional[Exception], List[logging.LogRecord]]]:
+    """
+    Parse (path, projectile, target) jobs, returning results in job order.
+    """
+    if executor not in ("serial", "thread", "process"):
+        raise ValueError(
+            f"Unknown load executor '{executor}'; expected 'serial', 'thread' or 'process'."
+        )
+    if executor == "serial" or len(jobs) < 2:
+        return [_load_cross_section_table(job, load_kwargs) for job in jobs]
+
+    pool_cls = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    with pool_cls(max_workers=max_workers) as pool:
+        return list(pool.map(partial(_load_cross_section_table, load_kwargs=load_kwargs), jobs))
+
+
+# =============================================================================
+# Persistent library cache
+# =============================================================================
+
+LIBRARY_CACHE_VERSION = 2
+
+_PRODUCT_MODEL_NAMES = {
+    DeltaAtThermalModel: "delta_at_thermal",
+    DWBAStubModel: "dwba_stub",
+    TabulatedProductDistributionModel: "tabulated",
+}
+_PRODUCT_MODEL_TYPES = {name: typ for typ, name in _PRODUCT_MODEL_NAMES.items()}
+
+_CROSS_SECTION_GROUPS = (("include_group1", "Group1"), ("include_group2", "Group2"))
+
+
+def _product_bins_root(base_dir: Path, product_bins_dir: Optional[Union[str, Path]]) -> Path:
+    if product_bins_dir is None:
+        return base_dir / "fresco_code" / "runs"
+    return base_dir / product_bins_dir
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _library_cache_key(base_dir: Path, options: Mapping[str, object]) -> str:
+    """
+    Hash of everything from_directories() reads: loader options, the path,
+    mtime and size of every CSV in the scanned group directories and of the
+    FRESCO E_bins files matched to Group1 channels, and the loader sources
+    (this module and utils/utils.py, which holds the CM->lab conversion and
+    the mass table).
+    """
+    h = hashlib.sha1()
+    h.update(repr(LIBRARY_CACHE_VERSION).encode())
+    h.update(repr(sorted(options.items())).encode())
+
+    for flag, group in _CROSS_SECTION_GROUPS:
+        xs_dir = base_dir / "data" / "CrossSections" / group
+        if not options[flag] or not xs_dir.exists():
+            continue
+        for path in sorted(xs_dir.glob("*.csv")):
+            h.update(f"{group}/{path.name}:{_file_stamp(path)}".encode())
+
+    if options["include_group1"]:
+        for e_bins_dir in _product_bins_index(
+            _product_bins_root(base_dir, options["product_bins_dir"])
+        ).values():
+            for path in sorted(e_bins_dir.glob("*_Ebins.csv")):
+                h.update(f"{e_bins_dir.parent.name}/{path.name}:{_file_stamp(path)}".encode())
+
+    for source in (Path(__file__), Path(__file__).resolve().parent.parent / "utils" / "utils.py"):
+        if source.exists():
+            h.update(f"{source.name}:{_file_stamp(source)}".encode())
+
+    return h.hexdigest()[:20]
+
+
+def _cache_paths(cache_dir: Path, key: str) -> Tuple[Path, Path]:
+    stem = cache_dir / f"reaction_library_{key}"
+    return stem.with_suffix(".json"), stem.with_suffix(".npz")
+
+
+def _relative_path(path: Optional[Path], base_dir: Path) -> Optional[str]:
+    if path is None:
+        return None
+    try:
+        return str(Path(path).relative_to(base_dir))
+    except ValueError:
+        return str(path)
+
+
+def _save_library_cache(
+    lib: "ReactionLibrary",
+    base_dir: Path,
+    cache_dir: Path,
+    key: str,
+    options: Mapping[str, object],
+) -> None:
+    """
+    Write `lib` as reaction_library_<key>.json (index) + .npz (tables).
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    reactions = []
+    for rxn in lib.reactions:
+        model = rxn.product_distribution_model
+        if model is not None and type(model) not in _PRODUCT_MODEL_NAMES:
+            log.info(
+                "Not caching reaction library: %s uses unsupported product model %s.",
+                rxn.name(), type(model).__name__,
+            )
+            return
+
+        tables = []
+        for tbl in rxn.cross_section.tables:
+            t_key = f"t{len(arrays)}"
+            arrays[t_key + "_E"] = tbl.energy_mev
+            arrays[t_key + "_sigma"] = tbl.sigma_mb
+            if tbl.dsigma_mb is not None:
+                arrays[t_key + "_dsigma"] = tbl.dsigma_mb
+            tables.append({
+                "arrays": t_key,
+                "has_dsigma": tbl.dsigma_mb is not None,
+                "source_file": _relative_path(tbl.source_file, base_dir),
+                "use_inverse_e_extrapolation": tbl.use_inverse_e_extrapolation,
+                "inverse_e_high_only": tbl.inverse_e_high_only,
+                "floor_sigma_mb": tbl.floor_sigma_mb,
+                "is_cm_frame": tbl.is_cm_frame,
+            })
+
+        reactions.append({
+            "reaction_index": rxn.reaction_index,
+            "group": rxn.group,
+            "target": rxn.target,
+            "projectile": rxn.projectile,
+            "ejectile_label": rxn.ejectile_label,
+            "residual": rxn.residual,
+            "reactants_stoich": rxn.reactants_stoich,
+            "products_stoich": rxn.products_stoich,
+            "combine_mode": rxn.cross_section.combine_mode,
+            "merge_tables": rxn.cross_section.merge_tables,
+            "tables": tables,
+            "q_value_mev": rxn.q_value_mev,
+            "threshold_mev": rxn.threshold_mev,
+            "product_distribution_model": None if model is None else _PRODUCT_MODEL_NAMES[type(model)],
+            "product_bins_dir": _relative_path(getattr(model, "source_dir", None), base_dir),
+            "allow_nonthermal_descendants": rxn.allow_nonthermal_descendants,
+            "source_files": [_relative_path(fp, base_dir) for fp in rxn.source_files],
+        })
+
+    index = {
+        "version": LIBRARY_CACHE_VERSION,
+        "key": key,
+        "options": dict(options),
+        "species": lib.species_registry.as_list(),
+        "reactions": reactions,
+    }
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    json_path, npz_path = _cache_paths(cache_dir, key)
+    # Write the arrays first and the index last, each through a rename, so a
+    # reader never sees an index without its tables.
+    tmp = npz_path.with_name(npz_path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    tmp.replace(npz_path)
+    tmp = json_path.with_name(json_path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(index, f)
+    tmp.replace(json_path)
+    log.info("Reaction library cached to %s", json_path)
+
+
+def _load_library_cache(
+    cls,
+    base_dir: Path,
+    cache_dir: Path,
+    key: str,
+) -> Optional["ReactionLibrary"]:
+    """
+    Rebuild a library from its cache entry; None if there is no valid entry.
+    """
+    json_path, npz_path = _cache_paths(cache_dir, key)
+    if not (json_path.exists() and npz_path.exists()):
+        return None
+
+    try:
+        with open(json_path) as f:
+            index = json.load(f)
+        if index.get("version") != LIBRARY_CACHE_VERSION or index.get("key") != key:
+            return None
+
+        def resolve(rel: Optional[str]) -> Optional[Path]:
+            return None if rel is None else base_dir / rel
+
+        reactions: List[ReactionChannel] = []
+        with np.load(npz_path) as arrays:
+            for entry in index["reactions"]:
+                tables = [
+                    CrossSectionTable(
+                        energy_mev=arrays[t["arrays"] + "_E"],
+                        sigma_mb=arrays[t["arrays"] + "_sigma"],
+                        dsigma_mb=arrays[t["arrays"] + "_dsigma"] if t["has_dsigma"] else None,
+                        source_file=resolve(t["source_file"]),
+                        use_inverse_e_extrapolation=t["use_inverse_e_extrapolation"],
+                        inverse_e_high_only=t["inverse_e_high_only"],
+                        floor_sigma_mb=t["floor_sigma_mb"],
+                        is_cm_frame=t["is_cm_frame"],
+                    )
+                    for t in entry["tables"]
+                ]
+                model_name = entry["product_distribution_model"]
+                if model_name == "tabulated":
+                    model = TabulatedProductDistributionModel.from_e_bins_dir(
+                        resolve(entry["product_bins_dir"]), cache_dir=cache_dir
+                    )
+                elif model_name is not None:
+                    model = _PRODUCT_MODEL_TYPES[model_name]()
+                else:
+                    model = None
+                reactions.append(
+                    ReactionChannel(
+                        reaction_index=entry["reaction_index"],
+                        group=entry["group"],
+                        target=entry["target"],
+                        projectile=entry["projectile"],
+                        ejectile_label=entry["ejectile_label"],
+                        residual=entry["residual"],
+                        reactants_stoich=dict(entry["reactants_stoich"]),
+                        products_stoich=dict(entry["products_stoich"]),
+                        cross_section=AggregatedCrossSection(
+                            tables=tables,
+                            combine_mode=entry["combine_mode"],
+                            merge_tables=entry["merge_tables"],
+                        ),
+                        q_value_mev=entry["q_value_mev"],
+                        threshold_mev=entry["threshold_mev"],
+                        metadata={},
+                        product_distribution_model=model,
+                        allow_nonthermal_descendants=entry["allow_nonthermal_descendants"],
+                        source_files=[resolve(fp) for fp in entry["source_files"]],
+                    )
+                )
+    except (OSError, KeyError, ValueError) as exc:
+        log.warning("Ignoring unreadable reaction library cache %s: %s", json_path, exc)
+        return None
+
+    species_registry = SpeciesRegistry()
+    species_registry.add_many(index["species"])
+    log.info("Loaded reaction library from cache %s", json_path)
+    return cls(species_registry=species_registry, reactions=reactions)
+
+
 # =============================================================================
 # Helper conversions
 # =============================================================================
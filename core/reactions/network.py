@@ -30,7 +30,7 @@ class ReactionNetwork:
         - scalability to large networks
     """
 
-    def __init__(self, isotopes, reactions):
+    def __init__(self, isotopes, reactions, batch_rate_func=None):
         """
         Parameters
         ----------
@@ -41,10 +41,19 @@ class ReactionNetwork:
 
         reactions : list of Reaction
             List of Reaction objects defining the network topology.
+
+        batch_rate_func : callable, optional
+            Function returning all rate coefficients λ(T) at once,
+
+                lam = batch_rate_func(state)   # shape (M,), reaction order
+
+            e.g. a vectorized NACRE/CF88 table lookup. If omitted, each
+            Reaction.rate(state) is called in turn.
         """
 
         self.isotopes = isotopes
         self.reactions = reactions
+        self.batch_rate_func = batch_rate_func
 
         # Number of species and reactions
         self.N = len(isotopes)
@@ -53,6 +62,9 @@ class ReactionNetwork:
         # Build the stoichiometry matrix once at initialization
         self.S = self._build_stoichiometry()
 
+        # Reactant index / exponent arrays and two-body (density factor) mask
+        self._compile_reactants()
+
     def _build_stoichiometry(self):
         """
         Construct the stoichiometry matrix S.
@@ -80,44 +92,94 @@ class ReactionNetwork:
 
         return S
 
-    def reaction_fluxes(self, state):
+    def _compile_reactants(self):
         """
-        Compute reaction flux vector R for the current state.
+        Compile the reactant lists into fixed-width NumPy arrays.
 
-        Uses:
-            λ(T) = <σv> from reaction.rate(state)
-            Includes density factors for multi-body reactions.
+        Row r of `_reactant_idx` / `_reactant_nu` holds the reactant species
+        of reaction r and their exponents, padded with exponent 0 (Y^0 = 1).
+        `_two_body` marks the reactions that carry the density factor ρ N_A;
+        reactions with no reactants or more than two are flagged in
+        `_unsupported` and rejected when rates are evaluated.
         """
 
-        R = np.zeros(self.M)
+        width = max((len(rxn.reactants) for rxn in self.reactions), default=1)
+        width = max(width, 1)
+
+        idx = np.zeros((self.M, width), dtype=np.intp)
+        nu = np.zeros((self.M, width), dtype=float)
+        n_bodies = np.zeros(self.M, dtype=int)
 
         for r, rxn in enumerate(self.reactions):
+            for a, (i, n) in enumerate(rxn.reactants):
+                idx[r, a] = i
+                nu[r, a] = n
+            n_bodies[r] = sum(n for _, n in rxn.reactants)
+
+        self._reactant_idx = idx
+        self._reactant_nu = nu
+        self._n_bodies = n_bodies
+        self._two_body = n_bodies == 2
+        self._unsupported = np.flatnonzero((n_bodies < 1) | (n_bodies > 2))
+
+    def _rates(self, state):
+        """
+        Rate coefficients λ(T) for all reactions, shape (M,).
+        """
 
-        # Bare nuclear rate coefficient <σv>
-            lam = rxn.rate(state)
+        if self.batch_rate_func is not None:
+            lam = np.asarray(self.batch_rate_func(state), dtype=float)
+            if lam.shape != (self.M,):
+                raise ValueError(
+                    f"batch_rate_func returned shape {lam.shape}; expected {(self.M,)}.")
+            return lam
 
-        # Multiply by abundance factors
-            abundance_factor = 1.0
-            for i, nu in rxn.reactants:
-                abundance_factor *= state.Y[i] ** nu
-
-        # Determine number of reacting bodies
-            n_reactants = sum(nu for _, nu in rxn.reactants)
-
-        # Apply density factors:
-        # 1-body decay: no rho
-        # 2-body reaction: rho * N_A
-            if n_reactants == 1:
-                density_factor = 1.0
-            elif n_reactants == 2:
-                density_factor = state.rho * 6.02214076e23  # N_A
-            else:
+        return np.fromiter(
+            (rxn.rate(state) for rxn in self.reactions),
+            dtype=float,
+            count=self.M,
+        )
+
+    def _rate_coefficients(self, state):
+        """
+        Return the per-reaction factors density_factor * λ(T), so that
+
+            R_r = coefficient_r * Π_i Y_i^{ν_i}.
+
+        1-body decays carry no density factor, 2-body reactions ρ N_A.
+        """
+
+        if self._unsupported.size:
+            r = self._unsupported[0]
+            if self._n_bodies[r] < 1:
                 raise NotImplementedError(
-                    "Reactions with more than 2 reactants not yet supported.")
+                    f"Reaction {r} has no reactants; only 1- and 2-body reactions are supported.")
+            raise NotImplementedError(
+                "Reactions with more than 2 reactants not yet supported.")
+
+        rates = self._rates(state)
+        if not self._two_body.any():
+            return rates
+        return np.where(self._two_body, state.rho * 6.02214076e23, 1.0) * rates  # N_A
+
+    def reaction_fluxes(self, state):
+        """
+        Compute reaction flux vector R for the current state.
+
+        Uses:
+            λ(T) = <σv> from reaction.rate(state) (or batch_rate_func)
+            Includes density factors for multi-body reactions.
 
-            R[r] = density_factor * lam * abundance_factor
+        Evaluated as
+
+            R = density * λ * Π_a Y[idx[:, a]] ** ν[:, a]
+
+        on the arrays compiled at construction.
+        """
 
-        return R
+        Y = np.asarray(state.Y, dtype=float)
+        abundance_factor = np.prod(Y[self._reactant_idx] ** self._reactant_nu, axis=1)
+        return self._rate_coefficients(state) * abundance_factor
 
 
     def change_in_abund(self, state):
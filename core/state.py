@@ -90,6 +90,8 @@ class CloudState:
 
     def __post_init__(self) -> None:
         self.Y = np.asarray(self.Y, dtype=float)
+        self._index: Dict[str, int] = {}
+        self._indexed: Optional[tuple] = None
         self.validate()
 
     def validate(self) -> None:
@@ -111,10 +113,19 @@ class CloudState:
     def n_species(self) -> int:
         return len(self.species)
 
+    def _species_lookup(self) -> Dict[str, int]:
+        # name -> index, rebuilt when the species list is replaced or resized.
+        if self._indexed is None or self._indexed[0] is not self.species or self._indexed[1] != len(self.species):
+            self._index = {}
+            for i, sp in enumerate(self.species):
+                self._index.setdefault(sp, i)
+            self._indexed = (self.species, len(self.species))
+        return self._index
+
     def species_index(self, name: str) -> int:
         try:
-            return self.species.index(name)
-        except ValueError as exc:
+            return self._species_lookup()[name]
+        except KeyError as exc:
             raise KeyError(f"Species '{name}' not found in cloud state.") from exc
 
     def get_abundance(self, name: str) -> float:
@@ -16,7 +16,7 @@ This module follows Famiano's discrete formalism:
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
@@ -68,19 +68,20 @@ def bin_average_cross_section(
     -------
     np.ndarray, shape (n_bins,)
         Bin-averaged cross section values.
+
+    Notes
+    -----
+    sigma_func is called once on all n_bins * n_sub sample points. For
+    tabulated data, reactions.PiecewiseCrossSection.bin_average gives the
+    exact averages instead.
     """
     E_edges = np.asarray(E_edges, dtype=float)
     n_bins = len(E_edges) - 1
-    out = np.zeros(n_bins, dtype=float)
 
-    for k in range(n_bins):
-        E_lo = E_edges[k]
-        E_hi = E_edges[k + 1]
-        E_sample = np.linspace(E_lo, E_hi, n_sub + 2)[1:-1]
-        vals = np.asarray(sigma_func(E_sample, **sigma_kwargs), dtype=float)
-        out[k] = np.mean(vals)
-
-    return out
+    frac = np.linspace(0.0, 1.0, n_sub + 2)[1:-1]
+    E_sample = E_edges[:-1, None] + np.diff(E_edges)[:, None] * frac[None, :]
+    vals = np.asarray(sigma_func(E_sample.ravel(), **sigma_kwargs), dtype=float)
+    return vals.reshape(n_bins, n_sub).mean(axis=1)
 
 
 # ---------------------------------------------------------------------
@@ -189,6 +190,83 @@ def compute_survival_table(
     return S
 
 
+def compute_destruction_ratio(
+    epsilon_bin: np.ndarray,
+    sigma_bin: np.ndarray,
+    target_densities: np.ndarray,
+    E_edges: np.ndarray,
+) -> np.ndarray:
+    """
+    Per-bin destruction probability for a projectile that enters bin k:
+
+        r_k = min(Lambda_k * dE_k / epsilon_k, 1)
+
+    This is the same clipped quantity used by the downward march in
+    compute_survival_table(), i.e. S_{k-1} = S_k * (1 - r_k).
+
+    Returns
+    -------
+    np.ndarray, shape (n_bins,)
+    """
+    epsilon_bin = np.asarray(epsilon_bin, dtype=float)
+    dE = bin_widths_from_edges(E_edges)
+
+    n_bins = len(dE)
+    if epsilon_bin.shape != (n_bins,):
+        raise ValueError("epsilon_bin must have shape (n_bins,).")
+
+    Lambda = compute_total_destruction_coefficient(sigma_bin, target_densities)
+    ratio = Lambda / np.maximum(epsilon_bin, 1e-300) * dE
+    return np.clip(ratio, 0.0, 1.0)
+
+
+def compute_survival_matrix(
+    epsilon_bin: np.ndarray,
+    sigma_bin: np.ndarray,
+    target_densities: np.ndarray,
+    E_edges: np.ndarray,
+) -> np.ndarray:
+    """
+    Cumulative survival fractions for every injection bin at once.
+
+    Row n of the result equals compute_survival_table(..., initial_bin=n):
+
+        S[n, k] = prod_{j=k+1}^{n} (1 - r_j)    for k <= n
+        S[n, k] = 0                             for k > n
+
+    The product is evaluated in closed form from one cumulative sum of
+    log(1 - r_j), so the cost is a handful of (n_bins, n_bins) array
+    operations instead of one Python loop per injection bin.
+
+    Returns
+    -------
+    np.ndarray, shape (n_inj, n_bins) with n_inj == n_bins
+    """
+    ratio = compute_destruction_ratio(epsilon_bin, sigma_bin, target_densities, E_edges)
+    return _survival_from_ratio(ratio)
+
+
+def _survival_from_ratio(ratio: np.ndarray) -> np.ndarray:
+    """
+    Closed-form S[..., n, k] from destruction ratios r[..., j]; any leading
+    (batch) dimensions of `ratio` are carried through.
+    """
+    # Bins with r_j = 1 absorb everything; track them separately so the
+    # log-sum never has to carry -inf.
+    blocked = ratio >= 1.0
+    log_f = np.log1p(-np.where(blocked, 0.0, ratio))
+
+    C = np.cumsum(log_f, axis=-1)
+    n_blocked = np.cumsum(blocked, axis=-1)
+
+    # exponent[n, k] = sum_{j=k+1}^{n} log(1 - r_j)
+    exponent = C[..., :, None] - C[..., None, :]
+    open_path = n_blocked[..., :, None] == n_blocked[..., None, :]
+    lower = np.tri(ratio.shape[-1], dtype=bool)
+
+    return np.where(lower & open_path, np.exp(np.minimum(exponent, 0.0)), 0.0)
+
+
 def compute_delta_survival(S: np.ndarray) -> np.ndarray:
     """
     Compute Delta S_k, the destruction fraction in each energy bin.
@@ -280,6 +358,141 @@ def compute_beta(
     return beta
 
 
+# ---------------------------------------------------------------------
+# Structured product-energy tensor
+# ---------------------------------------------------------------------
+
+class BandedTau:
+    """
+    tau_pq^(i,k) stored per (reaction, product) block as a band of product
+    bins instead of a dense (n_rxn, n_proj_bins, n_products, n_prod_bins)
+    array.
+
+    Block (i, p) is (first_bin, weights) with weights of shape
+    (n_proj_bins, width): projectile bin k deposits weights[k, j] into
+    product bin first_bin + j. A delta at the thermal bin is first_bin = 0,
+    width = 1; a dense block has width = n_prod_bins. Blocks that are absent
+    are zero. Memory is O(n_rxn * n_proj_bins * width) per block, i.e.
+    O(n_rxn * n_bins) for delta-like products.
+
+    Blocks of equal width are stacked so that contract() is one einsum and
+    one indexed add per distinct width.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, int, int, int],
+        blocks: Dict[Tuple[int, int], Tuple[int, np.ndarray]],
+    ) -> None:
+        self.shape = tuple(int(n) for n in shape)
+        n_rxn, n_proj_bins, n_products, n_prod_bins = self.shape
+
+        by_width: Dict[int, list] = {}
+        for (i_rxn, p_idx), (first_bin, weights) in sorted(blocks.items()):
+            weights = np.asarray(weights, dtype=float)
+            if weights.ndim != 2 or weights.shape[0] != n_proj_bins:
+                raise ValueError(
+                    f"tau block ({i_rxn}, {p_idx}) must have shape (n_proj_bins, width)."
+                )
+            if not (0 <= first_bin and first_bin + weights.shape[1] <= n_prod_bins):
+                raise ValueError(f"tau block ({i_rxn}, {p_idx}) extends past the product grid.")
+            if not (0 <= i_rxn < n_rxn and 0 <= p_idx < n_products):
+                raise ValueError(f"tau block ({i_rxn}, {p_idx}) lies outside shape {self.shape}.")
+            by_width.setdefault(weights.shape[1], []).append((i_rxn, p_idx, first_bin, weights))
+
+        # width -> (rxn idx (g,), product idx (g,), product-bin idx (g, width), weights (g, n_proj, width))
+        self._groups: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+        for width, members in by_width.items():
+            rxn = np.array([m[0] for m in members], dtype=int)
+            prod = np.array([m[1] for m in members], dtype=int)
+            cols = np.array([m[2] for m in members], dtype=int)[:, None] + np.arange(width)
+            weights = np.stack([m[3] for m in members])
+            for arr in (rxn, prod, cols, weights):
+                arr.setflags(write=False)
+            self._groups[width] = (rxn, prod, cols, weights)
+
+        totals = np.zeros((n_rxn, n_proj_bins, n_products), dtype=float)
+        for rxn, prod, _, weights in self._groups.values():
+            totals[rxn, :, prod] = weights.sum(axis=-1)
+        totals.setflags(write=False)
+        self._totals = totals
+
+    @classmethod
+    def from_dense(cls, tau: np.ndarray) -> "BandedTau":
+        """
+        Band representation of a dense tau, trimmed to the non-zero product
+        bins of each block.
+        """
+        tau = np.asarray(tau, dtype=float)
+        if tau.ndim != 4:
+            raise ValueError("tau must have shape (n_rxn, n_proj_bins, n_products, n_prod_bins).")
+        blocks = {}
+        for i_rxn, p_idx in zip(*np.nonzero(np.any(tau != 0.0, axis=(1, 3)))):
+            block = tau[i_rxn, :, p_idx, :]
+            cols = np.flatnonzero(np.any(block != 0.0, axis=0))
+            blocks[(int(i_rxn), int(p_idx))] = (int(cols[0]), block[:, cols[0]:cols[-1] + 1])
+        return cls(tau.shape, blocks)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(arr.nbytes for group in self._groups.values() for arr in group)
+
+    @property
+    def totals(self) -> np.ndarray:
+        """
+        sum_q tau_pq^(i,k), shape (n_rxn, n_proj_bins, n_products): products
+        of species p per event of reaction i in projectile bin k.
+        """
+        return self._totals
+
+    def todense(self) -> np.ndarray:
+        tau = np.zeros(self.shape, dtype=float)
+        for rxn, prod, cols, weights in self._groups.values():
+            tau[rxn[:, None, None], np.arange(self.shape[1])[None, :, None],
+                prod[:, None, None], cols[:, None, :]] = weights
+        return tau
+
+    def contract(self, factor: np.ndarray) -> np.ndarray:
+        """
+        spectra[..., i, p, q] = sum_k factor[..., i, k] * tau_pq^(i,k)
+
+        factor has shape (..., n_rxn, n_proj_bins); the result has shape
+        (..., n_rxn, n_products, n_prod_bins).
+        """
+        factor = np.asarray(factor, dtype=float)
+        n_rxn, n_proj_bins, n_products, n_prod_bins = self.shape
+        if factor.shape[-2:] != (n_rxn, n_proj_bins):
+            raise ValueError("factor must have shape (..., n_rxn, n_proj_bins).")
+
+        out = np.zeros(factor.shape[:-2] + (n_rxn, n_products, n_prod_bins), dtype=float)
+        for rxn, prod, cols, weights in self._groups.values():
+            # Each (rxn, prod) pair appears once, so the indexed add has no
+            # repeated targets.
+            out[..., rxn[:, None], prod[:, None], cols] += np.einsum(
+                "...gk,gkw->...gw", factor[..., rxn, :], weights
+            )
+        return out
+
+    def project(self, p_idx: int, weights_rxn_bin: np.ndarray) -> np.ndarray:
+        """
+        B[k, q] = sum_i weights_rxn_bin[i, k] * tau_pq^(i,k) for one product
+        species p; shape (n_proj_bins, n_prod_bins).
+        """
+        n_rxn, n_proj_bins, _, n_prod_bins = self.shape
+        w = np.asarray(weights_rxn_bin, dtype=float)
+        if w.shape != (n_rxn, n_proj_bins):
+            raise ValueError("weights_rxn_bin must have shape (n_rxn, n_proj_bins).")
+
+        out = np.zeros((n_proj_bins, n_prod_bins), dtype=float)
+        for rxn, prod, cols, weights in self._groups.values():
+            sel = np.flatnonzero(prod == p_idx)
+            if sel.size == 0:
+                continue
+            contrib = w[rxn[sel], :, None] * weights[sel]           # (g, n_proj, width)
+            np.add.at(out, (slice(None), cols[sel]), np.swapaxes(contrib, 0, 1))
+        return out
+
+
 # ---------------------------------------------------------------------
 # Discrete yield tensor
 # ---------------------------------------------------------------------
@@ -299,6 +512,9 @@ def compute_discrete_yield(
     compute_survival_table(), this reduces to:
         y_pq^(i,n) = tau_pq^(i,k) * beta_k^i * DeltaS_k
 
+    Reference form: the cascade uses compute_contracted_yield(), which is
+    this tensor summed over projectile bins (tests/test_survival.py).
+
     Parameters
     ----------
     tau : array, shape (n_rxn, n_proj_bins, n_products, n_prod_bins)
@@ -337,6 +553,68 @@ def compute_discrete_yield(
     return y
 
 
+def compute_contracted_yield(
+    tau: np.ndarray,
+    beta_rxn_bin: np.ndarray,
+    deltaS_bin: np.ndarray,
+):
+    """
+    Contract Famiano's discrete yield over projectile bins without building
+    the full yield tensor:
+
+        events_i        = sum_k beta_k^i * DeltaS_k
+        spectra_i,p,q   = sum_k beta_k^i * DeltaS_k * tau_pq^(i,k)
+
+    Because the yield is linear in DeltaS, `deltaS_bin` may be the
+    spectrum-weighted sum over injection bins,
+        DeltaS_k = sum_n N_n * DeltaS[n, k],
+    so one call covers a whole projectile spectrum.
+
+    Parameters
+    ----------
+    tau : array, shape (n_rxn, n_proj_bins, n_products, n_prod_bins), or BandedTau
+    beta_rxn_bin : array, shape (n_rxn, n_proj_bins)
+    deltaS_bin : array, shape (n_proj_bins,)
+
+    Returns
+    -------
+    events : np.ndarray, shape (n_rxn,)
+        Expected number of reaction events per channel.
+    spectra : np.ndarray, shape (n_rxn, n_products, n_prod_bins)
+        Product-energy spectra per channel, summed over projectile bins.
+        Multiplicities carried by tau are included.
+    """
+    if not isinstance(tau, BandedTau):
+        tau = np.asarray(tau, dtype=float)
+    beta_rxn_bin = np.asarray(beta_rxn_bin, dtype=float)
+    deltaS_bin = np.asarray(deltaS_bin, dtype=float)
+
+    if len(tau.shape) != 4:
+        raise ValueError(
+            "tau must have shape (n_rxn, n_proj_bins, n_products, n_prod_bins)."
+        )
+
+    n_rxn, n_proj_bins, _, _ = tau.shape
+
+    if beta_rxn_bin.shape != (n_rxn, n_proj_bins):
+        raise ValueError("beta_rxn_bin must have shape (n_rxn, n_proj_bins).")
+    if deltaS_bin.shape != (n_proj_bins,):
+        raise ValueError("deltaS_bin must have shape (n_proj_bins,).")
+
+    n_products, n_prod_bins = tau.shape[2], tau.shape[3]
+
+    factor = beta_rxn_bin * deltaS_bin[None, :]
+    events = np.sum(factor, axis=1)
+
+    if isinstance(tau, BandedTau):
+        return events, tau.contract(factor)
+
+    # Batched (1, n_proj_bins) @ (n_proj_bins, n_products * n_prod_bins)
+    # product per reaction; tau is only reshaped, never scaled.
+    spectra = factor[:, None, :] @ tau.reshape(n_rxn, n_proj_bins, n_products * n_prod_bins)
+    return events, spectra.reshape(n_rxn, n_products, n_prod_bins)
+
+
 # ---------------------------------------------------------------------
 # Convenience wrapper
 # ---------------------------------------------------------------------
@@ -353,6 +631,10 @@ def build_survival_and_yield(
     Convenience wrapper returning all key discrete quantities:
     S, DeltaS, beta, y
 
+    Reference form for one injection bin: the cascade uses
+    build_survival_matrices(), whose row n matches this with
+    initial_bin=n (tests/test_survival.py).
+
     Returns
     -------
     dict
@@ -419,4 +701,156 @@ def build_survival_and_yield(
         "beta": beta_rxn_bin,
         "yield": y,
         "s_thermalized": s_thermalized,
-    }
\ No newline at end of file
+    }
+
+
+def build_survival_matrices(
+    epsilon_bin: np.ndarray,
+    sigma_bin: np.ndarray,
+    target_densities: np.ndarray,
+    E_edges: np.ndarray,
+):
+    """
+    Batched counterpart of build_survival_and_yield() covering every
+    injection bin at once.
+
+    Returns
+    -------
+    dict
+        {
+            "S": (n_inj, n_bins) cumulative survival fractions, row n for a
+                 projectile injected into bin n,
+            "deltaS": (n_inj, n_bins) per-bin nuclear destruction fractions,
+                      using the same bin-0 correction as
+                      build_survival_and_yield(),
+            "beta": (n_rxn, n_bins) destruction fractions by reaction,
+            "s_thermalized": (n_inj,) fraction that survives to below-grid
+                             energies without reacting,
+        }
+
+    Notes
+    -----
+    Rows of "deltaS" are evaluated directly as S[n, k] * r_k rather than as
+    differences of neighbouring S values, which avoids cancellation when the
+    cloud is optically thin (r_k << 1). No yield tensor is built here.
+    """
+    ratio = compute_destruction_ratio(epsilon_bin, sigma_bin, target_densities, E_edges)
+    S = _survival_from_ratio(ratio)
+
+    deltaS = S * ratio[None, :]
+    s_thermalized = S[:, 0] - deltaS[:, 0]
+
+    return {
+        "S": S,
+        "deltaS": deltaS,
+        "beta": compute_beta(sigma_bin, target_densities),
+        "s_thermalized": s_thermalized,
+    }
+
+
+def build_survival_matrices_batch(
+    epsilon_bin: np.ndarray,
+    sigma_bin: np.ndarray,
+    target_densities: np.ndarray,
+    E_edges: np.ndarray,
+):
+    """
+    build_survival_matrices() for a batch of clouds sharing one set of
+    cross sections.
+
+    Parameters
+    ----------
+    epsilon_bin : array, shape (n_batch, n_bins)
+    sigma_bin : array, shape (n_rxn, n_bins)
+        Shared by every cloud in the batch.
+    target_densities : array, shape (n_batch, n_rxn)
+    E_edges : array, shape (n_bins + 1,)
+
+    Returns
+    -------
+    dict
+        Same keys as build_survival_matrices(), each with a leading
+        n_batch axis: S and deltaS (n_batch, n_inj, n_bins), beta
+        (n_batch, n_rxn, n_bins), s_thermalized (n_batch, n_inj).
+    """
+    epsilon_bin = np.asarray(epsilon_bin, dtype=float)
+    sigma_bin = np.asarray(sigma_bin, dtype=float)
+    target_densities = np.asarray(target_densities, dtype=float)
+    dE = bin_widths_from_edges(E_edges)
+
+    if sigma_bin.ndim != 2:
+        raise ValueError("sigma_bin must have shape (n_rxn, n_bins).")
+    n_rxn, n_bins = sigma_bin.shape
+    if epsilon_bin.ndim != 2 or epsilon_bin.shape[1] != n_bins:
+        raise ValueError("epsilon_bin must have shape (n_batch, n_bins).")
+    if target_densities.shape != (epsilon_bin.shape[0], n_rxn):
+        raise ValueError("target_densities must have shape (n_batch, n_rxn).")
+    if dE.shape != (n_bins,):
+        raise ValueError("E_edges must define n_bins bins.")
+
+    numer = target_densities[:, :, None] * sigma_bin[None, :, :]
+    Lambda = np.sum(numer, axis=1)
+    ratio = np.clip(Lambda / np.maximum(epsilon_bin, 1e-300) * dE, 0.0, 1.0)
+
+    S = _survival_from_ratio(ratio)
+    deltaS = S * ratio[:, None, :]
+
+    denom = Lambda[:, None, :]
+    beta = np.divide(numer, denom, out=np.zeros_like(numer), where=denom > 0.0)
+
+    return {
+        "S": S,
+        "deltaS": deltaS,
+        "beta": beta,
+        "s_thermalized": S[:, :, 0] - deltaS[:, :, 0],
+    }
+
+
+def compute_contracted_yield_batch(
+    tau: np.ndarray,
+    beta_rxn_bin: np.ndarray,
+    deltaS_bin: np.ndarray,
+):
+    """
+    compute_contracted_yield() for a batch of clouds sharing one tau tensor.
+
+    Parameters
+    ----------
+    tau : array, shape (n_rxn, n_proj_bins, n_products, n_prod_bins), or BandedTau
+    beta_rxn_bin : array, shape (n_batch, n_rxn, n_proj_bins)
+    deltaS_bin : array, shape (n_batch, n_proj_bins)
+
+    Returns
+    -------
+    events : np.ndarray, shape (n_batch, n_rxn)
+    spectra : np.ndarray, shape (n_batch, n_rxn, n_products, n_prod_bins)
+    """
+    if not isinstance(tau, BandedTau):
+        tau = np.asarray(tau, dtype=float)
+    beta_rxn_bin = np.asarray(beta_rxn_bin, dtype=float)
+    deltaS_bin = np.asarray(deltaS_bin, dtype=float)
+
+    if len(tau.shape) != 4:
+        raise ValueError(
+            "tau must have shape (n_rxn, n_proj_bins, n_products, n_prod_bins)."
+        )
+
+    n_rxn, n_proj_bins, n_products, n_prod_bins = tau.shape
+
+    if beta_rxn_bin.ndim != 3 or beta_rxn_bin.shape[1:] != (n_rxn, n_proj_bins):
+        raise ValueError("beta_rxn_bin must have shape (n_batch, n_rxn, n_proj_bins).")
+    n_batch = beta_rxn_bin.shape[0]
+    if deltaS_bin.shape != (n_batch, n_proj_bins):
+        raise ValueError("deltaS_bin must have shape (n_batch, n_proj_bins).")
+
+    factor = beta_rxn_bin * deltaS_bin[:, None, :]
+    events = np.sum(factor, axis=2)
+
+    if isinstance(tau, BandedTau):
+        return events, tau.contract(factor)
+
+    # Per reaction: (n_batch, n_proj_bins) @ (n_proj_bins, n_products * n_prod_bins);
+    # the shared tau is only reshaped.
+    spectra = np.swapaxes(factor, 0, 1) @ tau.reshape(n_rxn, n_proj_bins, n_products * n_prod_bins)
+    spectra = np.swapaxes(spectra, 0, 1)
+    return events, spectra.reshape(n_batch, n_rxn, n_products, n_prod_bins)
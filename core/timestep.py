@@ -172,6 +172,84 @@ def compute_next_dt(
     return _clip_dt(dt_next, dt_min=dt_min, dt_max=dt_max)
 
 
+def compute_next_dt_batch(
+    y_new: np.ndarray,
+    delta_y: np.ndarray,
+    dt_current: np.ndarray | float,
+    gamma: float = DEFAULT_GAMMA,
+    abs_floor: float = DEFAULT_ABS_FLOOR,
+    rel_floor: float = DEFAULT_REL_FLOOR,
+    dt_min: Optional[float] = None,
+    dt_max: Optional[float] = None,
+    max_growth: Optional[float] = 5.0,
+) -> np.ndarray:
+    """
+    compute_next_dt() for a batch of independent abundance vectors.
+
+    Parameters
+    ----------
+    y_new, delta_y
+        Arrays of shape (n_batch, n_species).
+    dt_current
+        Current timestep of each member, shape (n_batch,) or a scalar.
+
+    Returns
+    -------
+    np.ndarray, shape (n_batch,)
+        Next timestep of each member; row b equals
+        compute_next_dt(y_new[b], delta_y[b], dt_current[b], ...).
+    """
+    y_new = np.asarray(y_new, dtype=float)
+    delta_y = np.asarray(delta_y, dtype=float)
+
+    if y_new.ndim != 2:
+        raise ValueError(f"y_new must be a 2D array, got shape {y_new.shape}")
+    if y_new.shape != delta_y.shape:
+        raise ValueError(
+            f"Shape mismatch: y_new has shape {y_new.shape}, "
+            f"delta_y has shape {delta_y.shape}"
+        )
+    if not (np.all(np.isfinite(y_new)) and np.all(np.isfinite(delta_y))):
+        raise ValueError("y_new and delta_y must be finite")
+
+    dt_current = np.broadcast_to(np.asarray(dt_current, dtype=float), (y_new.shape[0],))
+    if not np.all(np.isfinite(dt_current)) or np.any(dt_current <= 0.0):
+        raise ValueError("dt_current must be positive and finite")
+
+    if not np.isfinite(gamma) or gamma <= 0.0:
+        raise ValueError("gamma must be a positive finite float")
+
+    if abs_floor <= 0.0 or rel_floor < 0.0:
+        raise ValueError("abs_floor must be > 0 and rel_floor must be >= 0")
+
+    y_abs = np.abs(y_new)
+    d_abs = np.abs(delta_y)
+    valid = (y_abs > rel_floor) & (d_abs > abs_floor)
+
+    ratios = np.where(valid, y_abs / np.where(valid, d_abs, 1.0), np.inf)
+    ratio_min = np.min(ratios, axis=1)
+    # Members with nothing meaningful changing keep their timestep.
+    dt_next = np.where(np.isfinite(ratio_min), gamma * dt_current * ratio_min, dt_current)
+
+    if max_growth is not None:
+        if max_growth <= 1.0:
+            raise ValueError("max_growth must be > 1 if provided")
+        dt_next = np.minimum(dt_next, max_growth * dt_current)
+
+    if not np.all(np.isfinite(dt_next)) or np.any(dt_next <= 0.0):
+        raise ValueError(f"Computed timestep is invalid: {dt_next}")
+    if dt_min is not None:
+        if dt_min <= 0.0:
+            raise ValueError("dt_min must be positive")
+        dt_next = np.maximum(dt_next, dt_min)
+    if dt_max is not None:
+        if dt_max <= 0.0:
+            raise ValueError("dt_max must be positive")
+        dt_next = np.minimum(dt_next, dt_max)
+
+    return dt_next
+
+
 def estimate_initial_dt(
     y0: np.ndarray | list | tuple,
     dydt0: np.ndarray | list | tuple,
@@ -283,4 +361,36 @@ def euler_increment(
         y_new = np.maximum(y_new, 0.0)
         delta_y = y_new - y
 
-    return y_new, delta_y
\ No newline at end of file
+    return y_new, delta_y
+
+
+def euler_increment_batch(
+    y: np.ndarray,
+    dydt: np.ndarray,
+    dt: np.ndarray | float,
+    enforce_nonnegative: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    euler_increment() for a batch: y and dydt have shape
+    (n_batch, n_species), dt is one timestep per member or a scalar.
+    """
+    y = np.asarray(y, dtype=float)
+    dydt = np.asarray(dydt, dtype=float)
+
+    if y.ndim != 2 or y.shape != dydt.shape:
+        raise ValueError(
+            f"y and dydt must be 2D arrays of equal shape, got {y.shape} and {dydt.shape}"
+        )
+
+    dt = np.broadcast_to(np.asarray(dt, dtype=float), (y.shape[0],))
+    if not np.all(np.isfinite(dt)) or np.any(dt <= 0.0):
+        raise ValueError("dt must be positive and finite")
+
+    delta_y = dydt * dt[:, None]
+    y_new = y + delta_y
+
+    if enforce_nonnegative:
+        y_new = np.maximum(y_new, 0.0)
+        delta_y = y_new - y
+
+    return y_new, delta_y
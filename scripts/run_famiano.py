@@ -23,15 +23,17 @@ Notes
   assumptions in that paper. See config/cloud.json and config/jet.json
   for the parameters — VERIFY them against the paper before trusting
   numerical results.
-- For Group 1 reactions, the product energy distribution uses the
-  DWBAStubModel, which raises NotImplementedError. Until real DWBA
-  output is provided, set use_group1=False or the cascade step will
-  raise an error when Group 1 reactions are encountered.
+- For Group 1 reactions with a FRESCO run under fresco_code/runs/
+  (E_bins/ from energy_bins_reaction_dir.py), the product energy
+  distribution is tabulated from that run. The remaining Group 1
+  channels still use DWBAStubModel, which raises NotImplementedError,
+  so use_group1 stays False until every channel has DWBA output.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
 import logging
 import sys
@@ -51,8 +53,20 @@ for _p in [str(_ROOT / "core"), str(_ROOT)]:
 from state import CloudState, CascadeState, SolverState, NetworkState, SpeciesData, ProjectileSpectrum
 from grids import make_energy_grid
 from reactions import ReactionLibrary
-from cascade import run_cascade_step
-from timestep import compute_next_dt, estimate_initial_dt, euler_increment
+from cascade import (
+    CascadeExecutor,
+    CascadeResponse,
+    compute_cascade_step_batch,
+    run_cascade_step,
+)
+from stopping import StoppingPowerCache
+from timestep import (
+    compute_next_dt,
+    compute_next_dt_batch,
+    estimate_initial_dt,
+    euler_increment,
+    euler_increment_batch,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -79,6 +93,20 @@ def _load_configs(config_dir: Path) -> tuple[dict, dict, dict, dict]:
     return cloud_cfg, jet_cfg, species_cfg, run_cfg
 
 
+def cloud_model_config(cloud_cfg: dict, model: str) -> dict:
+    """
+    cloud.json settings for one model: the top-level keys overridden by the
+    "model_<model>" block (e.g. model="A").
+    """
+    key = f"model_{model}"
+    if key not in cloud_cfg:
+        available = sorted(k[len("model_"):] for k in cloud_cfg if k.startswith("model_"))
+        raise KeyError(f"cloud.json has no '{key}' block; available models: {available}")
+    merged = {k: v for k, v in cloud_cfg.items() if not k.startswith("model_")}
+    merged.update(cloud_cfg[key])
+    return merged
+
+
 # ---------------------------------------------------------------------------
 # State construction
 # ---------------------------------------------------------------------------
@@ -270,10 +298,23 @@ _S_PER_YR  = 3.15576e7         # s
 _M_P_MEV   = 938.272           # MeV/c²
 
 
+def jet_mass_rate_g_s(jet_cfg: dict, model: str = "B") -> float:
+    """
+    Jet mass rate Ṁ [g/s] for one model: jet.json "mass_rate" key
+    "model_<model>_Msun_per_yr", falling back to the Model B rate.
+    """
+    mass_rate_cfg = jet_cfg.get("mass_rate", {})
+    mass_rate_Msun_yr = mass_rate_cfg.get(
+        f"model_{model}_Msun_per_yr", mass_rate_cfg.get("model_B_Msun_per_yr", 1e-6)
+    )
+    return float(mass_rate_Msun_yr) * _MSUN_G / _S_PER_YR
+
+
 def compute_jet_normalization_factor(
     jet_cfg: dict,
     cloud_cfg: dict,
     species_cfg: dict,
+    model: str = "B",
 ) -> float:
     """
     Compute the dimensionless ratio  n_jet_total / n_baryon_cloud.
@@ -294,8 +335,9 @@ def compute_jet_normalization_factor(
 
         Φ = (Ṁ / m_avg) / A_cloud
 
-    with  Ṁ  the jet mass rate [g/s],  m_avg  the mean jet particle mass [g],
-    and  A_cloud = π (d/2)²  the cloud cross-section area [cm²].
+    with  Ṁ  the jet mass rate [g/s] of `model` (jet_mass_rate_g_s()),
+    m_avg  the mean jet particle mass [g], and  A_cloud = π (d/2)²  the
+    cloud cross-section area [cm²].
 
     The normalization factor is then
 
@@ -318,9 +360,7 @@ def compute_jet_normalization_factor(
     m_avg_g = m_avg_u * _AMU_G
 
     # --- Mass rate [g/s] ---
-    mass_rate_cfg = jet_cfg.get("mass_rate", {})
-    mass_rate_Msun_yr = float(mass_rate_cfg.get("model_B_Msun_per_yr", 1e-6))
-    mass_rate_g_s = mass_rate_Msun_yr * _MSUN_G / _S_PER_YR
+    mass_rate_g_s = jet_mass_rate_g_s(jet_cfg, model)
 
     # --- Cloud cross-section area [cm²] ---
     cloud_diameter_cm = float(cloud_cfg.get("cloud_diameter_cm", 5.0e11))
@@ -383,19 +423,23 @@ def compute_cloud_initial_mass_g(cloud_cfg: dict, state: NetworkState) -> float:
 # Main evolution loop
 # ---------------------------------------------------------------------------
 
-def run(args: argparse.Namespace) -> None:
-    config_dir = Path(args.config).resolve().parent
-    run_cfg_path = Path(args.config).resolve()
+# Parsed cross-section tables are cached here between runs (see
+# ReactionLibrary.from_directories); delete it or pass --rebuild-cache to
+# force a rescan.
+_LIBRARY_CACHE_DIR = _ROOT / ".cache" / "reactions"
 
-    log.info("Loading configuration from %s", config_dir)
-    cloud_cfg, jet_cfg, species_cfg, run_cfg = _load_configs(config_dir)
 
-    # Energy grid
-    grid = make_energy_grid(run_cfg["energy_grid"])
-    energy_edges = grid.edges
-    log.info("Energy grid: %d bins, %.2f–%.2f MeV", grid.n_bins, grid.e_min, grid.e_max)
+def load_reaction_library(library_cfg: dict | None = None, rebuild_cache: bool = False) -> ReactionLibrary:
+    """
+    Load (or restore from .cache/) the reaction library for the driver.
 
-    # Reaction library
+    library_cfg is the "reaction_library" section of run.json. Group1 is off
+    unless include_group1 is set; with group1_tabulated_only (the default)
+    only the Group1 channels that have FRESCO E_bins product distributions
+    are kept, since the others have no usable product spectrum. load_executor
+    and load_workers choose how the CSVs are parsed when the cache is rebuilt.
+    """
+    library_cfg = library_cfg or {}
     # Non-thermal projectiles include the initial jet species PLUS all A<8 secondary
     # products (d, t, n, 3He, 6Li, 7Li). Famiano Section 3: "only particles with A<8
     # are treated as energetic projectiles."
@@ -406,10 +450,43 @@ def run(args: argparse.Namespace) -> None:
         base_dir=_ROOT,
         projectile_species=_nonthermal_projectiles,
         target_species=None,    # accept all targets found in the data files
-        include_group1=False,   # Group1 requires DWBA product distributions — not yet implemented
+        include_group1=bool(library_cfg.get("include_group1", False)),
+        group1_tabulated_only=bool(library_cfg.get("group1_tabulated_only", True)),
         include_group2=True,
+        merge_tables=True,      # one union-grid lookup per channel instead of one per file
+        cache_dir=_LIBRARY_CACHE_DIR,
+        rebuild_cache=rebuild_cache,
+        load_executor=library_cfg.get("load_executor", "serial"),
+        load_workers=library_cfg.get("load_workers"),
     )
     log.info("Loaded %d reaction channels.", len(lib.reactions))
+    return lib
+
+
+def simulate(
+    cloud_cfg: dict,
+    jet_cfg: dict,
+    species_cfg: dict,
+    run_cfg: dict,
+    lib: ReactionLibrary | None = None,
+    out_csv: Path | None = None,
+    out_json: Path | None = None,
+) -> dict:
+    """
+    Build the initial state from the configs and evolve it to completion.
+
+    Output paths default to run.json's "output" section. Returns the solver
+    summary (step count, cascade evaluations, wall time) that is
+    also written to the final-state JSON.
+    """
+    # Energy grid
+    grid = make_energy_grid(run_cfg["energy_grid"])
+    energy_edges = grid.edges
+    log.info("Energy grid: %d bins, %.2f–%.2f MeV", grid.n_bins, grid.e_min, grid.e_max)
+
+    # Reaction library
+    if lib is None:
+        lib = load_reaction_library(run_cfg.get("reaction_library"))
 
     # Initial state
     state = build_network_state(cloud_cfg, jet_cfg, species_cfg, run_cfg, energy_edges)
@@ -430,10 +507,7 @@ def run(args: argparse.Namespace) -> None:
     # ΔM/M₀ = cumulative jet mass transiting BLR / total BLR mass (Famiano's convention).
     blr_mass_Msun = float(cloud_cfg.get("blr_mass_Msun", 1.0e6))
     _M0_g = blr_mass_Msun * _MSUN_G
-    _mass_rate_g_s = (
-        float(jet_cfg.get("mass_rate", {}).get("model_B_Msun_per_yr", 1e-6))
-        * _MSUN_G / _S_PER_YR
-    )
+    _mass_rate_g_s = jet_mass_rate_g_s(jet_cfg)
     log.info(
         "BLR mass M₀ = %.3e M_sun | jet mass rate = %.3e g/s | "
         "ΔM/M₀ rate = %.3e yr⁻¹",
@@ -454,10 +528,13 @@ def run(args: argparse.Namespace) -> None:
 
     # Output setup
     output_cfg = run_cfg.get("output", {})
-    out_csv = _ROOT / output_cfg.get("history_csv", "outputs/abundance_history.csv")
-    out_json = _ROOT / output_cfg.get("final_state_json", "outputs/final_state.json")
+    if out_csv is None:
+        out_csv = _ROOT / output_cfg.get("history_csv", "outputs/abundance_history.csv")
+    if out_json is None:
+        out_json = _ROOT / output_cfg.get("final_state_json", "outputs/final_state.json")
     write_every = int(output_cfg.get("write_every_n_steps", 100))
     out_csv.parent.mkdir(parents=True, exist_ok=True)
+    out_json.parent.mkdir(parents=True, exist_ok=True)
 
     solver_cfg = run_cfg.get("solver", {})
     gamma    = float(solver_cfg.get("gamma", 0.01))
@@ -465,15 +542,55 @@ def run(args: argparse.Namespace) -> None:
     dt_max   = float(solver_cfg.get("dt_max_s", 1e11))
     max_steps = int(solver_cfg.get("max_steps", 100000))
 
+    # Stopping powers are reused for exact repeats of the cloud composition;
+    # a positive stopping_cache_rtol (opt-in, approximate) also reuses them
+    # while the composition stays within that tolerance of the last evaluation.
+    stopping_cache = StoppingPowerCache(
+        rtol=float(solver_cfg.get("stopping_cache_rtol", 0.0)),
+        mode=str(solver_cfg.get("stopping_mode", "direct")),
+    )
+
+    # With a steady injection spectrum the cascade is a fixed linear map of
+    # the cloud composition; reuse it while the composition stays within
+    # cascade_response_rtol/atol of the reference (0 = full pass every step).
+    response_rtol = float(solver_cfg.get("cascade_response_rtol", 0.0))
+    response = None
+    if response_rtol > 0.0:
+        response = CascadeResponse(
+            reaction_library=lib,
+            energy_edges_mev=energy_edges,
+            rtol=response_rtol,
+            atol=float(solver_cfg.get("cascade_response_atol", 0.0)),
+            stopping_cache=stopping_cache,
+        )
+
+    # Per-projectile cascade passes are independent; an executor evaluates
+    # them concurrently and reduces in projectile order.
+    executor_kind = str(solver_cfg.get("cascade_executor", "serial"))
+    executor = None
+    if executor_kind != "serial":
+        workers = solver_cfg.get("cascade_workers")
+        executor = CascadeExecutor(
+            kind=executor_kind,
+            max_workers=int(workers) if workers is not None else None,
+            reaction_library=lib,
+            stopping_cache=stopping_cache,
+        )
+
     import csv
     fieldnames = ["step", "t_s", "delta_m_over_m0"] + list(state.cloud.species)
 
     delta_m_over_m0 = 0.0   # cumulative ΔM/M₀
 
+    n_rhs = 0
+
     t_start_wall = time.time()
-    log.info("Starting evolution: t_end = %.3e s, max_steps = %d", state.solver.t_end_s, max_steps)
+    log.info(
+        "Starting evolution: t_end = %.3e s, max_steps = %d",
+        state.solver.t_end_s, max_steps,
+    )
 
-    with open(out_csv, "w", newline="") as fh:
+    with open(out_csv, "w", newline="") as fh, (executor or contextlib.nullcontext()):
         writer = csv.DictWriter(fh, fieldnames=fieldnames)
         writer.writeheader()
         _write_history_row(fh, writer, state, state.solver.t_s, 0, delta_m_over_m0)
@@ -490,7 +607,6 @@ def run(args: argparse.Namespace) -> None:
                 if sp in state.cascade.spectra:
                     state.cascade.spectra[sp].values[:] = inj_vals
                 else:
-                    from state import ProjectileSpectrum
                     state.cascade.spectra[sp] = ProjectileSpectrum(
                         species=sp,
                         energy_MeV=energy_edges[:-1] + 0.5 * np.diff(energy_edges),
@@ -503,9 +619,13 @@ def run(args: argparse.Namespace) -> None:
                 reaction_library=lib,
                 energy_edges_mev=energy_edges,
                 dt_s=dt,
-                update_cloud=False,   # we apply the Euler step manually below
+                update_cloud=False,   # we apply the abundance update manually below
                 update_spectra=False, # steady-state: spectrum is reset each step
+                stopping_cache=stopping_cache,
+                response=response,
+                executor=executor,
             )
+            n_rhs += 1
 
             # --- Explicit Euler abundance update ---
             y_new, delta_y = euler_increment(
@@ -514,7 +634,6 @@ def run(args: argparse.Namespace) -> None:
                 dt=dt,
                 enforce_nonnegative=True,
             )
-            state.cloud.Y = y_new
 
             # --- Adaptive timestep (Famiano eq. 4) ---
             dt_next = compute_next_dt(
@@ -525,6 +644,8 @@ def run(args: argparse.Namespace) -> None:
                 dt_min=dt_min,
                 dt_max=dt_max,
             )
+
+            state.cloud.Y = y_new
             state.solver.set_dt(dt_next)
 
             # --- Advance time and track ΔM/M₀ ---
@@ -548,6 +669,22 @@ def run(args: argparse.Namespace) -> None:
         "Evolution finished: %d steps, t_final = %.4e s, wall time = %.1f s",
         step, state.solver.t_s, wall_time,
     )
+    log.info(
+        "Stopping-power cache: %d hits, %d misses",
+        stopping_cache.hits, stopping_cache.misses,
+    )
+    if response is not None:
+        log.info(
+            "Cascade response: %d rebuilds, %d reuses",
+            response.n_refresh, response.n_reuse,
+        )
+
+    summary = {
+        "steps": step,
+        "rhs_evaluations": n_rhs,
+        "cascade_response_rebuilds": response.n_refresh if response is not None else None,
+        "wall_time_s": wall_time,
+    }
 
     # Write final state JSON
     final = {
@@ -555,6 +692,7 @@ def run(args: argparse.Namespace) -> None:
         "step": step,
         "delta_m_over_m0": delta_m_over_m0,
         "stop_reason": state.solver.stop_reason,
+        "solver": summary,
         "abundances": {sp: float(y) for sp, y in zip(state.cloud.species, state.cloud.Y)},
         "mass_fractions": state.get_mass_fractions(),
     }
@@ -563,6 +701,170 @@ def run(args: argparse.Namespace) -> None:
     log.info("Final state written to %s", out_json)
     log.info("Abundance history written to %s", out_csv)
 
+    return {**summary, "t_s": state.solver.t_s, "abundances": final["abundances"]}
+
+
+def simulate_batch(
+    models: list[str],
+    cloud_cfg: dict,
+    jet_cfg: dict,
+    species_cfg: dict,
+    run_cfg: dict,
+    lib: ReactionLibrary | None = None,
+    out_dir: Path | None = None,
+) -> dict:
+    """
+    Evolve several cloud models (cloud.json "model_<X>" blocks) in lockstep.
+
+    Every step evaluates the cascade for all still-running models in one
+    compute_cascade_step_batch() call, sharing the cross-section and tau
+    tensors, and advances them with the batched explicit Euler / eq. (4)
+    controller. Each model keeps its own dt and time. Final states are
+    written to <out_dir>/final_state_model_<X>.json (default: the directory
+    of run.json's final_state_json). Returns {model: summary}.
+
+    No abundance history CSV is written -- only the final states. Use
+    simulate() per model for a time history.
+    """
+    solver_cfg = run_cfg.get("solver", {})
+    gamma    = float(solver_cfg.get("gamma", 0.01))
+    dt_min   = float(solver_cfg.get("dt_min_s", 1e4))
+    dt_max   = float(solver_cfg.get("dt_max_s", 1e11))
+    max_steps = int(solver_cfg.get("max_steps", 100000))
+
+    grid = make_energy_grid(run_cfg["energy_grid"])
+    energy_edges = grid.edges
+    if lib is None:
+        lib = load_reaction_library(run_cfg.get("reaction_library"))
+
+    output_cfg = run_cfg.get("output", {})
+    if out_dir is None:
+        out_dir = (_ROOT / output_cfg.get("final_state_json", "outputs/final_state.json")).parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    states: list[NetworkState] = []
+    injection: list[dict[str, np.ndarray]] = []
+    mass_terms: list[tuple[float, float]] = []
+    for model in models:
+        model_cfg = cloud_model_config(cloud_cfg, model)
+        state = build_network_state(model_cfg, jet_cfg, species_cfg, run_cfg, energy_edges)
+        expand_cloud_with_reaction_products(state, lib)
+        f_norm = compute_jet_normalization_factor(jet_cfg, model_cfg, species_cfg, model)
+        for spec in state.cascade.spectra.values():
+            spec.values[:] *= f_norm
+        injection.append({sp: spec.values.copy() for sp, spec in state.cascade.spectra.items()})
+
+        M0_g = float(model_cfg.get("blr_mass_Msun", 1.0e6)) * _MSUN_G
+        mass_terms.append((jet_mass_rate_g_s(jet_cfg, model), M0_g))
+        states.append(state)
+
+    # Same species order for every member (expansion is library-driven).
+    species = list(states[0].cloud.species)
+    for model, state in zip(models, states):
+        if list(state.cloud.species) != species:
+            raise ValueError(f"Model {model} tracks different cloud species; cannot batch.")
+
+    stopping_cache = StoppingPowerCache(
+        rtol=float(solver_cfg.get("stopping_cache_rtol", 0.0)),
+        mode=str(solver_cfg.get("stopping_mode", "direct")),
+    )
+
+    n = len(models)
+    steps = np.zeros(n, dtype=int)
+    delta_m_over_m0 = np.zeros(n, dtype=float)
+
+    t_start_wall = time.time()
+    log.info("Starting batched evolution of models %s", ", ".join(models))
+
+    n_batch_steps = 0
+    while n_batch_steps < max_steps:
+        active = [b for b, st in enumerate(states) if not st.solver.done]
+        if not active:
+            break
+
+        batch = [states[b] for b in active]
+        for b, st in zip(active, batch):
+            for sp, inj_vals in injection[b].items():
+                st.cascade.spectra[sp].values[:] = inj_vals
+
+        dt = np.array([st.solver.dt_s for st in batch], dtype=float)
+        result = compute_cascade_step_batch(
+            batch, lib, energy_edges, dt_s=dt, stopping_cache=stopping_cache,
+        )
+
+        Y = np.stack([st.cloud.Y for st in batch])
+        y_new, delta_y = euler_increment_batch(Y, result.dYdt_cloud, dt, enforce_nonnegative=True)
+        dt_next = compute_next_dt_batch(
+            y_new=y_new,
+            delta_y=delta_y,
+            dt_current=dt,
+            gamma=gamma,
+            dt_min=dt_min,
+            dt_max=dt_max,
+        )
+
+        for j, (b, st) in enumerate(zip(active, batch)):
+            st.cloud.Y = y_new[j]
+            st.solver.set_dt(float(dt_next[j]))
+            mass_rate_g_s, M0_g = mass_terms[b]
+            delta_m_over_m0[b] += mass_rate_g_s * dt[j] / M0_g
+            st.solver.advance_time()
+            steps[b] += 1
+        n_batch_steps += 1
+
+    wall_time = time.time() - t_start_wall
+    log.info(
+        "Batched evolution finished: %d batch steps, wall time = %.1f s",
+        n_batch_steps, wall_time,
+    )
+
+    summaries = {}
+    for b, (model, state) in enumerate(zip(models, states)):
+        summary = {
+            "model": model,
+            "steps": int(steps[b]),
+            "batch_size": n,
+            "wall_time_s": wall_time,
+        }
+        final = {
+            "t_s": state.solver.t_s,
+            "step": int(steps[b]),
+            "delta_m_over_m0": float(delta_m_over_m0[b]),
+            "stop_reason": state.solver.stop_reason,
+            "solver": summary,
+            "abundances": {sp: float(y) for sp, y in zip(state.cloud.species, state.cloud.Y)},
+            "mass_fractions": state.get_mass_fractions(),
+        }
+        out_json = out_dir / f"final_state_model_{model}.json"
+        with open(out_json, "w") as f:
+            json.dump(final, f, indent=2)
+        log.info("Model %s final state written to %s", model, out_json)
+        summaries[model] = {**summary, "t_s": state.solver.t_s, "abundances": final["abundances"]}
+
+    return summaries
+
+
+def run(args: argparse.Namespace) -> None:
+    config_dir = Path(args.config).resolve().parent
+
+    log.info("Loading configuration from %s", config_dir)
+    cloud_cfg, jet_cfg, species_cfg, run_cfg = _load_configs(config_dir)
+
+    if getattr(args, "load_executor", None):
+        run_cfg.setdefault("reaction_library", {})["load_executor"] = args.load_executor
+    if getattr(args, "load_workers", None):
+        run_cfg.setdefault("reaction_library", {})["load_workers"] = args.load_workers
+
+    lib = load_reaction_library(
+        run_cfg.get("reaction_library"), rebuild_cache=getattr(args, "rebuild_cache", False)
+    )
+
+    if getattr(args, "models", None):
+        simulate_batch(args.models, cloud_cfg, jet_cfg, species_cfg, run_cfg, lib=lib)
+        return
+
+    simulate(cloud_cfg, jet_cfg, species_cfg, run_cfg, lib=lib)
+
 
 # ---------------------------------------------------------------------------
 # Entry point
@@ -575,6 +877,32 @@ def _parse_args() -> argparse.Namespace:
         default=str(_ROOT / "config" / "run.json"),
         help="Path to run.json (default: config/run.json)",
     )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=None,
+        metavar="X",
+        help="Run the cloud.json model_<X> blocks together as one batch (writes final "
+        "states but no history CSV)",
+    )
+    parser.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="Re-parse the cross-section CSVs and refresh the reaction library cache",
+    )
+    parser.add_argument(
+        "--load-executor",
+        choices=("serial", "thread", "process"),
+        default=None,
+        help="Override reaction_library.load_executor from run.json (CSV parsing on a cache rebuild)",
+    )
+    parser.add_argument(
+        "--load-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Override reaction_library.load_workers from run.json (pool size)",
+    )
     return parser.parse_args()
 
 
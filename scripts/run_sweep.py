@@ -0,0 +1,222 @@
+"""
+run_sweep.py
+
+Run the Famiano driver over a grid of configuration parameters.
+
+Usage
+-----
+    cd /path/to/Blazar-Nucleosynthesis
+    python scripts/run_sweep.py [--sweep config/sweep.json] [--config config/run.json]
+                                [--workers N] [--force]
+
+The sweep file maps dotted parameter paths to lists of values; the first
+path component names the config file (cloud, jet, species or run):
+
+    {
+      "parameters": {
+        "jet.spectrum.E_per_nucleon_MeV": [50, 100, 150, 200, 250],
+        "cloud.density_cm3": [1.0e11, 1.0e12]
+      }
+    }
+
+Every point of the Cartesian product is run with run_famiano.simulate().
+The reaction library is loaded once and shared with the worker processes
+(inherited through fork where available, otherwise sent once per worker).
+Each point writes to outputs/sweep/<hash>/, where <hash> is computed from
+the fully resolved configs; points whose final_state.json already exists
+are skipped unless --force is given. outputs/sweep/index.json lists the
+parameters and status of every point.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SCRIPTS = Path(__file__).resolve().parent
+if str(_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS))
+
+from run_famiano import _load_configs, load_reaction_library, simulate
+
+log = logging.getLogger("run_sweep")
+
+_CONFIG_NAMES = ("cloud", "jet", "species", "run")
+
+# Reaction library of this process; set before the pool starts so forked
+# workers inherit it, or installed by _init_worker otherwise.
+_LIB = None
+
+
+def _init_worker(lib) -> None:
+    global _LIB
+    _LIB = lib
+
+
+def expand_grid(parameters: dict) -> list[dict]:
+    """
+    Cartesian product of {path: [values]} as a list of {path: value}.
+    """
+    paths = list(parameters)
+    for path in paths:
+        if path.split(".", 1)[0] not in _CONFIG_NAMES:
+            raise ValueError(
+                f"Sweep parameter '{path}' must start with one of {_CONFIG_NAMES}."
+            )
+        if not isinstance(parameters[path], list) or not parameters[path]:
+            raise ValueError(f"Sweep parameter '{path}' needs a non-empty list of values.")
+    return [dict(zip(paths, values)) for values in itertools.product(*(parameters[p] for p in paths))]
+
+
+def apply_point(configs: dict, point: dict) -> dict:
+    """
+    Deep copy of {name: config} with the dotted paths of `point` set.
+
+    Every path must already exist in the base configs, so a misspelled
+    parameter raises KeyError instead of adding an unused key.
+    """
+    configs = copy.deepcopy(configs)
+    for path, value in point.items():
+        name, *keys = path.split(".")
+        if name not in configs:
+            raise KeyError(
+                f"Sweep parameter '{path}': no config named '{name}' (expected one of {sorted(configs)})."
+            )
+        if not keys:
+            raise KeyError(f"Sweep parameter '{path}' does not name a setting inside {name}.json.")
+        node = configs[name]
+        for depth, key in enumerate(keys):
+            if not isinstance(node, dict) or key not in node:
+                raise KeyError(
+                    f"Sweep parameter '{path}': '{'.'.join([name, *keys[:depth + 1]])}' "
+                    f"is not in the base {name}.json."
+                )
+            if depth < len(keys) - 1:
+                node = node[key]
+        node[keys[-1]] = value
+    return configs
+
+
+def config_hash(configs: dict) -> str:
+    """
+    Stable hash of the resolved configs; "_comment"-style keys are ignored.
+    """
+    def strip(node):
+        if isinstance(node, dict):
+            return {k: strip(v) for k, v in node.items() if not k.startswith("_")}
+        if isinstance(node, list):
+            return [strip(v) for v in node]
+        return node
+
+    payload = json.dumps({name: strip(configs[name]) for name in _CONFIG_NAMES}, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _run_point(configs: dict, out_dir: Path) -> dict:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    result = simulate(
+        configs["cloud"], configs["jet"], configs["species"], configs["run"],
+        lib=_LIB,
+        out_csv=out_dir / "history.csv",
+        out_json=out_dir / "final_state.json",
+    )
+    return {k: v for k, v in result.items() if k != "abundances"}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Parameter sweep over run_famiano.py")
+    parser.add_argument(
+        "--sweep",
+        default=str(_ROOT / "config" / "sweep.json"),
+        help="Path to the sweep grid (default: config/sweep.json)",
+    )
+    parser.add_argument(
+        "--config",
+        default=str(_ROOT / "config" / "run.json"),
+        help="Path to run.json of the base configuration (default: config/run.json)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: sweep.json 'workers', else the CPU count)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run points that already have results",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    global _LIB
+    args = _parse_args()
+
+    with open(args.sweep) as f:
+        sweep_cfg = json.load(f)
+    base = dict(zip(_CONFIG_NAMES, _load_configs(Path(args.config).resolve().parent)))
+
+    sweep_dir = _ROOT / sweep_cfg.get("output_dir", "outputs/sweep")
+    points = expand_grid(sweep_cfg["parameters"])
+
+    pending = []
+    index = []
+    for point in points:
+        configs = apply_point(base, point)
+        key = config_hash(configs)
+        out_dir = sweep_dir / key
+        done = (out_dir / "final_state.json").exists() and not args.force
+        entry = {"hash": key, "parameters": point, "status": "cached" if done else "pending"}
+        if done:
+            with open(out_dir / "final_state.json") as f:
+                entry["summary"] = json.load(f).get("solver")
+        index.append(entry)
+        if not done:
+            pending.append((len(index) - 1, configs, out_dir))
+
+    log.info(
+        "Sweep: %d points, %d with cached results, %d to run",
+        len(points), len(points) - len(pending), len(pending),
+    )
+
+    if pending:
+        _LIB = load_reaction_library(base["run"].get("reaction_library"))
+        workers = args.workers or sweep_cfg.get("workers") or None
+        if "fork" in multiprocessing.get_all_start_methods():
+            pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork"),
+            )
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(_LIB,),
+            )
+        with pool:
+            futures = [(i, pool.submit(_run_point, configs, out_dir)) for i, configs, out_dir in pending]
+            for i, future in futures:
+                try:
+                    index[i]["summary"] = future.result()
+                    index[i]["status"] = "done"
+                except Exception as exc:  # keep the other points running
+                    log.error("Sweep point %s failed: %s", index[i]["parameters"], exc)
+                    index[i]["status"] = f"failed: {exc}"
+
+    sweep_dir.mkdir(parents=True, exist_ok=True)
+    with open(sweep_dir / "index.json", "w") as f:
+        json.dump(index, f, indent=2)
+
+    for entry in index:
+        print(f"{entry['hash']}  {entry['status']:>8}  {entry['parameters']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,8 @@
 verify_stopping.py
 
 Compare _bethe_bloch_neutral() output against NIST PSTAR reference data
-for protons in hydrogen gas.
+for protons in hydrogen gas, and check that the per-species stopping basis
+(StoppingPowerCache mode="basis") reproduces stopping_power_bin_average().
 
 NIST PSTAR data (I = 19.2 eV, hydrogen gas):
     https://physics.nist.gov/PhysRefData/Star/Text/PSTAR.html
@@ -21,7 +22,7 @@ import numpy as np
 _ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_ROOT))
 
-from core.stopping import _bethe_bloch_neutral, stopping_power
+from core.stopping import StoppingPowerCache, _bethe_bloch_neutral, stopping_power, stopping_power_bin_average
 
 # ---------------------------------------------------------------------------
 # NIST PSTAR reference: electronic stopping power S_el/rho [MeV cm^2/g]
@@ -102,3 +103,34 @@ print(f"{'E (MeV)':>10}  {'NIST S/ρ':>14}  {'Total S/ρ':>14}  {'% err':>7}")
 for E, S_ref, St in zip(NIST_E_MEV, NIST_S_MeV_cm2_g, S_total):
     pct = (St / S_ref - 1.0) * 100.0
     print(f"{E:>10.1f}  {S_ref:>14.3f}  {St:>14.3f}  {pct:>+7.2f}%")
+
+# ---------------------------------------------------------------------------
+# Per-species basis vs direct bin averages.
+# The basis drops the max(., 0) clamp on the Bethe bracket; bins where the
+# clamp could act are evaluated directly, so the two must agree to rounding.
+# The low-energy grid below reaches into the clamped region on purpose.
+# ---------------------------------------------------------------------------
+print("\n--- Per-species stopping basis vs direct bin averages ---")
+A_mix = np.array([1.0, 4.0, 7.0, 12.0, 14.0, 16.0, 20.0, 24.0, 56.0])
+X_mix = np.array([0.70, 0.27, 1e-8, 3e-3, 1e-3, 8e-3, 2e-3, 1e-3, 1.5e-3])
+X_mix = X_mix / X_mix.sum()
+
+grids = {
+    "linear 2.5-402.5 MeV": np.linspace(2.5, 402.5, 81),
+    "log 1e-4-1e3 MeV": np.geomspace(1e-4, 1e3, 121),
+}
+worst = 0.0
+for label, edges in grids.items():
+    for Zp, Ap in [(1, 1), (2, 4), (3, 7)]:
+        for X_ion_b, n_e_b in [(1e-3, 1e8), (0.5, 1e2)]:
+            kwargs = dict(A_cl=A_mix, X_cl=X_mix, X_ion=X_ion_b, Z_proj=Zp,
+                          E_edges=edges, A_proj=Ap, n_e=n_e_b, T_e=1e4)
+            direct = stopping_power_bin_average(**kwargs)
+            basis = StoppingPowerCache(mode="basis").bin_average(**kwargs)
+            rel = np.max(np.abs(basis - direct) / np.maximum(direct, 1e-300))
+            worst = max(worst, rel)
+            print(f"{label:>22}  Z={Zp} A={Ap}  X_ion={X_ion_b:.0e}  max rel diff = {rel:.2e}")
+
+print(f"\nWorst basis/direct relative difference: {worst:.2e}")
+if worst > 1e-10:
+    raise SystemExit("Stopping basis does not reproduce the direct bin averages.")
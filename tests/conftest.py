@@ -0,0 +1,69 @@
+"""
+Shared setup for the regression tests: core/ and the repository root on
+sys.path (the modules use flat imports), and a small reaction library
+built from the data shipped in data/CrossSections/.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT / "core", ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+@pytest.fixture(scope="session")
+def small_library():
+    """
+    p, d and 4He channels of Group2 plus the Group1 channels that have FRESCO
+    product bins, so both DeltaAtThermalModel and
+    TabulatedProductDistributionModel are covered.
+    """
+    from reactions import ReactionLibrary
+
+    logging.getLogger("reactions").setLevel(logging.ERROR)
+    return ReactionLibrary.from_directories(
+        base_dir=ROOT,
+        projectile_species=["p", "d", "4He"],
+        include_group1=True,
+        group1_tabulated_only=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def energy_edges():
+    """The run.json energy grid."""
+    import json
+
+    from grids import make_energy_grid
+
+    with (ROOT / "config" / "run.json").open() as f:
+        return make_energy_grid(json.load(f)["energy_grid"]).edges
+
+
+@pytest.fixture(scope="session")
+def make_model_state(small_library, energy_edges):
+    """
+    Factory for the cloud.json model_<X> NetworkState, built and normalized
+    the way run_famiano.simulate_batch() does it.
+    """
+    if str(ROOT / "scripts") not in sys.path:
+        sys.path.insert(0, str(ROOT / "scripts"))
+    import run_famiano
+
+    cloud_cfg, jet_cfg, species_cfg, run_cfg = run_famiano._load_configs(ROOT / "config")
+
+    def make(model):
+        model_cfg = run_famiano.cloud_model_config(cloud_cfg, model)
+        state = run_famiano.build_network_state(model_cfg, jet_cfg, species_cfg, run_cfg, energy_edges)
+        run_famiano.expand_cloud_with_reaction_products(state, small_library)
+        f_norm = run_famiano.compute_jet_normalization_factor(jet_cfg, model_cfg, species_cfg, model)
+        for spec in state.cascade.spectra.values():
+            spec.values[:] *= f_norm
+        return state
+
+    return make
@@ -0,0 +1,147 @@
+"""
+BandedTau against the dense (n_rxn, n_proj_bins, n_products, n_prod_bins)
+tau it replaces, ReactionLibrary.product_tau() against the dense per-bin
+build from distribution(), and the per-(projectile, grid) tau cache.
+"""
+
+import copy
+
+import numpy as np
+import pytest
+
+from reactions import canonical_species_name
+from survival import BandedTau, compute_contracted_yield, compute_contracted_yield_batch
+
+SHAPE = (5, 9, 4, 9)
+
+
+def _random_dense_tau(rng):
+    """
+    Dense tau whose blocks are absent, delta-like, banded or full.
+    """
+    n_rxn, n_proj, n_products, n_prod = SHAPE
+    tau = np.zeros(SHAPE)
+    for i in range(n_rxn):
+        for p in range(n_products):
+            kind = rng.integers(4)
+            if kind == 1:
+                tau[i, :, p, 0] = rng.uniform(0.5, 2.0, n_proj)
+            elif kind == 2:
+                lo = rng.integers(n_prod - 3)
+                tau[i, :, p, lo:lo + 3] = rng.uniform(0.0, 1.0, (n_proj, 3))
+            elif kind == 3:
+                tau[i, :, p, :] = rng.uniform(0.0, 1.0, (n_proj, n_prod))
+    return tau
+
+
+@pytest.fixture
+def dense_tau():
+    return _random_dense_tau(np.random.default_rng(23))
+
+
+def test_round_trip_and_totals(dense_tau):
+    banded = BandedTau.from_dense(dense_tau)
+    np.testing.assert_array_equal(banded.todense(), dense_tau)
+    np.testing.assert_allclose(banded.totals, dense_tau.sum(axis=-1), rtol=1e-14)
+    assert banded.nbytes < dense_tau.nbytes
+
+
+def test_contract_and_project_match_einsum(dense_tau):
+    rng = np.random.default_rng(1)
+    banded = BandedTau.from_dense(dense_tau)
+
+    factor = rng.uniform(0.0, 1.0, (3,) + SHAPE[:2])
+    np.testing.assert_allclose(
+        banded.contract(factor), np.einsum("bik,ikpq->bipq", factor, dense_tau), rtol=1e-13
+    )
+
+    weights = rng.uniform(0.0, 1.0, SHAPE[:2])
+    for p in range(SHAPE[2]):
+        np.testing.assert_allclose(
+            banded.project(p, weights),
+            np.einsum("ik,ikq->kq", weights, dense_tau[:, :, p, :]),
+            rtol=1e-13, atol=1e-15,
+        )
+
+
+def test_contracted_yield_banded_equals_dense(dense_tau):
+    rng = np.random.default_rng(2)
+    banded = BandedTau.from_dense(dense_tau)
+    beta = rng.uniform(0.0, 1.0, SHAPE[:2])
+    deltaS = rng.uniform(0.0, 1.0, SHAPE[1])
+
+    for got, want in zip(compute_contracted_yield(banded, beta, deltaS),
+                         compute_contracted_yield(dense_tau, beta, deltaS)):
+        np.testing.assert_allclose(got, want, rtol=1e-13, atol=1e-15)
+
+    beta_b = rng.uniform(0.0, 1.0, (2,) + SHAPE[:2])
+    deltaS_b = rng.uniform(0.0, 1.0, (2, SHAPE[1]))
+    for got, want in zip(compute_contracted_yield_batch(banded, beta_b, deltaS_b),
+                         compute_contracted_yield_batch(dense_tau, beta_b, deltaS_b)):
+        np.testing.assert_allclose(got, want, rtol=1e-13, atol=1e-15)
+
+
+def _dense_product_tau(reactions, order, edges):
+    """
+    The per-projectile-bin build from distribution() that the band form replaced.
+    """
+    n_bins = len(edges) - 1
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    prod_index = {s: i for i, s in enumerate(order)}
+    tau = np.zeros((len(reactions), n_bins, len(order), n_bins))
+    for i, rxn in enumerate(reactions):
+        for k, e in enumerate(centers):
+            for prod in rxn.products_as_objects():
+                species = canonical_species_name(prod.species)
+                tau[i, k, prod_index[species], :] += prod.multiplicity * np.asarray(
+                    rxn.product_distribution_model.distribution(
+                        projectile_energy_mev=float(e),
+                        product_species=species,
+                        product_energy_edges_mev=edges,
+                    )
+                )
+    return tau
+
+
+@pytest.mark.parametrize("projectile", ["p", "d", "4He"])
+def test_library_product_tau_matches_dense_build(small_library, projectile):
+    edges = np.linspace(2.5, 402.5, 41)
+    order, banded = small_library.product_tau(projectile=projectile, energy_edges_mev=edges)
+    reference = _dense_product_tau(small_library.by_projectile(projectile), order, edges)
+
+    np.testing.assert_allclose(banded.todense(), reference, rtol=1e-12, atol=1e-15)
+    dense_order, dense = small_library.product_tau_tensor(projectile=projectile, energy_edges_mev=edges)
+    assert dense_order == order
+    np.testing.assert_array_equal(dense, banded.todense())
+
+
+def test_product_tau_is_cached_per_projectile_and_grid(small_library):
+    edges = np.linspace(2.5, 402.5, 33)
+    order, tau = small_library.product_tau(projectile="4He", energy_edges_mev=edges)
+
+    # Same grid values, new array: a cache hit.
+    assert small_library.product_tau(projectile="4He", energy_edges_mev=edges.copy())[1] is tau
+    dense = small_library.product_tau_tensor(projectile="4He", energy_edges_mev=edges)[1]
+    assert small_library.product_tau_tensor(projectile="4He", energy_edges_mev=edges)[1] is dense
+    assert not dense.flags.writeable
+
+    # Another grid or projectile is a separate entry.
+    assert small_library.product_tau(projectile="4He", energy_edges_mev=edges[:-1])[1] is not tau
+    assert small_library.product_tau(projectile="p", energy_edges_mev=edges)[1] is not tau
+
+    # Replacing a channel's product model invalidates the entry.
+    rxn = small_library.by_projectile("4He")[0]
+    model = rxn.product_distribution_model
+    rxn.product_distribution_model = copy.copy(model)
+    try:
+        rebuilt_order, rebuilt = small_library.product_tau(projectile="4He", energy_edges_mev=edges)
+    finally:
+        rxn.product_distribution_model = model
+    assert rebuilt is not tau
+    assert rebuilt_order == order
+    np.testing.assert_array_equal(rebuilt.todense(), tau.todense())
+
+    small_library.clear_grid_caches()
+    cleared = small_library.product_tau(projectile="4He", energy_edges_mev=edges)[1]
+    assert cleared is not tau
+    np.testing.assert_array_equal(cleared.todense(), tau.todense())
@@ -0,0 +1,281 @@
+"""
+Cascade step against the per-injection-bin loop it replaced, the
+precompiled ProductRouting tables against routing by species name, product
+accumulation from those tables against the per-reaction loop, the batched cascade step against one
+compute_cascade_step() per cloud, CascadeResponse (fresh and reused maps)
+against the full pass, and the CascadeExecutor pools against the serial loop.
+"""
+
+import numpy as np
+import pytest
+
+from cascade import (
+    CascadeExecutor,
+    CascadeResponse,
+    _accumulate_products,
+    compute_cascade_step,
+    compute_cascade_step_batch,
+)
+from reactions import canonical_species_name, product_species_union
+from state import ProjectileSpectrum
+from stopping import stopping_power_bin_average
+from survival import build_survival_matrices, compute_discrete_yield
+
+
+def _loop_accumulate(routing, product_species_order, rxn_events, product_spectra, dt_s):
+    """
+    The per-reaction, per-product loop _accumulate_products() replaced.
+    """
+    dYdt = np.zeros(N_CLOUD)
+    injected = {}
+    n_rxn, _, n_prod_bins = product_spectra.shape
+    for i_rxn in range(n_rxn):
+        t_idx = routing.target_idx[i_rxn]
+        if t_idx >= 0:
+            dYdt[t_idx] -= float(rxn_events[i_rxn]) / dt_s
+        for p_idx, p_species in enumerate(product_species_order):
+            spectrum = product_spectra[i_rxn, p_idx, :]
+            produced = float(np.sum(spectrum))
+            if produced <= 0.0:
+                continue
+            if routing.nonthermal[i_rxn, p_idx]:
+                injected.setdefault(p_species, np.zeros(n_prod_bins))
+                injected[p_species] += spectrum
+            elif routing.thermal_idx[i_rxn, p_idx] >= 0:
+                dYdt[routing.thermal_idx[i_rxn, p_idx]] += produced / dt_s
+    return dYdt, injected
+
+
+N_CLOUD = 12
+
+
+@pytest.mark.parametrize("projectile", ["p", "d", "4He"])
+@pytest.mark.parametrize("drop_every", [1, 3])
+def test_routing_scatter_matches_loop(small_library, projectile, drop_every):
+    reactions = small_library.by_projectile(projectile)
+    order = product_species_union(reactions)
+
+    # A cloud that tracks only part of the species exercises the -1 indices.
+    species = sorted({r.target for r in reactions} | set(order))
+    cloud_species = species[::drop_every][:N_CLOUD]
+    routing = small_library.product_routing(projectile, cloud_species)
+
+    rng = np.random.default_rng(22)
+    n_bins = 7
+    rxn_events = rng.uniform(0.0, 1.0, len(reactions))
+    spectra = rng.uniform(0.0, 1.0, (len(reactions), len(order), n_bins))
+    spectra[routing.multiplicity == 0] = 0.0
+    spectra[rng.uniform(size=spectra.shape[:2]) < 0.2] = 0.0
+
+    dYdt = np.zeros(N_CLOUD)
+    injected = {}
+    _accumulate_products(routing, order, rxn_events, spectra, injected, dYdt, dt_s=2.5)
+    ref_dYdt, ref_injected = _loop_accumulate(routing, order, rxn_events, spectra, 2.5)
+
+    np.testing.assert_allclose(dYdt, ref_dYdt, rtol=1e-13, atol=1e-15)
+    assert injected.keys() == ref_injected.keys()
+    for species_name, spectrum in ref_injected.items():
+        np.testing.assert_allclose(injected[species_name], spectrum, rtol=1e-13, atol=1e-15)
+
+
+@pytest.mark.parametrize("projectile", ["p", "d", "4He"])
+def test_product_routing_matches_name_lookup(small_library, projectile):
+    reactions = small_library.by_projectile(projectile)
+    order = product_species_union(reactions)
+    species = sorted({r.target for r in reactions} | set(order))
+    # Every other species, plus one the registry has never seen.
+    cloud_species = species[::2] + ["99Xx"]
+    routing = small_library.product_routing(projectile, cloud_species)
+
+    def cloud_index(name):
+        name = canonical_species_name(name)
+        return cloud_species.index(name) if name in cloud_species else -1
+
+    np.testing.assert_array_equal(routing.target_idx, [cloud_index(r.target) for r in reactions])
+    np.testing.assert_array_equal(routing.product_idx, [cloud_index(sp) for sp in order])
+    for i_rxn, rxn in enumerate(reactions):
+        products = {canonical_species_name(prod.species): prod for prod in rxn.products_as_objects()}
+        for p_idx, p_species in enumerate(order):
+            prod = products.get(p_species)
+            assert routing.multiplicity[i_rxn, p_idx] == (0 if prod is None else prod.multiplicity)
+            nonthermal = prod is not None and prod.can_continue_nonthermal
+            assert routing.nonthermal[i_rxn, p_idx] == nonthermal
+            thermal = prod is not None and not nonthermal
+            assert routing.thermal_idx[i_rxn, p_idx] == (cloud_index(p_species) if thermal else -1)
+
+    assert small_library.product_routing(projectile, cloud_species) is routing
+    assert small_library.product_routing(projectile, species) is not routing
+    for arr in (routing.target_idx, routing.product_idx, routing.multiplicity,
+                routing.nonthermal, routing.thermal_idx):
+        assert not arr.flags.writeable
+    with pytest.raises(KeyError):
+        small_library.product_routing("99Xx", cloud_species)
+
+
+def test_batch_step_matches_per_cloud_steps(small_library, make_model_state, energy_edges):
+    states = [make_model_state(model) for model in ("A", "B")]
+    dts = [3.0, 40.0]
+    batch = compute_cascade_step_batch(states, small_library, energy_edges, dt_s=dts)
+
+    for b, (state, dt) in enumerate(zip(states, dts)):
+        single = compute_cascade_step(state, small_library, energy_edges, dt_s=dt)
+        assert np.any(single.dYdt_cloud != 0.0)
+        np.testing.assert_allclose(batch.dYdt_cloud[b], single.dYdt_cloud, rtol=1e-10, atol=0.0)
+        assert set(single.injected_spectra) <= set(batch.injected_spectra)
+        for species_name, spectrum in batch.injected_spectra.items():
+            want = single.injected_spectra.get(species_name, np.zeros_like(spectrum[b]))
+            np.testing.assert_allclose(spectrum[b], want, rtol=1e-10, atol=0.0)
+
+
+def _per_bin_cascade_step(state, lib, edges, dt_s):
+    """
+    One cascade pass the way it was done before the contracted yield: a 4-D
+    compute_discrete_yield() tensor per injection bin, per-reaction sigma
+    bin averages, the dense tau, and targets and products routed by name.
+
+    DeltaS comes from build_survival_matrices() rather than
+    build_survival_and_yield(): with destruction ratios of ~1e-13 per bin for
+    protons, differences of S lose most of their digits (test_survival.py
+    compares the two where they are well conditioned).
+    """
+    cloud = state.cloud
+    species = list(cloud.species)
+    n_bins = len(edges) - 1
+    X = state.get_mass_fractions()
+    A_cl = np.array([state.species_data[sp].A for sp in species], dtype=float)
+    X_cl = np.array([X[sp] for sp in species])
+    n_e = cloud.density_cm3 * cloud.ionization_fraction * sum(
+        state.species_data[sp].Z * y for sp, y in zip(species, cloud.Y)
+    )
+
+    dYdt = np.zeros(len(species))
+    injected = {}
+    for projectile in state.cascade.projectile_species():
+        values = np.asarray(state.cascade.get_spectrum(projectile).values, dtype=float)
+        reactions = lib.by_projectile(projectile)
+        data = state.species_data[projectile]
+        epsilon = stopping_power_bin_average(
+            A_cl=A_cl, X_cl=X_cl, X_ion=cloud.ionization_fraction, Z_proj=data.Z,
+            E_edges=edges, A_proj=data.A, n_e=n_e, T_e=cloud.temperature_K,
+        )
+        sigma = np.array([rxn.sigma_bin_average_mb(edges) for rxn in reactions]) * 1.0e-27
+        densities = np.array([
+            cloud.density_cm3 * cloud.Y[species.index(rxn.target)] if rxn.target in species else 0.0
+            for rxn in reactions
+        ])
+        order, tau = lib.product_tau_tensor(projectile=projectile, energy_edges_mev=edges)
+
+        surv = build_survival_matrices(epsilon, sigma, densities, edges)
+
+        out = np.zeros(n_bins)
+        for n in range(n_bins - 1, -1, -1):
+            amount = values[n]
+            if amount <= 0.0:
+                continue
+            out[1:] += amount * np.maximum(np.diff(surv["S"][n]), 0.0)
+            y = compute_discrete_yield(tau, surv["beta"], surv["deltaS"][n], initial_bin=n)
+
+            events = amount * np.sum(surv["beta"] * surv["deltaS"][n], axis=1)
+            for i_rxn, rxn in enumerate(reactions):
+                if rxn.target in species:
+                    dYdt[species.index(rxn.target)] -= events[i_rxn] / dt_s
+                for prod in rxn.products_as_objects():
+                    p_species = canonical_species_name(prod.species)
+                    spectrum = amount * y[i_rxn, :, order.index(p_species), :].sum(axis=0)
+                    if prod.can_continue_nonthermal:
+                        injected[p_species] = injected.get(p_species, 0.0) + spectrum
+                    elif p_species in species:
+                        dYdt[species.index(p_species)] += spectrum.sum() / dt_s
+        injected[projectile] = injected.get(projectile, 0.0) + out
+    return dYdt, injected
+
+
+@pytest.mark.parametrize("model", ["A", "B"])
+def test_cascade_step_matches_per_injection_bin_loop(small_library, make_model_state, energy_edges, model):
+    state = make_model_state(model)
+    state.cascade.get_spectrum("p").values[:] = np.linspace(0.0, 1.0, len(energy_edges) - 1) ** 2
+    result = compute_cascade_step(state, small_library, energy_edges, dt_s=7.0)
+    ref_dYdt, ref_injected = _per_bin_cascade_step(state, small_library, energy_edges, 7.0)
+
+    np.testing.assert_allclose(result.dYdt_cloud, ref_dYdt, rtol=1e-10, atol=0.0)
+    assert result.injected_spectra.keys() == ref_injected.keys()
+    for species_name, spectrum in ref_injected.items():
+        np.testing.assert_allclose(result.injected_spectra[species_name], spectrum, rtol=1e-10, atol=0.0)
+
+
+def _assert_same_step(got, want, rtol):
+    np.testing.assert_allclose(got.dYdt_cloud, want.dYdt_cloud, rtol=rtol, atol=0.0)
+    assert set(want.injected_spectra) <= set(got.injected_spectra)
+    for species_name, spectrum in got.injected_spectra.items():
+        ref = want.injected_spectra.get(species_name, np.zeros_like(spectrum))
+        np.testing.assert_allclose(spectrum, ref, rtol=rtol, atol=0.0)
+
+
+def test_response_matches_full_pass(small_library, make_model_state, energy_edges):
+    state = make_model_state("B")
+    response = CascadeResponse(small_library, energy_edges, rtol=1e-3)
+
+    # First call builds the maps.
+    _assert_same_step(response.evaluate(state, dt_s=5.0),
+                      compute_cascade_step(state, small_library, energy_edges, dt_s=5.0), rtol=1e-10)
+    assert (response.n_refresh, response.n_reuse) == (1, 0)
+
+    # A new injection spectrum and dt at the same composition reuse them:
+    # the maps are linear in the projectile amounts, so this is still exact.
+    p = state.cascade.get_spectrum("p")
+    p.values[:] = p.values * np.linspace(2.0, 0.5, p.n_bins)
+    _assert_same_step(response.evaluate(state, dt_s=11.0),
+                      compute_cascade_step(state, small_library, energy_edges, dt_s=11.0), rtol=1e-10)
+    assert (response.n_refresh, response.n_reuse) == (1, 1)
+
+    # Drift below rtol keeps the maps (within rtol of the full pass) ...
+    state.cloud.Y[:] *= 1.0 + 1e-4
+    _assert_same_step(response.evaluate(state, dt_s=11.0),
+                      compute_cascade_step(state, small_library, energy_edges, dt_s=11.0), rtol=1e-3)
+    assert (response.n_refresh, response.n_reuse) == (1, 2)
+
+    # ... drift above it, or a temperature change, rebuilds them.
+    state.cloud.Y[0] *= 1.01
+    _assert_same_step(response.evaluate(state, dt_s=11.0),
+                      compute_cascade_step(state, small_library, energy_edges, dt_s=11.0), rtol=1e-10)
+    state.cloud.temperature_K *= 1.5
+    _assert_same_step(response.evaluate(state, dt_s=11.0),
+                      compute_cascade_step(state, small_library, energy_edges, dt_s=11.0), rtol=1e-10)
+    assert (response.n_refresh, response.n_reuse) == (3, 2)
+
+    response.invalidate()
+    response.evaluate(state, dt_s=11.0)
+    assert response.n_refresh == 4
+
+
+@pytest.mark.parametrize("kind", CascadeExecutor.KINDS)
+def test_executor_matches_serial_pass(small_library, make_model_state, energy_edges, kind):
+    state = make_model_state("A")
+    p = state.cascade.get_spectrum("p")
+    for projectile in ("d", "4He"):
+        state.cascade.set_spectrum(ProjectileSpectrum(projectile, p.energy_MeV, p.values[::-1] * 1e-2))
+    serial = compute_cascade_step(state, small_library, energy_edges, dt_s=4.0)
+    for projectile in ("p", "d", "4He"):
+        assert serial.diagnostics["projectiles"][projectile]["n_reactions"] > 0
+
+    with CascadeExecutor(kind, max_workers=2, reaction_library=small_library) as executor:
+        for _ in range(2):
+            result = compute_cascade_step(state, small_library, energy_edges, dt_s=4.0, executor=executor)
+            # Contributions are reduced in projectile order: bitwise equal.
+            np.testing.assert_array_equal(result.dYdt_cloud, serial.dYdt_cloud)
+            assert result.injected_spectra.keys() == serial.injected_spectra.keys()
+            for species_name, spectrum in serial.injected_spectra.items():
+                np.testing.assert_array_equal(result.injected_spectra[species_name], spectrum)
+
+    if kind != "serial":
+        with pytest.raises(RuntimeError):
+            compute_cascade_step(state, small_library, energy_edges, dt_s=4.0, executor=executor)
+
+
+def test_executor_rejects_bad_arguments(small_library):
+    with pytest.raises(ValueError):
+        CascadeExecutor("fork")
+    with pytest.raises(ValueError):
+        CascadeExecutor("thread", max_workers=0)
+    with pytest.raises(ValueError):
+        CascadeExecutor("process")
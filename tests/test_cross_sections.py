@@ -0,0 +1,105 @@
+"""
+Exact bin-averaged cross sections (PiecewiseCrossSection) against adaptive
+quadrature of the pointwise interpolation, and the library's cached
+per-projectile sigma matrices against the per-reaction bin averages.
+"""
+
+import numpy as np
+import pytest
+from scipy.integrate import quad
+
+from reactions import AggregatedCrossSection, CrossSectionTable
+
+
+def _random_table(rng, n, *, floor=0.0, inverse_e=True, high_only=True):
+    energy = np.sort(rng.uniform(1.0, 200.0, n))
+    sigma = rng.uniform(-5.0, 50.0, n)
+    return CrossSectionTable(
+        energy_mev=energy,
+        sigma_mb=sigma,
+        use_inverse_e_extrapolation=inverse_e,
+        inverse_e_high_only=high_only,
+        floor_sigma_mb=floor,
+    )
+
+
+def _break_points(table):
+    """
+    Tabulated energies plus the points where the interpolant meets the floor,
+    so quad() is never asked to integrate across an unseen kink.
+    """
+    E, s = table.energy_mev, table.sigma_mb - table.floor_sigma_mb
+    cross = np.flatnonzero(s[:-1] * s[1:] < 0.0)
+    roots = E[cross] - s[cross] * (E[cross + 1] - E[cross]) / (s[cross + 1] - s[cross])
+    return np.union1d(E, roots)
+
+
+def _quad_bin_average(sigma, edges, knots, threshold=None):
+    out = np.empty(len(edges) - 1)
+    for b, (lo, hi) in enumerate(zip(edges[:-1], edges[1:])):
+        a = lo if threshold is None else min(max(threshold, lo), hi)
+        inside = knots[(knots > a) & (knots < hi)]
+        val, _ = quad(
+            lambda e: float(sigma(e)), a, hi,
+            points=inside if len(inside) else None, limit=500, epsabs=1e-12, epsrel=1e-12,
+        )
+        out[b] = val / (hi - lo)
+    return out
+
+
+EDGES = np.concatenate(([0.2, 0.7], np.geomspace(1.0, 1000.0, 30)))
+
+
+@pytest.mark.parametrize("floor", [0.0, 3.0])
+@pytest.mark.parametrize("inverse_e, high_only", [(True, True), (True, False), (False, True)])
+def test_table_bin_average_matches_quadrature(floor, inverse_e, high_only):
+    rng = np.random.default_rng(19)
+    table = _random_table(rng, 12, floor=floor, inverse_e=inverse_e, high_only=high_only)
+
+    exact = table.average_sigma_on_bins(EDGES)
+    reference = _quad_bin_average(table.sigma_interpolate, EDGES, _break_points(table))
+
+    np.testing.assert_allclose(exact, reference, rtol=1e-9, atol=1e-10)
+
+
+def test_threshold_bin_is_integrated_over_its_open_part():
+    rng = np.random.default_rng(7)
+    table = _random_table(rng, 8, floor=0.5)
+    threshold = 0.5 * (EDGES[10] + EDGES[11])
+
+    exact = table.average_sigma_on_bins(EDGES, threshold_mev=threshold)
+    reference = _quad_bin_average(table.sigma_interpolate, EDGES, _break_points(table), threshold)
+
+    np.testing.assert_allclose(exact, reference, rtol=1e-9, atol=1e-10)
+    assert np.all(exact[:10] == 0.0)
+
+
+@pytest.mark.parametrize("combine_mode", ["average", "first"])
+def test_merged_tables_match_per_table_average(combine_mode):
+    rng = np.random.default_rng(3)
+    tables = [_random_table(rng, n, floor=1.0) for n in (5, 9, 14)]
+    merged = AggregatedCrossSection(tables=tables, combine_mode=combine_mode, merge_tables=True)
+    separate = AggregatedCrossSection(tables=tables, combine_mode=combine_mode, merge_tables=False)
+
+    np.testing.assert_allclose(
+        merged.average_sigma_on_bins(EDGES), separate.average_sigma_on_bins(EDGES),
+        rtol=1e-12, atol=1e-12,
+    )
+
+    probe = np.geomspace(0.1, 2000.0, 400)
+    np.testing.assert_allclose(
+        merged.sigma_interpolate(probe), separate.sigma_interpolate(probe), rtol=1e-12, atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("projectile", ["p", "d", "4He"])
+def test_library_sigma_matrix_matches_per_reaction_averages(small_library, projectile):
+    edges = np.linspace(2.5, 402.5, 81)
+    sigma = small_library.sigma_matrix_cm2(projectile=projectile, energy_edges_mev=edges)
+    reference = np.vstack([
+        rxn.sigma_bin_average_mb(edges) for rxn in small_library.by_projectile(projectile)
+    ]) * 1.0e-27  # mb -> cm^2
+
+    np.testing.assert_array_equal(sigma, reference)
+    assert not sigma.flags.writeable
+    assert small_library.sigma_matrix_cm2(projectile=projectile, energy_edges_mev=edges.copy()) is sigma
@@ -0,0 +1,77 @@
+"""
+Conservative rebinning (grids.rebin_overlap_matrix / grids.rebin).
+"""
+
+import numpy as np
+import pytest
+
+from grids import energy_edges_key, make_linear_energy_grid, rebin, rebin_overlap_matrix
+
+
+def _brute_force_rebin(values, source, target, spacing, n_sub=20000):
+    """
+    Spread each source bin over many equal sub-bins (in E or ln E) and drop
+    every sub-bin into the target bin holding its centre.
+    """
+    out = np.zeros(len(target) - 1)
+    for value, lo, hi in zip(values, source[:-1], source[1:]):
+        if spacing == "log":
+            centres = np.exp(np.log(lo) + (np.arange(n_sub) + 0.5) * (np.log(hi) - np.log(lo)) / n_sub)
+        else:
+            centres = lo + (np.arange(n_sub) + 0.5) * (hi - lo) / n_sub
+        b = np.clip(np.searchsorted(target, centres, side="right") - 1, 0, len(out) - 1)
+        np.add.at(out, b, value / n_sub)
+    return out
+
+
+@pytest.mark.parametrize("spacing", ["linear", "log"])
+def test_rebin_matches_brute_force_and_conserves(spacing):
+    rng = np.random.default_rng(25)
+    source = np.sort(rng.uniform(1.0, 300.0, 15))
+    target = np.geomspace(0.5, 500.0, 23)
+    values = rng.uniform(0.0, 1.0, len(source) - 1)
+
+    out = rebin(values, source, target, spacing=spacing)
+    np.testing.assert_allclose(out, _brute_force_rebin(values, source, target, spacing), atol=1e-4)
+    assert out.sum() == pytest.approx(values.sum(), rel=1e-13)
+
+
+def test_identity_and_read_only_cache():
+    grid = make_linear_energy_grid(2.5, 402.5, 80)
+    R = rebin_overlap_matrix(grid, grid.edges.copy())
+    np.testing.assert_array_equal(R, np.eye(grid.n_bins))
+    assert not R.flags.writeable
+    assert rebin_overlap_matrix(grid, grid) is R
+    assert energy_edges_key(grid.edges) == energy_edges_key(grid.edges.copy())
+
+
+def test_log_and_linear_split_of_one_bin():
+    source = np.array([1.0, 100.0])
+    target = np.array([1.0, 10.0, 100.0])
+    np.testing.assert_allclose(rebin_overlap_matrix(source, target, spacing="log"), [[0.5, 0.5]])
+    np.testing.assert_allclose(rebin_overlap_matrix(source, target), [[9.0 / 99.0, 90.0 / 99.0]])
+
+
+def test_outside_clip_and_drop():
+    # FRESCO-style product bins starting at 0, onto a narrower run grid.
+    source = np.arange(0.0, 60.0, 10.0)
+    target = np.array([15.0, 25.0, 35.0])
+    values = np.ones(len(source) - 1)
+
+    clipped = rebin(values, source, target, outside="clip")
+    np.testing.assert_allclose(clipped, [2.5, 2.5])
+    assert clipped.sum() == pytest.approx(values.sum())
+    np.testing.assert_allclose(rebin(values, source, target, outside="drop"), [1.0, 1.0])
+
+    with pytest.raises(ValueError):
+        rebin_overlap_matrix(source, target, spacing="log")
+
+
+def test_rebin_along_axis():
+    rng = np.random.default_rng(4)
+    source = np.linspace(0.0, 10.0, 6)
+    target = np.linspace(0.0, 10.0, 3)
+    values = rng.uniform(size=(3, 5, 2))
+    out = rebin(values, source, target, axis=1)
+    assert out.shape == (3, 2, 2)
+    np.testing.assert_allclose(out.sum(axis=1), values.sum(axis=1), rtol=1e-14)
@@ -0,0 +1,119 @@
+"""
+ReactionLibrary.from_directories(): a library loaded from the npz/JSON
+cache, libraries parsed by thread and process pools, and a library with
+pre-merged datasets, against a fresh serial scan of data/CrossSections/.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from reactions import ReactionLibrary, TabulatedProductDistributionModel
+
+ROOT = Path(__file__).resolve().parents[1]
+
+OPTIONS = dict(
+    base_dir=ROOT,
+    projectile_species=["p", "4He"],
+    include_group1=True,
+    group1_tabulated_only=True,
+)
+
+
+@pytest.fixture(scope="module")
+def fresh_library():
+    logging.getLogger("reactions").setLevel(logging.ERROR)
+    return ReactionLibrary.from_directories(**OPTIONS)
+
+
+def _assert_same_library(lib, ref, edges):
+    assert [rxn.name() for rxn in lib.reactions] == [rxn.name() for rxn in ref.reactions]
+    assert lib.species_registry.as_list() == ref.species_registry.as_list()
+    for rxn, ref_rxn in zip(lib.reactions, ref.reactions):
+        assert type(rxn.product_distribution_model) is type(ref_rxn.product_distribution_model)
+        assert rxn.allow_nonthermal_descendants == ref_rxn.allow_nonthermal_descendants
+        assert rxn.threshold_mev == ref_rxn.threshold_mev
+        assert len(rxn.cross_section.tables) == len(ref_rxn.cross_section.tables)
+        for tbl, ref_tbl in zip(rxn.cross_section.tables, ref_rxn.cross_section.tables):
+            np.testing.assert_array_equal(tbl.energy_mev, ref_tbl.energy_mev)
+            np.testing.assert_array_equal(tbl.sigma_mb, ref_tbl.sigma_mb)
+            assert tbl.source_file == ref_tbl.source_file
+
+    for projectile in ("p", "4He"):
+        np.testing.assert_array_equal(
+            lib.sigma_matrix_cm2(projectile=projectile, energy_edges_mev=edges),
+            ref.sigma_matrix_cm2(projectile=projectile, energy_edges_mev=edges),
+        )
+        order, tau = lib.product_tau_tensor(projectile=projectile, energy_edges_mev=edges)
+        ref_order, ref_tau = ref.product_tau_tensor(projectile=projectile, energy_edges_mev=edges)
+        assert order == ref_order
+        np.testing.assert_array_equal(tau, ref_tau)
+
+
+def test_cache_round_trip_matches_fresh_scan(fresh_library, energy_edges, tmp_path, monkeypatch):
+    assert any(isinstance(rxn.product_distribution_model, TabulatedProductDistributionModel)
+               for rxn in fresh_library.reactions)
+    built = ReactionLibrary.from_directories(**OPTIONS, cache_dir=tmp_path)
+    (index_path,) = tmp_path.glob("reaction_library_*.json")
+    assert index_path.with_suffix(".npz").exists()
+    _assert_same_library(built, fresh_library, energy_edges)
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("a valid cache entry must not rescan the CSV files")
+
+    with monkeypatch.context() as m:
+        m.setattr(ReactionLibrary, "_scan_directories", classmethod(no_scan))
+        cached = ReactionLibrary.from_directories(**OPTIONS, cache_dir=tmp_path)
+        with pytest.raises(AssertionError):
+            ReactionLibrary.from_directories(**OPTIONS, cache_dir=tmp_path, rebuild_cache=True)
+        with pytest.raises(AssertionError):   # other options, other key
+            ReactionLibrary.from_directories(**OPTIONS, cache_dir=tmp_path, merge_tables=True)
+    _assert_same_library(cached, fresh_library, energy_edges)
+
+    # A damaged index is ignored and rewritten.
+    index_path.write_text(index_path.read_text()[:100])
+    rebuilt = ReactionLibrary.from_directories(**OPTIONS, cache_dir=tmp_path)
+    _assert_same_library(rebuilt, fresh_library, energy_edges)
+    assert json.loads(index_path.read_text())["key"] in index_path.name
+
+
+@pytest.mark.parametrize("load_executor", ["thread", "process"])
+def test_pooled_load_matches_serial(fresh_library, energy_edges, caplog, load_executor):
+    caplog.set_level(logging.INFO, logger="reactions")
+    ReactionLibrary.from_directories(**OPTIONS)
+    serial_log = [(r.levelno, r.getMessage()) for r in caplog.records]
+    assert serial_log
+    caplog.clear()
+
+    lib = ReactionLibrary.from_directories(**OPTIONS, load_executor=load_executor, load_workers=3)
+    assert [(r.levelno, r.getMessage()) for r in caplog.records] == serial_log
+    _assert_same_library(lib, fresh_library, energy_edges)
+
+
+def test_unknown_load_executor_is_rejected():
+    with pytest.raises(ValueError):
+        ReactionLibrary.from_directories(**OPTIONS, load_executor="fork")
+
+
+@pytest.mark.parametrize("combine_mode", ["average", "first"])
+def test_merged_library_matches_per_dataset_combination(energy_edges, combine_mode):
+    separate = ReactionLibrary.from_directories(**OPTIONS, combine_mode=combine_mode)
+    merged = ReactionLibrary.from_directories(**OPTIONS, combine_mode=combine_mode, merge_tables=True)
+    assert any(len(rxn.cross_section.tables) > 1 for rxn in separate.reactions)
+    assert all(rxn.cross_section.merge_tables for rxn in merged.reactions)
+
+    probe = np.geomspace(0.5, 1000.0, 300)
+    for projectile in ("p", "4He"):
+        np.testing.assert_allclose(
+            merged.sigma_matrix_cm2(projectile=projectile, energy_edges_mev=energy_edges),
+            separate.sigma_matrix_cm2(projectile=projectile, energy_edges_mev=energy_edges),
+            rtol=1e-12, atol=1e-40,
+        )
+        for rxn, ref in zip(merged.by_projectile(projectile), separate.by_projectile(projectile)):
+            np.testing.assert_allclose(
+                rxn.cross_section.sigma_interpolate(probe), ref.cross_section.sigma_interpolate(probe),
+                rtol=1e-12, atol=1e-12,
+            )
@@ -0,0 +1,91 @@
+"""
+ReactionNetwork.reaction_fluxes() on the compiled reactant arrays against the
+per-reaction loop it replaced.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+_REACTIONS_DIR = str(Path(__file__).resolve().parents[1] / "core" / "reactions")
+if _REACTIONS_DIR not in sys.path:
+    sys.path.insert(0, _REACTIONS_DIR)
+
+from network import ReactionNetwork
+from reaction import Reaction
+
+N_A = 6.02214076e23
+
+
+def _loop_fluxes(network, state):
+    """
+    The per-reaction loop reaction_fluxes() replaced.
+    """
+    R = np.zeros(network.M)
+    for r, rxn in enumerate(network.reactions):
+        lam = rxn.rate(state)
+        abundance_factor = 1.0
+        for i, nu in rxn.reactants:
+            abundance_factor *= state.Y[i] ** nu
+        n_reactants = sum(nu for _, nu in rxn.reactants)
+        if n_reactants == 1:
+            density_factor = 1.0
+        elif n_reactants == 2:
+            density_factor = state.rho * N_A
+        else:
+            raise NotImplementedError("Reactions with more than 2 reactants not yet supported.")
+        R[r] = density_factor * lam * abundance_factor
+    return R
+
+
+def _rate(k, power):
+    return lambda state: k * (state.T9 ** power)
+
+
+def _network(batch=False):
+    # p, d, 3He, 4He, 7Be, 7Li
+    reactions = [
+        Reaction([(4, 1)], [(5, 1)], _rate(1.3e-7, 0.0), "7Be decay"),          # 1-body
+        Reaction([(0, 1), (1, 1)], [(2, 1)], _rate(2.2e-3, 1.5), "d(p,g)3He"),  # 2-body
+        Reaction([(2, 1), (3, 1)], [(4, 1)], _rate(4.1e-6, 2.0), "3He(a,g)7Be"),
+        Reaction([(2, 1), (2, 1)], [(3, 1), (0, 2)], _rate(5.0e-2, 0.7), "3He(3He,2p)4He"),  # nu = 2
+        Reaction([(1, 2)], [(3, 1)], _rate(3.0e-9, 1.0), "d(d,g)4He"),          # nu = 2, single entry
+    ]
+
+    def batch_rates(state):
+        return np.array([rxn.rate(state) for rxn in reactions])
+
+    isotopes = ["p", "d", "3He", "4He", "7Be", "7Li"]
+    return ReactionNetwork(isotopes, reactions, batch_rate_func=batch_rates if batch else None)
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_reaction_fluxes_match_loop(batch):
+    network = _network(batch)
+    assert network.reactions[3].reactants == [(2, 2)]
+
+    rng = np.random.default_rng(10)
+    for _ in range(5):
+        state = SimpleNamespace(
+            Y=rng.uniform(0.0, 0.5, network.N),
+            rho=10.0 ** rng.uniform(-2.0, 4.0),
+            T9=rng.uniform(0.1, 3.0),
+        )
+        state.Y[rng.integers(network.N)] = 0.0
+
+        ref = _loop_fluxes(network, state)
+        np.testing.assert_allclose(network.reaction_fluxes(state), ref, rtol=1e-14, atol=0.0)
+        np.testing.assert_allclose(network.change_in_abund(state), network.S @ ref, rtol=1e-12, atol=0.0)
+
+
+def test_more_than_two_bodies_is_rejected():
+    network = ReactionNetwork(
+        ["p", "4He", "12C"],
+        [Reaction([(1, 3)], [(2, 1)], _rate(1.0, 0.0), "triple-alpha")],
+    )
+    state = SimpleNamespace(Y=np.ones(3), rho=1.0, T9=1.0)
+    with pytest.raises(NotImplementedError):
+        network.reaction_fluxes(state)
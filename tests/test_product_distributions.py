@@ -0,0 +1,107 @@
+"""
+TabulatedProductDistributionModel against the FRESCO E_bins files it is read
+from: rows at and between the tabulated projectile energies, on the native
+FRESCO binning and rebinned onto the run grid, with and without the
+memory-mapped cache.
+"""
+
+import csv
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from reactions import TabulatedProductDistributionModel, canonical_species_name
+
+ROOT = Path(__file__).resolve().parents[1]
+RUNS = ROOT / "fresco_code" / "runs"
+
+_NAME = re.compile(r"_(\d+(?:\.\d+)?)MeV_\d+MeV_([A-Za-z0-9]+)_Ebins\.csv$")
+_FRESCO_NAMES = {"he3": "3He", "he4": "4He", "li7": "7Li", "be7": "7Be"}
+
+
+def _read_raw(e_bins_dir):
+    """
+    {product: {projectile energy: (edges, eta)}} straight from the CSV files.
+    """
+    raw = {}
+    for path in sorted(e_bins_dir.glob("*_Ebins.csv")):
+        energy, token = _NAME.search(path.name).groups()
+        with path.open() as f:
+            rows = [[float(v) for v in row] for row in list(csv.reader(f))[1:]]
+        edges = np.array([r[0] for r in rows] + [rows[-1][1]])
+        eta = np.array([r[3] for r in rows])
+        product = canonical_species_name(_FRESCO_NAMES.get(token, token))
+        raw.setdefault(product, {})[float(energy)] = (edges, eta)
+    return raw
+
+
+def _rebin_loop(src_edges, dst_edges):
+    """
+    (n_src, n_dst) weights spreading each source bin uniformly over the
+    destination bins it overlaps; whatever falls outside the destination
+    grid goes to its end bins.
+    """
+    W = np.zeros((len(src_edges) - 1, len(dst_edges) - 1))
+    for j, (a, b) in enumerate(zip(src_edges[:-1], src_edges[1:])):
+        for k, (c, d) in enumerate(zip(dst_edges[:-1], dst_edges[1:])):
+            W[j, k] = max(0.0, min(b, d) - max(a, c)) / (b - a)
+        W[j, 0] += max(0.0, min(b, dst_edges[0]) - a) / (b - a)
+        W[j, -1] += max(0.0, b - max(a, dst_edges[-1])) / (b - a)
+    return W
+
+
+def _expected(table, energy, W):
+    """
+    Normalized distribution at `energy`: linear in the projectile energy
+    between tabulated rows (held at the ends), then rebinned with W; all-zero
+    rows go to the thermal bin.
+    """
+    energies = np.array(sorted(table))
+    E = min(max(energy, energies[0]), energies[-1])
+    hi = min(int(np.searchsorted(energies, E, side="right")), len(energies) - 1)
+    lo = max(hi - 1, 0)
+    t = 0.0 if hi == lo else (E - energies[lo]) / (energies[hi] - energies[lo])
+    out = ((1.0 - t) * table[energies[lo]][1] + t * table[energies[hi]][1]) @ W
+    if out.sum() > 0.0:
+        return out / out.sum()
+    out[:] = 0.0
+    out[0] = 1.0
+    return out
+
+
+@pytest.mark.parametrize("run", ["4He_4He_n_7Be", "p_d_pn_p", "p_4He_2p_dn"])
+@pytest.mark.parametrize("cached", [False, True])
+def test_distributions_match_e_bins_files(run, cached, energy_edges, tmp_path):
+    e_bins_dir = RUNS / run / "E_bins"
+    raw = _read_raw(e_bins_dir)
+    model = TabulatedProductDistributionModel.from_e_bins_dir(
+        e_bins_dir, cache_dir=tmp_path if cached else None,
+    )
+    assert sorted(model.eta) == sorted(raw)
+
+    native_edges = next(iter(next(iter(raw.values())).values()))[0]
+    grids = [(edges, _rebin_loop(native_edges, edges)) for edges in (native_edges, energy_edges)]
+    for product, table in raw.items():
+        energies = np.array(sorted(table))
+        queries = np.concatenate([
+            energies,
+            0.5 * (energies[:-1] + energies[1:]),
+            energies[:-1] + 0.3 * np.diff(energies),
+            [0.5 * energies[0], 2.0 * energies[-1]],
+        ])
+        for dst_edges, W in grids:
+            for energy in queries:
+                got = model.distribution(
+                    projectile_energy_mev=energy,
+                    product_species=product,
+                    product_energy_edges_mev=dst_edges,
+                )
+                np.testing.assert_allclose(got, _expected(table, energy, W), rtol=1e-10, atol=1e-14)
+
+    # A product without a table is thermalized.
+    thermal = model.distribution(
+        projectile_energy_mev=100.0, product_species="12C", product_energy_edges_mev=energy_edges,
+    )
+    assert thermal[0] == 1.0 and thermal[1:].sum() == 0.0
@@ -0,0 +1,87 @@
+"""
+build_survival_matrices() / build_survival_matrices_batch() and
+compute_contracted_yield() against the per-injection-bin reference
+build_survival_and_yield() and the full compute_discrete_yield() tensor.
+"""
+
+import numpy as np
+import pytest
+
+from survival import (
+    build_survival_and_yield,
+    build_survival_matrices,
+    build_survival_matrices_batch,
+    compute_contracted_yield,
+)
+
+N_BINS = 12
+N_RXN = 3
+N_PRODUCTS = 2
+
+
+def _medium(rng, scale):
+    edges = np.linspace(2.5, 2.5 + 5.0 * N_BINS, N_BINS + 1)
+    epsilon = rng.uniform(0.5, 2.0, N_BINS)
+    sigma = rng.uniform(0.0, 1.0, (N_RXN, N_BINS))
+    sigma[0, :3] = 0.0                       # a channel closed at low energy
+    densities = scale * rng.uniform(0.5, 1.5, N_RXN)
+    return epsilon, sigma, densities, edges
+
+
+def _tau(rng):
+    tau = rng.uniform(0.0, 1.0, (N_RXN, N_BINS, N_PRODUCTS, N_BINS))
+    return tau / tau.sum(axis=-1, keepdims=True)
+
+
+@pytest.mark.parametrize("scale", [1e-3, 2e-2])
+def test_survival_matrices_match_per_bin_reference(scale):
+    rng = np.random.default_rng(1)
+    epsilon, sigma, densities, edges = _medium(rng, scale)
+    tau = _tau(rng)
+    surv = build_survival_matrices(epsilon, sigma, densities, edges)
+
+    for n in range(N_BINS):
+        ref = build_survival_and_yield(epsilon, sigma, densities, tau, edges, initial_bin=n)
+        np.testing.assert_allclose(surv["S"][n], ref["S"], rtol=1e-12, atol=0.0)
+        np.testing.assert_allclose(surv["deltaS"][n], ref["deltaS"], rtol=1e-9, atol=1e-15)
+        np.testing.assert_allclose(surv["s_thermalized"][n], ref["s_thermalized"], rtol=1e-12)
+        np.testing.assert_allclose(surv["beta"], ref["beta"], rtol=1e-14, atol=0.0)
+
+        # Contracting the reference yield over projectile bins gives the
+        # events and product spectra of compute_contracted_yield().
+        events, spectra = compute_contracted_yield(tau, surv["beta"], surv["deltaS"][n])
+        y = ref["yield"]
+        np.testing.assert_allclose(spectra, y.sum(axis=1), rtol=1e-9, atol=1e-15)
+        # tau is normalized per product, so every product column sums to the events.
+        np.testing.assert_allclose(np.broadcast_to(events[:, None], (N_RXN, N_PRODUCTS)),
+                                   y.sum(axis=(1, 3)), rtol=1e-9, atol=1e-15)
+
+
+def test_spectrum_weighted_yield_matches_sum_over_injection_bins():
+    rng = np.random.default_rng(2)
+    epsilon, sigma, densities, edges = _medium(rng, 5e-3)
+    tau = _tau(rng)
+    amounts = rng.uniform(0.0, 1.0, N_BINS)
+    surv = build_survival_matrices(epsilon, sigma, densities, edges)
+
+    events, spectra = compute_contracted_yield(tau, surv["beta"], amounts @ surv["deltaS"])
+    ref = sum(
+        amounts[n] * build_survival_and_yield(epsilon, sigma, densities, tau, edges, initial_bin=n)["yield"]
+        for n in range(N_BINS)
+    )
+    np.testing.assert_allclose(spectra, ref.sum(axis=1), rtol=1e-9, atol=1e-15)
+    np.testing.assert_allclose(np.broadcast_to(events[:, None], (N_RXN, N_PRODUCTS)),
+                               ref.sum(axis=(1, 3)), rtol=1e-9, atol=1e-15)
+
+
+def test_batch_matches_per_cloud():
+    rng = np.random.default_rng(3)
+    _, sigma, _, edges = _medium(rng, 1.0)
+    epsilon = rng.uniform(0.5, 2.0, (4, N_BINS))
+    densities = 10.0 ** rng.uniform(-3.0, -1.0, (4, 1)) * rng.uniform(0.5, 1.5, (4, N_RXN))
+
+    batch = build_survival_matrices_batch(epsilon, sigma, densities, edges)
+    for b in range(4):
+        single = build_survival_matrices(epsilon[b], sigma, densities[b], edges)
+        for key in ("S", "deltaS", "beta", "s_thermalized"):
+            np.testing.assert_allclose(batch[key][b], single[key], rtol=1e-13, atol=0.0)
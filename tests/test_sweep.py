@@ -0,0 +1,89 @@
+"""
+run_sweep.py: grid expansion, dotted-path overrides, the config hash and the
+skip-if-cached bookkeeping of main().
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(ROOT / "scripts"))
+
+import run_sweep
+
+
+@pytest.fixture(scope="module")
+def base_configs():
+    return dict(zip(run_sweep._CONFIG_NAMES, run_sweep._load_configs(ROOT / "config")))
+
+
+def test_expand_grid_is_the_cartesian_product():
+    points = run_sweep.expand_grid({"jet.a": [1, 2, 3], "cloud.b": ["x", "y"]})
+    assert len(points) == 6
+    assert points[0] == {"jet.a": 1, "cloud.b": "x"}
+    assert {(p["jet.a"], p["cloud.b"]) for p in points} == {(a, b) for a in (1, 2, 3) for b in "xy"}
+
+    with pytest.raises(ValueError):
+        run_sweep.expand_grid({"grid.a": [1]})
+    with pytest.raises(ValueError):
+        run_sweep.expand_grid({"jet.a": []})
+
+
+def test_apply_point_sets_existing_paths_only(base_configs):
+    before = json.dumps(base_configs, sort_keys=True)
+    configs = run_sweep.apply_point(
+        base_configs, {"jet.spectrum.E_per_nucleon_MeV": 123.0, "cloud.density_cm3": 5.0e11},
+    )
+    assert configs["jet"]["spectrum"]["E_per_nucleon_MeV"] == 123.0
+    assert configs["cloud"]["density_cm3"] == 5.0e11
+    assert configs["run"] == base_configs["run"]
+    assert json.dumps(base_configs, sort_keys=True) == before   # base left untouched
+
+    for path in ("grid.density_cm3", "cloud", "cloud.densty_cm3", "jet.spectrum.E_per_nucleon_MeV.x"):
+        with pytest.raises(KeyError):
+            run_sweep.apply_point(base_configs, {path: 1.0})
+
+
+def test_config_hash_ignores_comments(base_configs):
+    key = run_sweep.config_hash(base_configs)
+    assert key == run_sweep.config_hash(run_sweep.apply_point(base_configs, {}))
+
+    commented = run_sweep.apply_point(base_configs, {})
+    commented["cloud"]["_note"] = "not a setting"
+    assert run_sweep.config_hash(commented) == key
+
+    changed = run_sweep.apply_point(base_configs, {"cloud.density_cm3": 2.0e12})
+    assert run_sweep.config_hash(changed) != key
+
+
+def test_main_skips_points_with_results(base_configs, tmp_path, monkeypatch):
+    parameters = {"cloud.density_cm3": [1.0e11, 1.0e12]}
+    sweep_file = tmp_path / "sweep.json"
+    sweep_file.write_text(json.dumps({"output_dir": str(tmp_path / "out"), "parameters": parameters}))
+
+    summaries = {}
+    for point in run_sweep.expand_grid(parameters):
+        key = run_sweep.config_hash(run_sweep.apply_point(base_configs, point))
+        summaries[key] = {"n_steps": len(summaries) + 1}
+        out_dir = tmp_path / "out" / key
+        out_dir.mkdir(parents=True)
+        (out_dir / "final_state.json").write_text(json.dumps({"solver": summaries[key]}))
+
+    def no_library(*args, **kwargs):
+        raise AssertionError("the reaction library is only loaded when a point has to run")
+
+    monkeypatch.setattr(run_sweep, "load_reaction_library", no_library)
+    monkeypatch.setattr(sys, "argv", [
+        "run_sweep.py", "--sweep", str(sweep_file), "--config", str(ROOT / "config" / "run.json"),
+    ])
+    run_sweep.main()
+
+    index = json.loads((tmp_path / "out" / "index.json").read_text())
+    assert [entry["parameters"] for entry in index] == run_sweep.expand_grid(parameters)
+    for entry in index:
+        assert entry["status"] == "cached"
+        assert entry["summary"] == summaries[entry["hash"]]